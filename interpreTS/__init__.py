@@ -5,6 +5,9 @@ Available imports:
     FeatureExtractor (from interpreTS.core.feature_extractor):
         A class responsible for extracting specified features from time series data.
         
+    FeatureStream (from interpreTS.core.feature_stream):
+        A class holding the state of a streaming feature extraction, fed point by point or in columnar batches.
+        
     Features (from interpreTS.utils.feature_loader):
         An enumeration or collection that defines available feature types for extraction.
          
@@ -45,6 +48,7 @@ Authors:
 """
 import sys
 import logging
+from importlib import metadata
 from packaging import version
 
 
@@ -73,17 +77,20 @@ required_libraries = {
     "pillow": "11.1.0"
 }
 
+# Versions are read from the installed package metadata, so the (often heavy) libraries
+# are not imported here; they are imported lazily by the features and modes that need them.
 for library, min_version in required_libraries.items():
     try:
-        module = __import__(library)
-        if min_version and version.parse(module.__version__) < version.parse(min_version):
-            logger.warning(f"{library} version must be >= {min_version}. Current version: {module.__version__}")
-    except ImportError:
+        installed_version = metadata.version(library)
+        if min_version and version.parse(installed_version) < version.parse(min_version):
+            logger.warning(f"{library} version must be >= {min_version}. Current version: {installed_version}")
+    except metadata.PackageNotFoundError:
         logger.warning(f"{library} is not installed. Please install it to use interpreTS.")
 
 
 # Available imports
 from .core.feature_extractor import FeatureExtractor
+from .core.feature_stream import FeatureStream
 from .utils.feature_loader import FeatureLoader, Features
 from .utils.data_validation import validate_time_series_data
 from .utils.data_manager import generate_feature_descriptions
@@ -92,6 +99,7 @@ __version__ = "0.5.0"
 
 __all__ = [
     "FeatureExtractor",
+    "FeatureStream",
     "Features",
     "FeatureLoader",
     "validate_time_series_data",
@@ -1,9 +1,12 @@
+import asyncio
 import pandas as pd
 import numpy as np
-from pandas.tseries.frequencies import to_offset
 from ..utils.feature_loader import Features
-from ..utils.data_manager import load_metadata, load_feature_functions, load_validation_requirements
+from ..utils.data_manager import load_metadata, load_feature_functions, load_batch_feature_functions, load_rolling_feature_functions, load_feature_dependencies, load_reference_statistics_functions, load_validation_requirements
 from ..utils.task_manager import TaskManager
+from ..utils.window_engine import GroupWindows
+from ..utils.file_chunks import ChunkWriter, read_chunks
+from .feature_stream import FeatureStream, complete_windows
 
 class FeatureExtractor:
     DEFAULT_FEATURES_SMALL = [
@@ -122,9 +125,14 @@ class FeatureExtractor:
 
         self.feature_functions = load_feature_functions()
         self.validation_requirements = load_validation_requirements()
+        self.batch_feature_functions = load_batch_feature_functions()
+        self.rolling_feature_functions = load_rolling_feature_functions()
+        self.feature_dependencies = load_feature_dependencies()
+        self.reference_statistics = {}
         self.task_manager = TaskManager(
             self.feature_functions, self.window_size, self.features, self.stride, 
-            self.feature_params, self.validation_requirements
+            self.feature_params, self.validation_requirements, self.batch_feature_functions,
+            self.rolling_feature_functions, self.feature_dependencies
         )
         self.task_manager._validate_parameters(self.features, self.feature_params, self.window_size, self.stride, self.id_column, self.sort_column)
         self.feature_metadata = load_metadata()
@@ -183,7 +191,7 @@ class FeatureExtractor:
             print(f"Warning: Only {len(features_df)} rows available in DataFrame.")
         return features_df.head(n)
             
-    def extract_features(self, data, progress_callback=None, mode='sequential', n_jobs=-1):
+    def extract_features(self, data, progress_callback=None, mode='sequential', n_jobs=-1, lazy=False):
         """
         Extract features from a time series dataset.
 
@@ -194,18 +202,23 @@ class FeatureExtractor:
         progress_callback : function, optional
             A function to report progress, which takes a single argument: progress percentage (0-100).
         mode : str, optional
-            The mode of processing. Can be 'parallel' for multi-threaded processing
+            The mode of processing. Can be 'parallel' for multi-threaded processing,
+            'shared-memory' for parallel processing of data and results placed in shared memory
+            (numeric features are returned as float64), 'dask' for processing with Dask,
             or 'sequential' for single-threaded processing with real-time progress reporting.
         n_jobs : int, optional
             The number of jobs (processes) to run in parallel. Default is -1 (use all available CPUs).
+        lazy : bool, optional
+            Only for mode='dask': whether to return a lazy Dask DataFrame of the features instead
+            of computing it (default is False).
 
         Returns
         -------
-        pd.DataFrame
+        pd.DataFrame or dask.dataframe.DataFrame
             A DataFrame containing calculated features for each window.
         """
-        if mode not in ['parallel', 'sequential', 'dask']:
-            raise ValueError(f"Invalid mode '{mode}'. Accepted values are: ['parallel', 'sequential']")
+        if mode not in ['parallel', 'shared-memory', 'sequential', 'dask']:
+            raise ValueError(f"Invalid mode '{mode}'. Accepted values are: ['parallel', 'shared-memory', 'sequential', 'dask']")
 
         if isinstance(data, pd.Series):
             data = data.to_frame(name='value')
@@ -232,17 +245,265 @@ class FeatureExtractor:
         self.validate_data_frequency(grouped_data)
 
         if mode == 'dask':
-            return self.task_manager._execute_dask(grouped_data, feature_columns)
+            return self.task_manager._execute_dask(grouped_data, feature_columns, lazy=lazy)
 
         tasks = self.task_manager._generate_tasks(grouped_data, feature_columns)
         total_steps = len(tasks)
 
         if mode == 'parallel':
             results = self.task_manager._execute_parallel(tasks, n_jobs, progress_callback, total_steps)
+        elif mode == 'shared-memory':
+            results = self.task_manager._execute_shared_memory(tasks, n_jobs, progress_callback, total_steps)
         else:
             results = self.task_manager._execute_sequential(tasks, progress_callback, total_steps)
 
         return pd.DataFrame(results)
+
+    def extract_features_from_files(self, paths, output=None, chunk_size=100_000, progress_callback=None):
+        """
+        Extract features from Parquet or CSV files larger than memory.
+
+        The files are read one chunk of rows at a time. The rows must be sorted by `id_column`
+        (if given) and in time order within each series, so that every series is a contiguous
+        run of rows grouped on the fly: the windows of the series ending in a chunk are
+        calculated as in `extract_features`, while the rows of the last series from the start
+        of its next window on (fewer than `window_size`) are carried over to the next chunk.
+        The features are appended to `output` as they are calculated, so peak memory is bounded
+        by the chunk size regardless of the size of the input.
+
+        Parameters
+        ----------
+        paths : str, path-like or list of str or path-like
+            The Parquet ('.parquet', '.pq') or CSV ('.csv') files to read, in order.
+        output : str or path-like, optional
+            The Parquet or CSV file to write the features to. If None (default), the features
+            are returned instead.
+        chunk_size : int, optional
+            Maximum number of rows read at once (default is 100000).
+        progress_callback : function, optional
+            A function to report progress, which takes a single argument: the total number of processed rows.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            The features of each window (as float64 where numeric) with the ID of its series,
+            or None if they are written to `output`.
+
+        Raises
+        ------
+        ValueError
+            If `window_size` or `stride` is not a number of samples, a file format is not
+            supported, or the rows are not sorted by `id_column`.
+        """
+        if not isinstance(self.window_size, (int, np.integer)) or not isinstance(self.stride, (int, np.integer)):
+            raise ValueError("Extraction from files requires a window_size and stride given as numbers of samples.")
+
+        columns = list(dict.fromkeys(col for col in (self.id_column, self.feature_column) if col)) if self.feature_column else None
+        feature_columns = [self.feature_column] if self.feature_column else None
+
+        def chunks():
+            nonlocal feature_columns
+            processed_rows = 0
+            for chunk in read_chunks(paths, columns, chunk_size):
+                if feature_columns is None:
+                    feature_columns = [col for col in chunk.columns if col not in {self.id_column, self.sort_column}]
+                yield chunk
+                processed_rows += len(chunk)
+                if progress_callback:
+                    progress_callback(processed_rows)
+
+        results = []
+        writer = ChunkWriter(output) if output is not None else None
+        try:
+            for series_id, group in self._file_groups(chunks()):
+                block = self.task_manager._process_group_windows(GroupWindows(group, feature_columns, self.window_size, self.stride))
+                for key in block.columns:
+                    if block[key].dtype == object or pd.api.types.is_bool_dtype(block[key]) or pd.api.types.is_integer_dtype(block[key]):
+                        try:
+                            block[key] = block[key].to_numpy(dtype=np.float64, na_value=np.nan)
+                        except (TypeError, ValueError):
+                            pass
+                if self.id_column:
+                    block[self.id_column] = series_id
+                if writer is not None:
+                    writer.write(block)
+                else:
+                    results.append(block)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is not None:
+            return None
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
+    def _file_groups(self, chunks):
+        """
+        Group the rows of chunks sorted by series on the fly into runs of complete windows.
+
+        Parameters
+        ----------
+        chunks : iterable of pd.DataFrame
+            The chunks of rows, sorted by `id_column` (if given).
+
+        Yields
+        ------
+        tuple
+            The ID of a series (None without `id_column`) and a run of its rows starting a
+            window and holding only complete windows. A series spanning several chunks is
+            yielded in several runs.
+
+        Raises
+        ------
+        ValueError
+            If the rows are not sorted by `id_column`.
+        """
+        # The last series seen: its rows from the start of its next window on, the number of
+        # its next rows to skip before that window (when the stride exceeds the window size)
+        # and whether it had any windows
+        carry = None
+        carried_id = None
+        skip = 0
+        started = False
+        finished = set()
+
+        def finish(series_id, length):
+            if series_id is not None:
+                finished.add(series_id)
+            if not started:
+                print(f"Warning: Window size ({self.window_size}) exceeds group length ({length}). Skipping group.")
+
+        for chunk in chunks:
+            data = chunk if carry is None else pd.concat([carry, chunk], ignore_index=True)
+            if self.id_column:
+                data = data[data[self.id_column].notna()]
+                ids = data[self.id_column].to_numpy()
+                bounds = np.concatenate(([0], np.flatnonzero(ids[1:] != ids[:-1]) + 1, [len(data)])) if len(data) else np.zeros(1, dtype=int)
+            else:
+                ids = None
+                bounds = np.array([0, len(data)])
+
+            for index in range(len(bounds) - 1):
+                start, stop = bounds[index], bounds[index + 1]
+                series_id = ids[start] if ids is not None else None
+                if carry is None or index > 0 or series_id != carried_id:
+                    # A new series begins
+                    if carry is not None and index == 0:
+                        finish(carried_id, len(carry))
+                    if series_id in finished:
+                        raise ValueError(f"The input must be sorted by '{self.id_column}': series {series_id!r} appears in several runs of rows.")
+                    skip, started = 0, False
+
+                dropped = min(skip, stop - start)
+                skip -= dropped
+                group = data.iloc[start + dropped:stop]
+                n_windows = (len(group) - self.window_size) // self.stride + 1 if len(group) >= self.window_size else 0
+
+                if index == len(bounds) - 2:
+                    # The last series may continue in the next chunk
+                    next_start = n_windows * self.stride
+                    carry, carried_id = group.iloc[next_start:], series_id
+                    skip += max(next_start - len(group), 0)
+                else:
+                    finish(series_id, len(group))
+                if n_windows > 0:
+                    started = True
+                    yield series_id, group.iloc[:(n_windows - 1) * self.stride + self.window_size]
+
+        if carry is not None:
+            finish(carried_id, len(carry))
+
+    def fit(self, training_data=None):
+        """
+        Compute the reference statistics of the training data once for features that compare
+        windows against it (e.g. deciles and outlier bounds).
+
+        The statistics replace `training_data` in `feature_params`, so every window is reduced to a
+        comparison against precomputed thresholds. The fitted extractor can be pickled and reused.
+
+        Parameters
+        ----------
+        training_data : pd.Series or np.ndarray, optional
+            Training data used by all reference features. If None, the `training_data` given in
+            `feature_params` for each feature is used.
+
+        Returns
+        -------
+        FeatureExtractor
+            The fitted extractor.
+
+        Raises
+        ------
+        ValueError
+            If no training data is available for a reference feature.
+        """
+        reference_statistics_functions = load_reference_statistics_functions()
+        feature_params = dict(self.feature_params)
+        self.reference_statistics = {}
+
+        for feature_name in self.features:
+            if feature_name not in reference_statistics_functions:
+                continue
+            params = dict(feature_params.get(feature_name, {}))
+            feature_training_data = params.pop('training_data', None)
+            if training_data is not None:
+                feature_training_data = training_data
+            if feature_training_data is None:
+                raise ValueError(f"Training data is required to fit feature '{feature_name}'.")
+
+            statistics = reference_statistics_functions[feature_name](feature_training_data)
+            self.reference_statistics[feature_name] = statistics
+            feature_params[feature_name] = {**params, **statistics}
+
+        self.feature_params = feature_params
+        self.task_manager.feature_params = feature_params
+        return self
+
+    def transform(self, data, progress_callback=None, mode='sequential', n_jobs=-1):
+        """
+        Extract features from a time series dataset using the fitted reference statistics.
+
+        Parameters
+        ----------
+        data : pd.DataFrame or pd.Series
+            The time series data for which features are to be extracted.
+        progress_callback : function, optional
+            A function to report progress, which takes a single argument: progress percentage (0-100).
+        mode : str, optional
+            The mode of processing ('sequential', 'parallel', 'shared-memory' or 'dask').
+        n_jobs : int, optional
+            The number of jobs (processes) to run in parallel. Default is -1 (use all available CPUs).
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame containing calculated features for each window.
+        """
+        return self.extract_features(data, progress_callback=progress_callback, mode=mode, n_jobs=n_jobs)
+
+    def fit_transform(self, data, training_data=None, progress_callback=None, mode='sequential', n_jobs=-1):
+        """
+        Fit the reference statistics and extract features from a time series dataset.
+
+        Parameters
+        ----------
+        data : pd.DataFrame or pd.Series
+            The time series data for which features are to be extracted.
+        training_data : pd.Series or np.ndarray, optional
+            Training data used by all reference features (see `fit`).
+        progress_callback : function, optional
+            A function to report progress, which takes a single argument: progress percentage (0-100).
+        mode : str, optional
+            The mode of processing ('sequential', 'parallel', 'shared-memory' or 'dask').
+        n_jobs : int, optional
+            The number of jobs (processes) to run in parallel. Default is -1 (use all available CPUs).
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame containing calculated features for each window.
+        """
+        return self.fit(training_data).transform(data, progress_callback=progress_callback, mode=mode, n_jobs=n_jobs)
     
     def group_data(self, data):
         """
@@ -262,91 +523,121 @@ class FeatureExtractor:
             return data.groupby(self.group_by)
         return [(None, data)]
     
-    def extract_features_stream(self, data_stream, progress_callback=None):
+    def extract_features_stream(self, data_stream, progress_callback=None, stream=None):
         """
         Extract features from a stream of time series data.
 
+        The points are pushed one at a time to a `FeatureStream`, which keeps the current window
+        of every series and updates the features incrementally where possible.
+
         Parameters
         ----------
         data_stream : iterable
             An iterable that yields incoming data points as dictionaries with keys corresponding to column names.
         progress_callback : function, optional
             A function to report progress, which takes a single argument: the total number of processed points.
+        stream : FeatureStream, optional
+            The stream to continue, for example one restored from a checkpoint with
+            `FeatureStream.restore`. If None (default), a new stream is started.
 
         Yields
         ------
         dict
             A dictionary containing the calculated features for the current window.
         """
-        if not self.feature_column or not self.id_column:
-            raise ValueError("Feature column and ID column must be specified for streaming mode.")
+        if stream is None:
+            stream = FeatureStream(self)
+        for new_point in data_stream:
+            features = stream.push(new_point)
+            if features is not None:
+                yield features
 
-        buffers = {}
-        total_points = 0
+            if progress_callback:
+                progress_callback(stream.total_points)
 
-        time_based_window = isinstance(self.window_size, str)
+    async def extract_features_astream(self, data_stream, progress_callback=None, executor=None, max_pending=1024, max_batch_size=256, stream=None):
+        """
+        Extract features from an asynchronous stream of time series data.
 
-        if time_based_window:
-            if self.sort_column is None:
-                raise ValueError("A 'sort_column' must be specified when using a time-based window.")
-            
-            data_stream = iter(data_stream)
-        
-            try:
-                # Check if sort_column is datetime-based
-                sample_point = next(data_stream)  # Get the first data point to check format
-                if not pd.to_datetime(sample_point[self.sort_column], errors='coerce'):
-                    raise ValueError(f"Column '{self.sort_column}' does not contain valid datetime values.")
-                # Put the sample back into the generator stream
-                data_stream = iter([sample_point] + list(data_stream))
-            except Exception as e:
-                raise ValueError(f"Error in validating time-based column: {e}")
+        The points are read from the async iterator by a background task into a bounded queue,
+        so a slow consumer pauses the producer (backpressure) once `max_pending` points wait.
+        The points queued at each event-loop tick (up to `max_batch_size`) are pushed to a
+        `FeatureStream` as one batch: the windows are updated on the event loop, which is cheap,
+        while the features of the emitted windows are calculated in `executor`, so the loop
+        is not blocked by the feature computation.
 
-            try:
-                window_offset = to_offset(self.window_size)
-            except ValueError:
-                raise ValueError(f"Invalid time-based window_size format: {self.window_size}. Supported formats are for example: '1s', '5min', '1h'.")
+        Parameters
+        ----------
+        data_stream : async iterable
+            An async iterable that yields incoming data points as dictionaries with keys
+            corresponding to column names.
+        progress_callback : function, optional
+            A function to report progress, which takes a single argument: the total number of processed points.
+        executor : concurrent.futures.Executor, optional
+            The thread or process pool calculating the features. If None, the default executor
+            of the event loop is used. A process pool receives the task manager with each batch.
+        max_pending : int, optional
+            Maximum number of points read ahead of the feature computation (default is 1024).
+        max_batch_size : int, optional
+            Maximum number of points pushed as one batch (default is 256).
+        stream : FeatureStream, optional
+            The stream to continue, for example one restored from a checkpoint with
+            `FeatureStream.restore`. If None (default), a new stream is started.
 
-        for new_point in data_stream:
-            total_points += 1
-            series_id = new_point[self.id_column]
-
-            if series_id not in buffers:
-                buffers[series_id] = []
-
-            buffers[series_id].append(new_point)
-
-            # Handle time-based windows
-            if time_based_window:
-                # Convert buffer to a DataFrame and check time range
-                buffer_df = pd.DataFrame(buffers[series_id])
-                if len(buffer_df) > 1:  # Ensure at least two points to calculate a range
-                    start_time = pd.to_datetime(buffer_df[self.sort_column].iloc[0])
-                    end_time = pd.to_datetime(buffer_df[self.sort_column].iloc[-1])
-                    if (end_time - start_time) >= window_offset:
-                        # Extract features for the current buffer
-                        feature_columns = [self.feature_column]
-                        features = self.task_manager._process_window(buffer_df, feature_columns)
-                        features[self.id_column] = series_id
-                        yield features
-                        buffers[series_id] = buffers[series_id][1:]  # Remove oldest point
+        Yields
+        ------
+        dict
+            A dictionary containing the calculated features for the current window.
 
-            # Handle numeric windows
-            else:
-                if len(buffers[series_id]) > self.window_size:
-                    buffers[series_id].pop(0)
+        Examples
+        --------
+        >>> async def consume(extractor, points):
+        ...     return [features async for features in extractor.extract_features_astream(points)]
+        """
+        if max_pending < 1 or max_batch_size < 1:
+            raise ValueError("max_pending and max_batch_size must be positive integers.")
 
-                if len(buffers[series_id]) == self.window_size:
-                    buffer_df = pd.DataFrame(buffers[series_id])
-                    feature_columns = [self.feature_column]
+        if stream is None:
+            stream = FeatureStream(self)
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=max_pending)
+        end_of_stream = object()
 
-                    features = self.task_manager._process_window(buffer_df, feature_columns)
-                    features[self.id_column] = series_id
-                    yield features
+        async def produce():
+            try:
+                async for new_point in data_stream:
+                    await queue.put(new_point)
+            finally:
+                await queue.put(end_of_stream)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            finished = False
+            while not finished:
+                batch = [await queue.get()]
+                while len(batch) < max_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                if batch[-1] is end_of_stream:
+                    batch.pop()
+                    finished = True
+
+                pending = [window for window in (stream._advance(new_point, copy_window=True) for new_point in batch) if window is not None]
+                if pending:
+                    results = await loop.run_in_executor(
+                        executor, complete_windows, self.task_manager, self.features, self.feature_column, self.id_column, pending
+                    )
+                    for features in results:
+                        yield features
+
+                if progress_callback and batch:
+                    progress_callback(stream.total_points)
+
+            # Propagate errors raised by the async iterator
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
 
-            if progress_callback:
-                progress_callback(total_points)
-            
     def group_features_by_interpretability(self):
         """
         Group features by their interpretability levels.
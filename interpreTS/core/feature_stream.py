@@ -0,0 +1,691 @@
+import contextlib
+import copy
+import io
+import os
+import zipfile
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from ..utils.autocorrelation import SlidingAutocorrelation
+from ..utils.data_manager import load_incremental_feature_states
+from ..utils.feature_loader import Features
+from ..utils.ring_buffer import RingBuffer
+from ..utils.window_context import WindowContext
+from ..utils.window_engine import GroupWindows, sliding_windows
+
+# Series emitting at least this many windows in a batch are processed on their own with
+# rolling kernels; the windows of the other series are stacked and processed together
+STACKED_WINDOWS_LIMIT = 32
+
+# Version of the layout of the snapshots written by `FeatureStream.checkpoint`
+SNAPSHOT_VERSION = 1
+
+
+class FeatureStream:
+    """
+    State of a streaming feature extraction: the current window of every series.
+
+    Data points are pushed one at a time and the features of the window of their series are
+    returned as soon as the window is complete, so the stream can be fed from any source
+    (see `FeatureExtractor.extract_features_stream` and `FeatureExtractor.extract_features_astream`).
+
+    For numeric windows, the values of each series are kept in a preallocated `RingBuffer`
+    and the current window is passed to the features as a zero-copy view, without building
+    a DataFrame per point. The autocorrelation function used by stability and seasonality
+    strength is maintained incrementally per series with a `SlidingAutocorrelation`
+    accumulator, so it costs O(max_lag) per point instead of a correlation of each window.
+    Features with an incremental state (see `load_incremental_feature_states`) are updated
+    with each value entering and leaving the window and read in O(1); the others, and
+    features that do not handle NaN values when the window contains them, are calculated
+    from the window.
+
+    For time-based windows, the timestamp in `sort_column` is parsed once per point to int64
+    nanoseconds and each series keeps the points of the window (t - window_size, t] ending
+    at its latest timestamp t in a deque, from which all expired points are evicted. Windows
+    are emitted once the series spans a whole window, for every point or, if `stride` is a
+    time-based string, at most once per stride. Points of each series are expected in time
+    order.
+
+    The state of all series can be saved to a compact binary snapshot with `checkpoint` and
+    restored with `restore`, so a restarted worker resumes emitting features without a
+    window of warm-up per series.
+
+    Attributes
+    ----------
+    extractor : FeatureExtractor
+        The extractor defining the features, their parameters and the columns.
+    total_points : int
+        Number of data points pushed so far.
+    """
+
+    def __init__(self, extractor):
+        """
+        Initialize an empty stream.
+
+        Parameters
+        ----------
+        extractor : FeatureExtractor
+            The extractor defining the features, their parameters and the columns.
+
+        Raises
+        ------
+        ValueError
+            If the feature or ID column is missing, or the time-based window is invalid.
+        """
+        if not extractor.feature_column or not extractor.id_column:
+            raise ValueError("Feature column and ID column must be specified for streaming mode.")
+
+        self.extractor = extractor
+        self.total_points = 0
+        self.window_size = extractor.window_size
+        self.time_based_window = isinstance(self.window_size, str)
+        self.numeric_window = isinstance(self.window_size, (int, np.integer))
+
+        self._buffers = {}
+        self._acf_lags = self._stream_acf_lags()
+        self._autocorrelations = {}
+        self._incremental_states = self._stream_incremental_states()
+        self._states = {}
+        self._missing = {}
+        self._received = {}
+        self._restored = {}
+
+        if self.time_based_window:
+            if extractor.sort_column is None:
+                raise ValueError("A 'sort_column' must be specified when using a time-based window.")
+
+            try:
+                self._window_ns = pd.Timedelta(to_offset(self.window_size)).value
+            except ValueError:
+                raise ValueError(f"Invalid time-based window_size format: {self.window_size}. Supported formats are for example: '1s', '5min', '1h'.")
+
+            self._stride_ns = None
+            if isinstance(extractor.stride, str):
+                try:
+                    self._stride_ns = pd.Timedelta(to_offset(extractor.stride)).value
+                except ValueError:
+                    raise ValueError(f"Invalid time-based stride format: {extractor.stride}. Supported formats are for example: '1s', '5min', '1h'.")
+
+            self._first_timestamps = {}
+            self._next_emissions = {}
+
+    def push(self, point):
+        """
+        Add a data point to the window of its series.
+
+        Parameters
+        ----------
+        point : dict
+            The data point, with keys corresponding to column names.
+
+        Returns
+        -------
+        dict or None
+            The features of the window of the series of the point, together with the series ID,
+            or None if no window is emitted for this point.
+        """
+        pending = self._advance(point)
+        if pending is None:
+            return None
+        return complete_window(self.extractor.task_manager, self.extractor.features, self.extractor.feature_column, self.extractor.id_column, pending)
+
+    def push_batch(self, data):
+        """
+        Add a columnar chunk of data points, possibly of many series, at once.
+
+        The rows are grouped by series ID and the new values of every affected series are
+        appended to its window in bulk. For numeric windows, the windows emitted by each series
+        are taken as views over its previous window followed by its new values: series with
+        many new windows are processed with rolling and batch kernels on their own, while the
+        few windows of the other series are stacked and processed together with batch kernels,
+        so the per-point Python overhead of `push` is avoided. The buffers, autocorrelations
+        and incremental states are then rebuilt from the resulting windows.
+
+        Parameters
+        ----------
+        data : pd.DataFrame or dict of array-like
+            The chunk, with the ID and feature columns (and `sort_column` for time-based
+            windows). Rows of each series are expected in time order.
+
+        Returns
+        -------
+        pd.DataFrame
+            The features of the emitted windows with the series ID, one row per window, in the
+            order of the rows emitting them, as `push` would return them one by one.
+        """
+        extractor = self.extractor
+        keys = [f"{name}_{extractor.feature_column}" for name in extractor.features]
+        ids = np.asarray(data[extractor.id_column])
+        values = pd.to_numeric(pd.Series(np.asarray(data[extractor.feature_column]), copy=False), errors="coerce").to_numpy(dtype=np.float64)
+        if self.time_based_window:
+            try:
+                timestamps = pd.to_datetime(pd.Series(np.asarray(data[extractor.sort_column]), copy=False)).to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Column '{extractor.sort_column}' does not contain valid datetime values.") from e
+            if np.any(timestamps == np.iinfo(np.int64).min):
+                raise ValueError(f"Column '{extractor.sort_column}' does not contain valid datetime values.")
+        self.total_points += len(ids)
+
+        # Group the rows by series, keeping the order of the rows of each series
+        codes, series_ids = pd.factorize(ids)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(series_ids)))))
+
+        blocks = []
+        positions = []
+        records = []
+        record_positions = []
+        stacked = []
+        stacked_ids = []
+        stacked_positions = []
+        for code, series_id in enumerate(series_ids):
+            rows = order[bounds[code]:bounds[code + 1]]
+            if self.time_based_window:
+                results, emitted = self._extend_time_window(series_id, timestamps[rows], values[rows])
+                records.extend(results)
+                record_positions.append(rows[emitted])
+            elif self.numeric_window:
+                segment, emitted = self._extend_numeric_window(series_id, values[rows])
+                if len(emitted) >= STACKED_WINDOWS_LIMIT:
+                    group_windows = GroupWindows(pd.DataFrame({extractor.feature_column: segment}), [extractor.feature_column], self.window_size, 1)
+                    block = extractor.task_manager._process_group_windows(group_windows)
+                    block[extractor.id_column] = series_id
+                    blocks.append(block)
+                    positions.append(rows[emitted])
+                elif len(emitted) > 0:
+                    stacked.append(sliding_windows(segment, self.window_size))
+                    stacked_ids.append(np.full(len(emitted), code))
+                    stacked_positions.append(rows[emitted])
+
+        if stacked:
+            windows = np.concatenate(stacked)[np.newaxis]
+            block = extractor.task_manager._process_group_windows(GroupWindows.from_windows(windows, [extractor.feature_column]))
+            block[extractor.id_column] = series_ids[np.concatenate(stacked_ids)]
+            blocks.append(block)
+            positions.extend(stacked_positions)
+
+        if records:
+            blocks.append(pd.DataFrame(records))
+            positions.append(np.concatenate(record_positions))
+
+        if not blocks:
+            return pd.DataFrame(columns=keys + [extractor.id_column])
+        frame = pd.concat(blocks, ignore_index=True)
+        return frame.iloc[np.argsort(np.concatenate(positions), kind="stable")].reset_index(drop=True)
+
+    def _extend_numeric_window(self, series_id, new_values):
+        """
+        Append the new values of a series to its window and rebuild its state.
+
+        Returns
+        -------
+        tuple
+            The segment of the series covering all emitted windows, and the positions among
+            the new values of the values emitting a window.
+        """
+        if series_id not in self._buffers:
+            self._create_numeric_series(series_id)
+
+        buffer = self._buffers[series_id]
+        previous = buffer.view()
+        combined = np.concatenate((previous, new_values))
+
+        # Windows ending at a new value, after the window ending at the last previous value
+        first_end = max(self.window_size - 1, len(previous))
+        segment = combined[first_end - self.window_size + 1:] if first_end < len(combined) else combined[:0]
+        emitted = np.arange(first_end - len(previous), len(new_values))
+
+        buffer.extend(new_values)
+        if self._acf_lags is not None:
+            self._autocorrelations[series_id].extend(new_values)
+        window = buffer.view()
+        for state in self._states[series_id].values():
+            state.reset(window)
+        self._missing[series_id] = int(np.isnan(window).sum())
+        self._received[series_id] += len(new_values)
+        return segment, emitted
+
+    def _extend_time_window(self, series_id, new_timestamps, new_values):
+        """
+        Append the new points of a series to its time-based window and evict expired points.
+
+        Returns
+        -------
+        tuple
+            The features of the emitted windows, and the positions among the new points of
+            the points emitting them.
+        """
+        if series_id not in self._buffers:
+            self._create_time_series(series_id, int(new_timestamps[0]))
+        previous_timestamps, previous_values = self._buffers[series_id]
+        timestamps = np.concatenate((np.fromiter(previous_timestamps, dtype=np.int64, count=len(previous_timestamps)), new_timestamps))
+        values = np.concatenate((np.fromiter(previous_values, dtype=np.float64, count=len(previous_values)), new_values))
+
+        # Each window holds the points of (timestamp - window_size, timestamp]
+        ends = np.arange(len(previous_timestamps), len(timestamps))
+        starts = np.searchsorted(timestamps, timestamps[ends] - self._window_ns, side="right")
+        covered = np.flatnonzero(timestamps[ends] - self._first_timestamps[series_id] >= self._window_ns)
+
+        extractor = self.extractor
+        results = []
+        emitted = []
+        for index in covered:
+            timestamp = timestamps[ends[index]]
+            if timestamp < self._next_emissions[series_id]:
+                continue
+            if self._stride_ns is not None:
+                self._next_emissions[series_id] = int(timestamp) + self._stride_ns
+            pending = (series_id, values[starts[index]:ends[index] + 1], {}, list(extractor.features), None)
+            results.append(complete_window(extractor.task_manager, extractor.features, extractor.feature_column, extractor.id_column, pending))
+            emitted.append(index)
+
+        self._buffers[series_id] = (deque(timestamps[starts[-1]:].tolist()), deque(values[starts[-1]:].tolist()))
+        return results, np.asarray(emitted, dtype=np.int64)
+
+    def checkpoint(self, file=None):
+        """
+        Save the state of all series to a compact binary snapshot.
+
+        The state of a series is fully determined by the values of its current window (and, for
+        time-based windows, their timestamps and the next emission time), so only these are
+        saved, concatenated across series into a few flat arrays in the NumPy `.npz` format.
+        The buffers, autocorrelations and incremental states are rebuilt from them by `restore`.
+
+        Parameters
+        ----------
+        file : str, path-like or file-like, optional
+            Where to write the snapshot. If None (default), the snapshot is returned as bytes.
+
+        Returns
+        -------
+        bytes or None
+            The snapshot, if `file` is None.
+        """
+        series_ids = []
+        windows = []
+        received = []
+        timestamps = []
+        first_timestamps = []
+        next_emissions = []
+        for series_id, buffer in self._buffers.items():
+            series_ids.append(series_id)
+            if self.time_based_window:
+                times, values = buffer
+                timestamps.append(np.fromiter(times, dtype=np.int64, count=len(times)))
+                windows.append(np.fromiter(values, dtype=np.float64, count=len(values)))
+                first_timestamps.append(self._first_timestamps[series_id])
+                next_emissions.append(self._next_emissions[series_id])
+            else:
+                windows.append(buffer.view())
+                received.append(self._received[series_id])
+        # Series restored but not pushed to since are saved as they were restored
+        for series_id, state in self._restored.items():
+            series_ids.append(series_id)
+            if self.time_based_window:
+                times, values, first_timestamp, next_emission = state
+                timestamps.append(times)
+                windows.append(values)
+                first_timestamps.append(first_timestamp)
+                next_emissions.append(next_emission)
+            else:
+                window, count = state
+                windows.append(window)
+                received.append(count)
+
+        arrays = {
+            "version": np.array(SNAPSHOT_VERSION),
+            "configuration": np.array(self._configuration()),
+            "total_points": np.array(self.total_points, dtype=np.int64),
+            "series_ids": _to_id_array(series_ids),
+            "lengths": np.array([len(window) for window in windows], dtype=np.int64),
+            "values": np.concatenate(windows) if windows else np.empty(0),
+        }
+        if self.time_based_window:
+            arrays["timestamps"] = np.concatenate(timestamps) if timestamps else np.empty(0, dtype=np.int64)
+            arrays["first_timestamps"] = np.array(first_timestamps, dtype=np.int64)
+            arrays["next_emissions"] = np.array(next_emissions, dtype=np.int64)
+        else:
+            arrays["received"] = np.array(received, dtype=np.int64)
+
+        if file is not None:
+            np.savez(file, **arrays)
+            return None
+        output = io.BytesIO()
+        np.savez(output, **arrays)
+        return output.getvalue()
+
+    @classmethod
+    def restore(cls, extractor, snapshot):
+        """
+        Create a stream from a snapshot saved by `checkpoint`.
+
+        The snapshot is only split into the windows of each series here; the state of a series
+        is rebuilt from its window when its next point is pushed, so restoring hundreds of
+        thousands of series is near-instant and idle series cost no rebuild at all.
+
+        Snapshots may contain pickled series IDs (when they are not all numbers or all strings),
+        so they should only be restored from trusted sources.
+
+        Parameters
+        ----------
+        extractor : FeatureExtractor
+            The extractor defining the features, their parameters and the columns. Its window
+            size, stride and features must be those of the checkpointed stream.
+        snapshot : bytes, str, path-like or file-like
+            The snapshot, or where to read it from.
+
+        Returns
+        -------
+        FeatureStream
+            The restored stream.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is not a stream snapshot, or was taken with a different window size,
+            stride or features.
+        """
+        stream = cls(extractor)
+        if isinstance(snapshot, (bytes, bytearray, memoryview)):
+            snapshot = io.BytesIO(snapshot)
+        try:
+            # Read the archive directly, so a file that is not one is never unpickled
+            with open(snapshot, "rb") if isinstance(snapshot, (str, os.PathLike)) else contextlib.nullcontext(snapshot) as file:
+                with np.lib.npyio.NpzFile(file, allow_pickle=True) as arrays:
+                    arrays = {name: arrays[name] for name in arrays.files}
+        except (ValueError, zipfile.BadZipFile) as e:
+            raise ValueError("Invalid stream snapshot.") from e
+        if "version" not in arrays or int(arrays["version"]) != SNAPSHOT_VERSION:
+            raise ValueError("Invalid stream snapshot.")
+        if str(arrays["configuration"]) != stream._configuration():
+            raise ValueError("The snapshot was taken with a different window size, stride or features.")
+
+        stream.total_points = int(arrays["total_points"])
+        series_ids = arrays["series_ids"].tolist()
+        offsets = np.cumsum(arrays["lengths"])[:-1]
+        windows = np.split(arrays["values"], offsets)
+        if stream.time_based_window:
+            timestamps = np.split(arrays["timestamps"], offsets)
+            stream._restored = dict(zip(series_ids, zip(
+                timestamps, windows, arrays["first_timestamps"].tolist(), arrays["next_emissions"].tolist()
+            )))
+        else:
+            stream._restored = dict(zip(series_ids, zip(windows, arrays["received"].tolist())))
+        return stream
+
+    def _configuration(self):
+        """
+        Describe the parameters a snapshot must be restored with.
+        """
+        return repr((str(self.window_size), str(self.extractor.stride), [str(name) for name in self.extractor.features]))
+
+    def _create_numeric_series(self, series_id):
+        """
+        Create the state of a series with a window of a fixed number of samples, either empty
+        or rebuilt from the window restored from a snapshot.
+        """
+        self._buffers[series_id] = buffer = RingBuffer(self.window_size)
+        if self._acf_lags is not None:
+            self._autocorrelations[series_id] = SlidingAutocorrelation(self.window_size, self._acf_lags)
+        self._states[series_id] = copy.deepcopy(self._incremental_states)
+        self._missing[series_id] = 0
+        self._received[series_id] = 0
+
+        if series_id in self._restored:
+            window, received = self._restored.pop(series_id)
+            buffer.extend(window)
+            if self._acf_lags is not None:
+                self._autocorrelations[series_id].extend(window)
+            for state in self._states[series_id].values():
+                state.reset(window)
+            self._missing[series_id] = int(np.isnan(window).sum())
+            self._received[series_id] = received
+
+    def _create_time_series(self, series_id, timestamp):
+        """
+        Create the state of a series with a time-based window, either starting at the
+        timestamp of its first point or restored from a snapshot.
+        """
+        if series_id in self._restored:
+            times, values, first_timestamp, next_emission = self._restored.pop(series_id)
+            self._buffers[series_id] = (deque(times.tolist()), deque(values.tolist()))
+            self._first_timestamps[series_id] = first_timestamp
+            self._next_emissions[series_id] = next_emission
+        else:
+            self._buffers[series_id] = (deque(), deque())
+            self._first_timestamps[series_id] = timestamp
+            self._next_emissions[series_id] = timestamp
+
+    def _advance(self, point, copy_window=False):
+        """
+        Update the window of the series of a data point without calculating its features.
+
+        Parameters
+        ----------
+        point : dict
+            The data point, with keys corresponding to column names.
+        copy_window : bool, optional
+            Whether to copy the window, so it can be processed after later points are pushed.
+
+        Returns
+        -------
+        tuple or None
+            The pending window `(series_id, window, incremental, remaining, contexts)` to be
+            completed with `complete_window`, or None if no window is emitted for this point.
+        """
+        self.total_points += 1
+        series_id = point[self.extractor.id_column]
+
+        if self.time_based_window:
+            return self._advance_time_window(series_id, point)
+        if self.numeric_window:
+            return self._advance_numeric_window(series_id, point, copy_window)
+        return None
+
+    def _advance_time_window(self, series_id, point):
+        """
+        Add a data point to a time-based window, evicting all expired points.
+        """
+        try:
+            timestamp = _to_nanoseconds(point[self.extractor.sort_column])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Column '{self.extractor.sort_column}' does not contain valid datetime values.") from e
+
+        if series_id not in self._buffers:
+            self._create_time_series(series_id, timestamp)
+        timestamps, values = self._buffers[series_id]
+        timestamps.append(timestamp)
+        values.append(_to_float(point[self.extractor.feature_column]))
+
+        # Evict every point that has left the window (timestamp - window_size, timestamp]
+        while timestamps[0] <= timestamp - self._window_ns:
+            timestamps.popleft()
+            values.popleft()
+
+        if timestamp - self._first_timestamps[series_id] < self._window_ns or timestamp < self._next_emissions[series_id]:
+            return None
+        if self._stride_ns is not None:
+            self._next_emissions[series_id] = timestamp + self._stride_ns
+
+        window = np.fromiter(values, dtype=np.float64, count=len(values))
+        return series_id, window, {}, list(self.extractor.features), None
+
+    def _advance_numeric_window(self, series_id, point, copy_window):
+        """
+        Add a data point to a window of a fixed number of samples and update its states.
+        """
+        if series_id not in self._buffers:
+            self._create_numeric_series(series_id)
+
+        buffer = self._buffers[series_id]
+        value = _to_float(point[self.extractor.feature_column])
+        evicted = buffer.append(value)
+        if self._acf_lags is not None:
+            self._autocorrelations[series_id].update(value)
+        for state in self._states[series_id].values():
+            state.update(value, evicted)
+        self._missing[series_id] += int(np.isnan(value)) - int(evicted is not None and np.isnan(evicted))
+        self._received[series_id] += 1
+
+        if not buffer.is_full:
+            return None
+        window = buffer.view()
+
+        # Rebuild the states exactly once per window length to bound rounding drift, and as
+        # soon as a state has lost accuracy (e.g. after a level shift)
+        periodic = self._received[series_id] % self.window_size == 0
+        for state in self._states[series_id].values():
+            if periodic or state.stale:
+                state.reset(window)
+
+        has_nan = self._missing[series_id] > 0
+        incremental = {
+            name: state.value() for name, state in self._states[series_id].items()
+            if not has_nan or state.handles_nan
+        }
+        remaining = [name for name in self.extractor.features if name not in incremental]
+        if not remaining:
+            return series_id, None, incremental, remaining, None
+
+        contexts = None
+        if self._acf_lags is not None:
+            context = WindowContext(window)
+            if not has_nan:
+                context.seed_acf(self._autocorrelations[series_id].acf(), self._acf_lags)
+            contexts = {self.extractor.feature_column: context}
+        return series_id, window.copy() if copy_window else window, incremental, remaining, contexts
+
+    def _stream_acf_lags(self):
+        """
+        Determine the number of autocorrelation lags required by the features in streaming mode.
+
+        Returns
+        -------
+        int or None
+            The largest number of lags used by stability and seasonality strength, or None if
+            neither is calculated or the window size is not a number of samples.
+        """
+        if not self.numeric_window:
+            return None
+
+        features = self.extractor.features
+        feature_params = self.extractor.task_manager.feature_params
+        lags = []
+        if Features.STABILITY in features:
+            max_lag = feature_params.get(Features.STABILITY, {}).get('max_lag')
+            lags.append(max_lag if max_lag is not None else min(12, self.window_size - 1))
+        if Features.SEASONALITY_STRENGTH in features:
+            params = feature_params.get(Features.SEASONALITY_STRENGTH, {})
+            lags.append(max(params.get('max_lag', 12), params.get('period', 2)))
+        return max(lags) if lags else None
+
+    def _stream_incremental_states(self):
+        """
+        Create empty incremental states of the features in streaming mode.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping feature names to `IncrementalFeature` states for the window
+            size, for the features whose state supports their parameters. Training statistics
+            are computed once here and shared by the copies made for each series.
+        """
+        if not self.numeric_window:
+            return {}
+
+        states = {}
+        for name, state_class in load_incremental_feature_states().items():
+            if name not in self.extractor.features:
+                continue
+            params = self.extractor.task_manager.feature_params.get(name, {})
+            try:
+                states[name] = state_class(self.window_size, **params)
+            except (TypeError, ValueError):
+                # Unsupported parameters: the feature is calculated from each window instead
+                continue
+        return states
+
+def complete_window(task_manager, features, feature_column, id_column, pending):
+    """
+    Calculate the features of a pending window that are not maintained incrementally.
+
+    This function only depends on its arguments, so windows can be completed in a thread or
+    process pool while the stream keeps receiving points.
+
+    Parameters
+    ----------
+    task_manager : TaskManager
+        The task manager calculating the features.
+    features : list of str
+        The features to return, in order.
+    feature_column : str
+        The column the features are calculated for.
+    id_column : str
+        The column identifying the series.
+    pending : tuple
+        A pending window `(series_id, window, incremental, remaining, contexts)`.
+
+    Returns
+    -------
+    dict
+        The features of the window, together with the series ID.
+    """
+    series_id, window, incremental, remaining, contexts = pending
+    calculated = {}
+    if remaining:
+        calculated = task_manager._process_window(window[np.newaxis, :], [feature_column], features=remaining, contexts=contexts)
+
+    result = {}
+    for name in features:
+        key = f"{name}_{feature_column}"
+        result[key] = incremental[name] if name in incremental else calculated[key]
+    result[id_column] = series_id
+    return result
+
+def complete_windows(task_manager, features, feature_column, id_column, pending_windows):
+    """
+    Calculate the features of several pending windows (see `complete_window`).
+
+    Returns
+    -------
+    list of dict
+        The features of each window, together with its series ID.
+    """
+    return [complete_window(task_manager, features, feature_column, id_column, pending) for pending in pending_windows]
+
+def _to_nanoseconds(value):
+    """
+    Convert a streamed timestamp to int64 nanoseconds since the epoch.
+    """
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value)
+    timestamp = pd.Timestamp(value)
+    if timestamp is pd.NaT:
+        raise ValueError("Missing timestamp.")
+    return timestamp.value
+
+def _to_id_array(series_ids):
+    """
+    Convert series IDs to an array of numbers or strings if they all are, else to an object array.
+    """
+    try:
+        array = np.array(series_ids)
+        if array.ndim == 1 and array.dtype.kind in "biufU" and array.tolist() == series_ids:
+            return array
+    except ValueError:
+        pass
+    array = np.empty(len(series_ids), dtype=object)
+    array[:] = series_ids
+    return array
+
+def _to_float(value):
+    """
+    Convert a streamed value to float, mapping missing and non-numeric values to NaN.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
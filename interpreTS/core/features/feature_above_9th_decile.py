@@ -1,7 +1,39 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalFraction
 
-def calculate_above_9th_decile(data, training_data):
+def fit_above_9th_decile(training_data):
+    """
+    Compute the 9th decile of the training data once, for reuse across windows.
+
+    Parameters
+    ----------
+    training_data : pd.Series or np.ndarray
+        The training data to determine the 9th decile.
+
+    Returns
+    -------
+    dict
+        A dictionary with the key 'ninth_decile', which can be passed to `calculate_above_9th_decile`
+        (and its batch and rolling kernels) in place of the training data.
+
+    Raises
+    ------
+    ValueError
+        If the training data is missing or empty.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> fit_above_9th_decile(np.arange(1, 11))
+    {'ninth_decile': 9.1}
+    """
+    if training_data is None or len(training_data) == 0:
+        raise ValueError("Training data must be provided to calculate the 9th decile.")
+    return {'ninth_decile': float(np.percentile(np.asarray(training_data), 90))}
+
+
+def calculate_above_9th_decile(data, training_data=None, ninth_decile=None):
     """
     Calculate the fraction of values in the window above the 9th decile of the training data.
     
@@ -9,8 +41,10 @@ def calculate_above_9th_decile(data, training_data):
     ----------
     data : pd.Series or np.ndarray
         The time series data for which the fraction is to be calculated.
-    training_data : pd.Series or np.ndarray
+    training_data : pd.Series or np.ndarray, optional
         The training data to determine the 9th decile.
+    ninth_decile : float, optional
+        The precomputed 9th decile (see `fit_above_9th_decile`). If given, `training_data` is not used.
         
     Returns
     -------
@@ -34,13 +68,111 @@ def calculate_above_9th_decile(data, training_data):
     """
     # Convert to NumPy arrays for consistency
     data = np.asarray(data)
-    training_data = np.asarray(training_data)
-    
-    # Calculate the 9th decile of the training data
-    ninth_decile = np.percentile(training_data, 90)
+
+    # Calculate the 9th decile of the training data unless it was precomputed
+    if ninth_decile is None:
+        ninth_decile = fit_above_9th_decile(training_data)['ninth_decile']
     
     # Calculate the fraction of values above the 9th decile
     above_decile_count = np.sum(data > ninth_decile)
     above_decile_fraction = above_decile_count / len(data)
     
     return above_decile_fraction
+
+
+def calculate_above_9th_decile_batch(windows, training_data=None, ninth_decile=None):
+    """
+    Calculate the fraction of values above the 9th decile of the training data for every window
+    of a 2-D window matrix.
+
+    The decile is computed once for all windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    training_data : pd.Series or np.ndarray, optional
+        The training data to determine the 9th decile.
+    ninth_decile : float, optional
+        The precomputed 9th decile (see `fit_above_9th_decile`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with fractions in the range [0, 1].
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> training_data = np.arange(1, 11)
+    >>> calculate_above_9th_decile_batch(np.array([[8, 9, 10, 11, 12], [1, 2, 3, 4, 5]]), training_data)
+    array([0.6, 0. ])
+    """
+    if ninth_decile is None:
+        ninth_decile = fit_above_9th_decile(training_data)['ninth_decile']
+    return (windows > ninth_decile).mean(axis=1)
+
+
+def calculate_above_9th_decile_rolling(moments, training_data=None, ninth_decile=None):
+    """
+    Calculate the fraction of values above the 9th decile of the training data for every
+    sliding window, using running counts.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    training_data : pd.Series or np.ndarray, optional
+        The training data to determine the 9th decile.
+    ninth_decile : float, optional
+        The precomputed 9th decile (see `fit_above_9th_decile`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array with fractions in the range [0, 1].
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> moments = RollingMoments(np.array([8., 9., 10., 11., 12.]), window_size=3)
+    >>> calculate_above_9th_decile_rolling(moments, np.arange(1, 11))
+    array([0.33333333, 0.66666667, 1.        ])
+    """
+    if ninth_decile is None:
+        ninth_decile = fit_above_9th_decile(training_data)['ninth_decile']
+    return moments.rolling_count(moments.values > ninth_decile) / moments.window_size
+
+
+class IncrementalAbove9thDecile(IncrementalFraction):
+    """
+    Fraction of values above the 9th decile of the training data in the sliding window of a
+    stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    training_data : np.ndarray or pd.Series, optional
+        The training data to determine the 9th decile.
+    ninth_decile : float, optional
+        The precomputed 9th decile (see `fit_above_9th_decile`). If given, `training_data` is not used.
+
+    Examples
+    --------
+    >>> state = IncrementalAbove9thDecile(window_size=3, ninth_decile=9.1)
+    >>> for new in [8., 10., 12.]:
+    ...     state.update(new)
+    >>> state.value()
+    0.6666666666666666
+    """
+
+    def __init__(self, window_size, training_data=None, ninth_decile=None):
+        super().__init__(window_size)
+        if ninth_decile is None:
+            ninth_decile = fit_above_9th_decile(training_data)['ninth_decile']
+        self.ninth_decile = ninth_decile
+
+    def _matches(self, value):
+        return value > self.ninth_decile
@@ -1,4 +1,5 @@
 import numpy as np
+from ...utils.incremental import IncrementalMomentFeature
 
 def calculate_absolute_energy(data, start=None, end=None):
     """
@@ -48,3 +49,106 @@ def calculate_absolute_energy(data, start=None, end=None):
     # Calculate and return the absolute energy, handling empty series by returning NaN
     return np.sum(np.square(data)) if len(data) > 0 else np.nan
 
+
+def calculate_absolute_energy_batch(windows, start=None, end=None):
+    """
+    Calculate the absolute energy of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    start : int or None, optional
+        The starting position within each window. If None, windows start from the beginning.
+    end : int or None, optional
+        The ending position within each window. If None, windows end at the last value.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the sum of squared values of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> windows = np.array([[1., 2., 3., 4.], [0., 1., 0., 1.]])
+    >>> calculate_absolute_energy_batch(windows)
+    array([30.,  2.])
+    >>> calculate_absolute_energy_batch(windows, start=1, end=3)
+    array([13.,  1.])
+    """
+    windows = windows[:, start:end]
+    if windows.shape[1] == 0:
+        return np.full(windows.shape[0], np.nan)
+    return np.einsum("ij,ij->i", windows, windows)
+
+
+def calculate_absolute_energy_rolling(moments, start=None, end=None):
+    """
+    Calculate the absolute energy of every sliding window from precomputed rolling moments.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    start : None
+        Only whole windows are supported; kept for signature compatibility.
+    end : None
+        Only whole windows are supported; kept for signature compatibility.
+
+    Returns
+    -------
+    np.ndarray
+        An array with the sum of squared values of each window.
+
+    Raises
+    ------
+    ValueError
+        If `start` or `end` is given.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_absolute_energy_rolling(RollingMoments(np.array([1., 2., 3., 4.]), window_size=3))
+    array([14., 29.])
+    """
+    if start is not None or end is not None:
+        raise ValueError("Rolling absolute energy supports whole windows only.")
+    return moments.sum_squares
+
+
+class IncrementalAbsoluteEnergy(IncrementalMomentFeature):
+    """
+    Absolute energy of the sliding window of a stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    start : None
+        Only whole windows are supported; kept for signature compatibility.
+    end : None
+        Only whole windows are supported; kept for signature compatibility.
+
+    Raises
+    ------
+    ValueError
+        If `start` or `end` is given.
+
+    Examples
+    --------
+    >>> state = IncrementalAbsoluteEnergy(window_size=3)
+    >>> for new, evicted in [(1., None), (2., None), (3., None), (4., 1.)]:
+    ...     state.update(new, evicted)
+    >>> state.value()
+    29.0
+    """
+
+    def __init__(self, window_size, start=None, end=None):
+        if start is not None or end is not None:
+            raise ValueError("Incremental absolute energy supports whole windows only.")
+        super().__init__(window_size)
+
+    def value(self):
+        return self.moments.sum_squares
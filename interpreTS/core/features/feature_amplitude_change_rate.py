@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
 from interpreTS.core.features.feature_peak import calculate_peak
-from scipy.signal import find_peaks
 
 def calculate_amplitude_change_rate(data):
     """
@@ -60,6 +59,8 @@ def calculate_amplitude_change_rate(data):
     if len(data) < 3:
         return np.nan
 
+    from scipy.signal import find_peaks
+
     # Find peaks (maxima)
     peaks, _ = find_peaks(data)
     
@@ -1,5 +1,71 @@
 import numpy as np
 
+def count_template_matches(data, m, r, max_block_elements=2**22):
+    """
+    Count, for every template of length m and m + 1, the templates within Chebyshev distance r.
+
+    Templates are compared in row blocks: each block builds the distance matrix between its
+    templates and all others with vectorized NumPy operations, so memory usage is bounded by
+    `max_block_elements` regardless of the length of the data. Counts for length m + 1 reuse the
+    distances computed for length m, extending them with a single extra component.
+
+    Parameters
+    ----------
+    data : array-like
+        A 1D array or list of numerical data points.
+    m : int
+        The template length (embedding dimension).
+    r : float
+        The tolerance; two templates match if their Chebyshev distance is strictly less than r.
+    max_block_elements : int, optional
+        Maximum number of elements of the distance matrix held in memory at once (default is 2**22).
+
+    Returns
+    -------
+    tuple of np.ndarray
+        `(counts_m, counts_m_plus_1)`: for each of the N - m + 1 templates of length m and each of
+        the N - m templates of length m + 1, the number of matching templates (self-matches included).
+
+    Examples
+    --------
+    >>> counts_m, counts_m_plus_1 = count_template_matches([1, 2, 1, 2, 1], m=2, r=0.5)
+    >>> counts_m
+    array([2, 2, 2, 2])
+    >>> counts_m_plus_1
+    array([2, 1, 2])
+    """
+    data = np.asarray(data, dtype=np.float64)
+    n_templates = len(data) - m + 1
+    n_extended = len(data) - m
+
+    counts_m = np.zeros(max(n_templates, 0), dtype=np.int64)
+    counts_m_plus_1 = np.zeros(max(n_extended, 0), dtype=np.int64)
+    if n_templates <= 0:
+        return counts_m, counts_m_plus_1
+
+    block_size = max(1, max_block_elements // n_templates)
+
+    for start in range(0, n_templates, block_size):
+        stop = min(start + block_size, n_templates)
+
+        # Chebyshev distance between templates [start, stop) and all templates of length m
+        distances = np.zeros((stop - start, n_templates))
+        for k in range(m):
+            np.maximum(distances, np.abs(data[start + k : stop + k, None] - data[None, k : k + n_templates]), out=distances)
+        counts_m[start:stop] = np.count_nonzero(distances < r, axis=1)
+
+        # Extend the templates by one point to get the distances for length m + 1
+        extended_stop = min(stop, n_extended)
+        if extended_stop > start:
+            rows = extended_stop - start
+            extended = np.maximum(
+                distances[:rows, :n_extended],
+                np.abs(data[start + m : extended_stop + m, None] - data[None, m : m + n_extended])
+            )
+            counts_m_plus_1[start:extended_stop] = np.count_nonzero(extended < r, axis=1)
+
+    return counts_m, counts_m_plus_1
+
 def calculate_approximate_entropy(data, m=2, r=0.2):
     """
     Calculate the Approximate Entropy (ApEn) of a dataset.
@@ -22,35 +88,26 @@ def calculate_approximate_entropy(data, m=2, r=0.2):
     -----
     - Approximate Entropy measures the regularity of data. A lower value indicates more regularity.
     - The function uses the method described by Pincus (1991) to calculate ApEn.
+    - Template matches are counted with `count_template_matches`, which compares templates in
+      vectorized blocks of bounded memory instead of pair by pair.
     """
-    
+
     N = len(data)
     if N <= m:
         return np.nan
 
-    # Convert data to numpy array for easier manipulation
-    data = np.array(data)
-
-    # Define a function to calculate the maximum distance between two vectors
-    def max_dist(x, y):
-        return np.max(np.abs(x - y))
-
-    # Define a function to calculate the number of similar patterns
-    def phi(m):
-        X = np.array([data[i:i + m] for i in range(N - m + 1)])
-        C = np.zeros(N - m + 1)
-        for i in range(N - m + 1):
-            for j in range(N - m + 1):
-                if max_dist(X[i], X[j]) < r:
-                    C[i] += 1
+    counts_m, counts_m_plus_1 = count_template_matches(data, m, r)
+
+    # Define a function to calculate phi from the number of similar patterns
+    def phi(C, n_templates):
         # Ensuring that the argument inside the log is never less than 1
         C = np.maximum(C, 1)  # To avoid log(0) or very small values
         # Adding a very small constant (e.g. 1e-10) to avoid logarithms of zero
-        return np.sum(np.log(C / (N - m + 1) + 1e-10))
+        return np.sum(np.log(C / n_templates + 1e-10))
 
     # Calculate phi(m) and phi(m+1)
-    phi_m = phi(m)
-    phi_m_plus_1 = phi(m + 1)
+    phi_m = phi(counts_m, N - m + 1)
+    phi_m_plus_1 = phi(counts_m_plus_1, N - m)
 
     # Approximate Entropy is the difference between the two
     result = phi_m - phi_m_plus_1
@@ -58,5 +115,5 @@ def calculate_approximate_entropy(data, m=2, r=0.2):
     # If the result is very close to 0, treat it as 0
     if abs(result) < 1e-8:
         result = 0.0
-    
+
     return result
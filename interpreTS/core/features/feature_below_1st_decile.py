@@ -1,7 +1,39 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalFraction
 
-def calculate_below_1st_decile(data, training_data):
+def fit_below_1st_decile(training_data):
+    """
+    Compute the 1st decile of the training data once, for reuse across windows.
+
+    Parameters
+    ----------
+    training_data : pd.Series or np.ndarray
+        The training data to determine the 1st decile.
+
+    Returns
+    -------
+    dict
+        A dictionary with the key 'first_decile', which can be passed to `calculate_below_1st_decile`
+        (and its batch and rolling kernels) in place of the training data.
+
+    Raises
+    ------
+    ValueError
+        If the training data is missing or empty.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> fit_below_1st_decile(np.arange(1, 11))
+    {'first_decile': 1.9}
+    """
+    if training_data is None or len(training_data) == 0:
+        raise ValueError("Training data must be provided to calculate the 1st decile.")
+    return {'first_decile': float(np.percentile(np.asarray(training_data), 10))}
+
+
+def calculate_below_1st_decile(data, training_data=None, first_decile=None):
     """
     Calculate the fraction of values in the window below the 1st decile of the training data.
     
@@ -9,8 +41,10 @@ def calculate_below_1st_decile(data, training_data):
     ----------
     data : pd.Series or np.ndarray
         The time series data for which the fraction is to be calculated.
-    training_data : pd.Series or np.ndarray
+    training_data : pd.Series or np.ndarray, optional
         The training data to determine the 1st decile.
+    first_decile : float, optional
+        The precomputed 1st decile (see `fit_below_1st_decile`). If given, `training_data` is not used.
         
     Returns
     -------
@@ -34,13 +68,111 @@ def calculate_below_1st_decile(data, training_data):
     """
     # Convert to NumPy arrays for consistency
     data = np.asarray(data)
-    training_data = np.asarray(training_data)
-    
-    # Calculate the 1st decile of the training data
-    first_decile = np.percentile(training_data, 10)
+
+    # Calculate the 1st decile of the training data unless it was precomputed
+    if first_decile is None:
+        first_decile = fit_below_1st_decile(training_data)['first_decile']
     
     # Calculate the fraction of values below the 1st decile
     below_decile_count = np.sum(data < first_decile)
     below_decile_fraction = below_decile_count / len(data)
     
     return below_decile_fraction
+
+
+def calculate_below_1st_decile_batch(windows, training_data=None, first_decile=None):
+    """
+    Calculate the fraction of values below the 1st decile of the training data for every window
+    of a 2-D window matrix.
+
+    The decile is computed once for all windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    training_data : pd.Series or np.ndarray, optional
+        The training data to determine the 1st decile.
+    first_decile : float, optional
+        The precomputed 1st decile (see `fit_below_1st_decile`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with fractions in the range [0, 1].
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> training_data = np.arange(1, 11)
+    >>> calculate_below_1st_decile_batch(np.array([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]), training_data)
+    array([0.2, 0. ])
+    """
+    if first_decile is None:
+        first_decile = fit_below_1st_decile(training_data)['first_decile']
+    return (windows < first_decile).mean(axis=1)
+
+
+def calculate_below_1st_decile_rolling(moments, training_data=None, first_decile=None):
+    """
+    Calculate the fraction of values below the 1st decile of the training data for every
+    sliding window, using running counts.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    training_data : pd.Series or np.ndarray, optional
+        The training data to determine the 1st decile.
+    first_decile : float, optional
+        The precomputed 1st decile (see `fit_below_1st_decile`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array with fractions in the range [0, 1].
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> moments = RollingMoments(np.array([1., 2., 3., 1., 5.]), window_size=3)
+    >>> calculate_below_1st_decile_rolling(moments, np.arange(1, 11))
+    array([0.33333333, 0.33333333, 0.33333333])
+    """
+    if first_decile is None:
+        first_decile = fit_below_1st_decile(training_data)['first_decile']
+    return moments.rolling_count(moments.values < first_decile) / moments.window_size
+
+
+class IncrementalBelow1stDecile(IncrementalFraction):
+    """
+    Fraction of values below the 1st decile of the training data in the sliding window of a
+    stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    training_data : np.ndarray or pd.Series, optional
+        The training data to determine the 1st decile.
+    first_decile : float, optional
+        The precomputed 1st decile (see `fit_below_1st_decile`). If given, `training_data` is not used.
+
+    Examples
+    --------
+    >>> state = IncrementalBelow1stDecile(window_size=3, first_decile=1.9)
+    >>> for new in [1., 2., 0.]:
+    ...     state.update(new)
+    >>> state.value()
+    0.6666666666666666
+    """
+
+    def __init__(self, window_size, training_data=None, first_decile=None):
+        super().__init__(window_size)
+        if first_decile is None:
+            first_decile = fit_below_1st_decile(training_data)['first_decile']
+        self.first_decile = first_decile
+
+    def _matches(self, value):
+        return value < self.first_decile
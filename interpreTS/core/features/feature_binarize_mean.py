@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+import bisect
+from ...utils.incremental import IncrementalMomentFeature
 
 def calculate_binarize_mean(data):
     """
@@ -34,7 +36,8 @@ def calculate_binarize_mean(data):
         return 1.0  # Single value is always equal to its mean
 
     # Handle all-equal case
-    if data.nunique() == 1:
+    values = np.asarray(data)
+    if np.all(values == values[0]):
         return 0.0  # No value is greater than the mean when all values are the same
 
     # Calculate mean and binarize the data
@@ -42,3 +45,75 @@ def calculate_binarize_mean(data):
     binarized_data = (data >= mean_value).astype(int)  # Greater than or equal to the mean
 
     return binarized_data.mean()
+
+
+def calculate_binarize_mean_batch(windows):
+    """
+    Calculate the binarize mean of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the fraction of values greater than or equal
+        to the window mean. Constant windows yield 0.0.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_binarize_mean_batch(np.array([[1, 2, 3, 4, 5], [2, 2, 2, 2, 2]]))
+    array([0.6, 0. ])
+    """
+    n_windows, window_size = windows.shape
+    if window_size == 1:
+        return np.ones(n_windows)
+
+    mean_value = windows.mean(axis=1, keepdims=True)
+    binarized = (windows >= mean_value).mean(axis=1)
+    all_equal = np.all(windows == windows[:, :1], axis=1)
+    return np.where(all_equal, 0.0, binarized)
+
+
+class IncrementalBinarizeMean(IncrementalMomentFeature):
+    """
+    Binarize mean of the sliding window of a stream.
+
+    The window values are kept sorted, so the number of values greater than or equal to the
+    running mean is found by binary search in O(log W) instead of comparing every value.
+
+    Examples
+    --------
+    >>> state = IncrementalBinarizeMean(window_size=5)
+    >>> for new in [1., 2., 3., 4., 5.]:
+    ...     state.update(new)
+    >>> state.value()
+    0.6
+    """
+
+    def __init__(self, window_size):
+        super().__init__(window_size)
+        self._sorted = []
+
+    def update(self, new, evicted=None):
+        super().update(new, evicted)
+        if not np.isnan(new):
+            bisect.insort(self._sorted, new)
+        if evicted is not None and not np.isnan(evicted):
+            del self._sorted[bisect.bisect_left(self._sorted, evicted)]
+
+    def value(self):
+        if self.window_size == 1:
+            return 1.0
+        if self._sorted[0] == self._sorted[-1]:
+            return 0.0
+
+        above = len(self._sorted) - bisect.bisect_left(self._sorted, self.moments.mean)
+        return above / self.window_size
+
+    def reset(self, window):
+        super().reset(window)
+        self._sorted = sorted(float(value) for value in window if not np.isnan(value))
@@ -1,48 +1,203 @@
 import numpy as np
 import pandas as pd
+import bisect
+from collections import deque
+from ...utils.incremental import IncrementalMomentFeature
 
-def calculate_crossing_points(data):
+CROSSING_POINTS_OUTPUTS = ('dict', 'count', 'indices')
+
+def calculate_crossing_points(data, output='dict'):
     """
     Calculate the number of times and the list of indices where the time series crosses its mean.
-    
+
     Parameters
     ----------
     data : pd.Series or np.ndarray
         The time series data for which mean crossings are to be calculated.
-    
+    output : {'dict', 'count', 'indices'}, optional
+        Format of the result (default is 'dict'). 'count' returns only the number of crossings,
+        which keeps the extracted features numeric; 'indices' returns the crossing indices as
+        a compact int32 array.
+
     Returns
     -------
-    dict
-        A dictionary containing:
+    dict, int or np.ndarray
+        For output='dict', a dictionary containing:
         - 'crossing_count': The total number of crossings.
         - 'crossing_points': A list of indices where crossings occur.
-    
+        For output='count', the total number of crossings.
+        For output='indices', an int32 array of indices where crossings occur.
+
     Raises
     ------
     ValueError
-        If the input data is empty or contains NaN values.
+        If the input data is empty or contains NaN values, or if `output` is not supported.
+
+    Examples
+    --------
+    >>> calculate_crossing_points(np.array([1, -1, 2, -2]), output='count')
+    3
     """
+    if output not in CROSSING_POINTS_OUTPUTS:
+        raise ValueError(f"output must be one of {CROSSING_POINTS_OUTPUTS}, got '{output}'.")
+
      # Check if data is empty or contains NaN
     if isinstance(data, (pd.Series, pd.DataFrame)) and data.empty:
-        return {'crossing_count': 0, 'crossing_points': []}
+        return _format_crossing_points(np.array([], dtype=np.int32), output)
     if isinstance(data, pd.Series):
         data = data.to_numpy()
 
     if len(data) == 0 or np.any(np.isnan(data)):
         raise ValueError("Input data should not be empty or contain NaN values.")
 
-    # Calculate the mean value
-    mean_value = np.mean(data)
+    data = np.asarray(data, dtype=np.float64)
+    crossings = _crossing_mask(data[np.newaxis, :])[0]
+
+    return _format_crossing_points(np.flatnonzero(crossings).astype(np.int32) + 1, output)
+
+def calculate_crossing_points_batch(windows, output='dict'):
+    """
+    Calculate the mean crossings of every row of a (n_windows, window_size) array.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+    output : {'dict', 'count', 'indices'}, optional
+        Format of the result for each window, as in `calculate_crossing_points` (default is 'dict').
+
+    Returns
+    -------
+    np.ndarray
+        For output='count', an integer array with the number of crossings of each window;
+        otherwise an object array with one result of `calculate_crossing_points` per window.
+    """
+    if output not in CROSSING_POINTS_OUTPUTS:
+        raise ValueError(f"output must be one of {CROSSING_POINTS_OUTPUTS}, got '{output}'.")
+
+    windows = np.asarray(windows, dtype=np.float64)
+    crossings = _crossing_mask(windows)
+    counts = np.count_nonzero(crossings, axis=1)
+    if output == 'count':
+        return counts
+
+    _, positions = np.nonzero(crossings)
+    per_window = np.split(positions.astype(np.int32) + 1, np.cumsum(counts)[:-1])
+
+    results = np.empty(len(windows), dtype=object)
+    for i, indices in enumerate(per_window):
+        results[i] = _format_crossing_points(indices, output)
+    return results
+
+def _crossing_mask(windows):
+    """
+    Mark, for every row of a 2D array, the positions i >= 1 at which the row crosses its mean.
+
+    Rows that lie entirely on one side of their mean have no crossings.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array of shape (n_windows, window_size - 1), where element [w, i - 1] is True
+        if row w crosses its mean between positions i - 1 and i.
+    """
+    mean_value = windows.mean(axis=1, keepdims=True)
+    previous, current = windows[:, :-1], windows[:, 1:]
+
+    crossings = ((previous < mean_value) & (current >= mean_value)) | ((previous > mean_value) & (current <= mean_value))
+
+    # If all values are above or all are below the mean, there are no crossings
+    one_sided = np.all(windows >= mean_value, axis=1) | np.all(windows <= mean_value, axis=1)
+    crossings[one_sided] = False
+    return crossings
+
+def _format_crossing_points(indices, output):
+    """
+    Convert an int32 array of crossing indices to the requested output format.
+    """
+    if output == 'count':
+        return len(indices)
+    if output == 'indices':
+        return indices
+    return {'crossing_count': len(indices), 'crossing_points': indices.tolist()}
+
+
+class IncrementalCrossingPoints(IncrementalMomentFeature):
+    """
+    Number of mean crossings in the sliding window of a stream.
+
+    Every pair of consecutive values (p, c) crosses the mean m if p < m <= c or c <= m < p.
+    The endpoints of rising and falling pairs are kept in sorted lists, so the crossings of the
+    running mean are counted by binary search in O(log W) instead of scanning the window:
+    #(p < m) - #(c < m) rising pairs and #(c <= m) - #(p <= m) falling pairs cross it.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    output : {'count'}, optional
+        Only the number of crossings is maintained incrementally (default is 'dict', which
+        is rejected; the argument is kept for signature compatibility).
+
+    Raises
+    ------
+    ValueError
+        If `output` is not 'count'.
+
+    Examples
+    --------
+    >>> state = IncrementalCrossingPoints(window_size=4, output='count')
+    >>> for new in [1., -1., 2., -2.]:
+    ...     state.update(new)
+    >>> state.value()
+    3
+    """
+
+    def __init__(self, window_size, output='dict'):
+        if output != 'count':
+            raise ValueError("Incremental crossing points support output='count' only.")
+        super().__init__(window_size)
+        self._values = deque()
+        self._rising = ([], [])
+        self._falling = ([], [])
 
-    # If all values are above or all are below the mean, return no crossings
-    if np.all(data >= mean_value) or np.all(data <= mean_value):
-        return {'crossing_count': 0, 'crossing_points': []}
+    def update(self, new, evicted=None):
+        super().update(new, evicted)
+        if self._values:
+            self._add_pair(self._values[-1], new, 1)
+        self._values.append(new)
+        if len(self._values) > self.window_size:
+            oldest = self._values.popleft()
+            self._add_pair(oldest, self._values[0], -1)
 
-    crossing_points = []
+    def value(self):
+        mean_value = self.moments.mean
+        rising_low, rising_high = self._rising
+        falling_low, falling_high = self._falling
+        rising = bisect.bisect_left(rising_low, mean_value) - bisect.bisect_left(rising_high, mean_value)
+        falling = bisect.bisect_right(falling_low, mean_value) - bisect.bisect_right(falling_high, mean_value)
+        return rising + falling
 
-    # We now check for true crossings
-    for i in range(1, len(data)):
-        if (data[i-1] < mean_value and data[i] >= mean_value) or (data[i-1] > mean_value and data[i] <= mean_value):
-            crossing_points.append(i)
+    def reset(self, window):
+        super().reset(window)
+        self._values = deque(float(value) for value in window)
+        previous, current = np.asarray(window[:-1]), np.asarray(window[1:])
+        rises, falls = previous < current, previous > current
+        self._rising = (sorted(previous[rises].tolist()), sorted(current[rises].tolist()))
+        self._falling = (sorted(current[falls].tolist()), sorted(previous[falls].tolist()))
 
-    return {'crossing_count': len(crossing_points), 'crossing_points': crossing_points}
\ No newline at end of file
+    def _add_pair(self, previous, current, sign):
+        """
+        Add (sign 1) or remove (sign -1) the pair of consecutive values (previous, current).
+        """
+        if previous < current:
+            lists, values = self._rising, (previous, current)
+        elif previous > current:
+            lists, values = self._falling, (current, previous)
+        else:
+            return
+        for sorted_values, value in zip(lists, values):
+            if sign > 0:
+                bisect.insort(sorted_values, value)
+            else:
+                del sorted_values[bisect.bisect_left(sorted_values, value)]
@@ -32,6 +32,9 @@ def calculate_distance_to_last_trend_change(data, window_size=5):
     >>> calculate_distance_to_last_trend_change(data, window_size=2)
     1
     """
+    if isinstance(data, np.ndarray):
+        data = pd.Series(data)
+
     if isinstance(data.index, pd.MultiIndex):
         data = data.reset_index(drop=True)
 
@@ -42,9 +45,6 @@ def calculate_distance_to_last_trend_change(data, window_size=5):
     if window_size <= 0:
         raise ValueError("Window size must be a positive integer.")
 
-    if isinstance(data, np.ndarray):
-        data = pd.Series(data)
-
     if data.is_monotonic_increasing or data.is_monotonic_decreasing:
         return None  
 
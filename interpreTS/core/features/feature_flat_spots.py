@@ -1,14 +1,14 @@
-from itertools import groupby
 import numpy as np
 import pandas as pd
+from ...utils.window_engine import sliding_windows
 
 
 def calculate_flat_spots(data, window_size=5):
     """
     Calculate the number of flat spots in the time series.
-    
+
     Flat spots are defined as maximum run-lengths across equally-sized segments of the time series.
-    
+
     Parameters
     ----------
     data : pd.Series or np.ndarray
@@ -20,7 +20,7 @@ def calculate_flat_spots(data, window_size=5):
     -------
     int
         The number of flat spots in the time series.
-    
+
     Examples
     --------
     >>> import pandas as pd
@@ -28,11 +28,111 @@ def calculate_flat_spots(data, window_size=5):
     >>> calculate_flat_spots(data)
     4
     """
-    run_lengths = [
-        len(list(group))
-        for i in range(0, len(data), window_size)
-        for _, group in groupby(data[i:i + window_size])
-    ]
-    max_flat_spot = max(run_lengths, default=0)
+    values = np.asarray(data)
+    if len(values) == 0:
+        return 0
+
+    return int(calculate_flat_spots_batch(values[np.newaxis, :], window_size)[0])
+
+def calculate_flat_spots_batch(windows, window_size=5):
+    """
+    Calculate the flat spots of every row of a (n_windows, length) array.
+
+    Runs are found with a run-length encoding: a run starts wherever the value changes or a new
+    segment of `window_size` samples begins, and the length of the run containing each sample is
+    its distance to the last run start.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+    window_size : int, optional
+        The size of the segments to look for flat spots in (default is 5).
+
+    Returns
+    -------
+    np.ndarray
+        The maximum run length of each window.
+    """
+    windows = np.asarray(windows)
+    n_windows, length = windows.shape
+    if length == 0:
+        return np.zeros(n_windows, dtype=np.int64)
+
+    run_starts = np.ones(windows.shape, dtype=bool)
+    np.not_equal(windows[:, 1:], windows[:, :-1], out=run_starts[:, 1:])
+    run_starts[:, ::window_size] = True
+
+    positions = np.arange(length)
+    last_start = np.maximum.accumulate(np.where(run_starts, positions, 0), axis=1)
+    return (positions - last_start + 1).max(axis=1)
+
+def calculate_flat_spots_rolling(moments, window_size=5):
+    """
+    Calculate the flat spots of all overlapping windows of a series.
 
-    return max_flat_spot
+    Every window is split into segments of `window_size` samples aligned with its own start, so
+    windows whose starts are congruent modulo `window_size` share the same segment grid. For each
+    such residue the clipped run length of every sample and the maximum of every segment are
+    computed once for the whole series, and each window is reduced to a sliding maximum over its
+    segments. The cost is O(N * window_size + N log W) instead of O(N * W).
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments describing the windows of the series.
+    window_size : int, optional
+        The size of the segments to look for flat spots in (default is 5).
+
+    Returns
+    -------
+    np.ndarray
+        The maximum run length of each window.
+    """
+    values = moments.values
+    length = moments.window_size
+    n_segments, remainder = divmod(length, window_size)
+
+    # Sharing segment grids pays off only for windows spanning several segments
+    if n_segments < 2:
+        return calculate_flat_spots_batch(sliding_windows(values, length, moments.stride), window_size)
+
+    # Length of the run ending at every sample of the series
+    positions = np.arange(len(values))
+    run_starts = np.ones(len(values), dtype=bool)
+    np.not_equal(values[1:], values[:-1], out=run_starts[1:])
+    run_lengths = positions - np.maximum.accumulate(np.where(run_starts, positions, 0)) + 1
+
+    window_starts = np.arange(0, moments.n_windows, moments.stride)
+    result = np.empty(len(window_starts), dtype=np.int64)
+
+    for residue in np.unique(window_starts % window_size):
+        selected = window_starts % window_size == residue
+        first_segment = (window_starts[selected] - residue) // window_size
+
+        # Runs clipped to the segments of the grid starting at `residue`, padded to whole segments
+        n_grid = -(-(len(values) - residue) // window_size)
+        clipped = np.zeros(n_grid * window_size, dtype=np.int64)
+        clipped[:len(values) - residue] = np.minimum(
+            run_lengths[residue:], positions[:len(values) - residue] % window_size + 1
+        )
+        grid = clipped.reshape(n_grid, window_size)
+
+        window_max = _sliding_max(grid.max(axis=1), n_segments)[first_segment]
+        if remainder:
+            window_max = np.maximum(window_max, grid[first_segment + n_segments, :remainder].max(axis=1))
+        result[selected] = window_max
+
+    return result
+
+def _sliding_max(values, length):
+    """
+    Calculate the maximum of every run of `length` consecutive values using a sparse table.
+    """
+    table = values
+    span = 1
+    while span * 2 <= length:
+        table = np.maximum(table[:-span], table[span:])
+        span *= 2
+    n_out = len(values) - length + 1
+    return np.maximum(table[:n_out], table[length - span : length - span + n_out])
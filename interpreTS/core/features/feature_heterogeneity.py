@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalMomentFeature
 
-def calculate_heterogeneity(data):
+def calculate_heterogeneity(data, context=None):
     """
     Calculate the heterogeneity (coefficient of variation) of a time series.
 
@@ -9,6 +10,8 @@ def calculate_heterogeneity(data):
     ----------
     data : pd.Series or np.ndarray
         The time series data for which the heterogeneity is to be calculated.
+    context : WindowContext, optional
+        Shared intermediates of the window; if given, its mean and standard deviation are reused.
 
     Returns
     -------
@@ -33,10 +36,6 @@ def calculate_heterogeneity(data):
     if isinstance(data, np.ndarray):
         data = pd.Series(data)
     
-    # Calculate mean and standard deviation
-    mean = data.mean()
-    std_dev = data.std()
-    
     # Handle empty series
     if len(data) == 0:
         return np.nan
@@ -44,5 +43,101 @@ def calculate_heterogeneity(data):
     # Handle a single value in the series
     if len(data) == 1:
         return 0.0  # No variability
+
+    # Calculate mean and standard deviation
+    if context is not None:
+        mean = context.mean
+        std_dev = context.std(ddof=1)
+    else:
+        mean = data.mean()
+        std_dev = data.std()
     
     return std_dev / abs(mean) if mean != 0 else np.nan
+
+
+def calculate_heterogeneity_batch(windows):
+    """
+    Calculate the heterogeneity (coefficient of variation) of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the heterogeneity of each window.
+        Windows with a zero mean yield NaN.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_heterogeneity_batch(np.array([[1, 2, 3, 4, 5], [-1, 0, 1, 0, 0]]))
+    array([0.52704628,        nan])
+    """
+    n_windows, window_size = windows.shape
+    if window_size == 0:
+        return np.full(n_windows, np.nan)
+    if window_size == 1:
+        return np.zeros(n_windows)
+
+    mean = windows.mean(axis=1)
+    std_dev = windows.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(mean != 0, std_dev / np.abs(mean), np.nan)
+
+
+def calculate_heterogeneity_rolling(moments):
+    """
+    Calculate the heterogeneity (coefficient of variation) of every sliding window from
+    precomputed rolling moments.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+
+    Returns
+    -------
+    np.ndarray
+        An array with the heterogeneity of each window. Windows with a zero mean yield NaN.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_heterogeneity_rolling(RollingMoments(np.array([1., 2., 3., 4., 5.]), window_size=5))
+    array([0.52704628])
+    """
+    window_size = moments.window_size
+    mean = moments.mean
+    if window_size == 1:
+        return np.zeros_like(mean)
+
+    std_dev = np.where(moments.constant, 0.0, np.sqrt(moments.m2 / (window_size - 1)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(mean != 0, std_dev / np.abs(mean), np.nan)
+
+
+class IncrementalHeterogeneity(IncrementalMomentFeature):
+    """
+    Heterogeneity (coefficient of variation) of the sliding window of a stream, updated in
+    O(1) per value.
+
+    Examples
+    --------
+    >>> state = IncrementalHeterogeneity(window_size=5)
+    >>> for new in [1., 2., 3., 4., 5.]:
+    ...     state.update(new)
+    >>> round(state.value(), 8)
+    0.52704628
+    """
+
+    def value(self):
+        if self.window_size == 1:
+            return 0.0
+
+        mean = self.moments.mean
+        std_dev = (self.moments.m2 / (self.window_size - 1)) ** 0.5
+        return std_dev / abs(mean) if mean != 0 else np.nan
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from ...utils.incremental import IncrementalFeature
 
 def calculate_length(data):
     """
@@ -31,3 +32,46 @@ def calculate_length(data):
     """
     # Return the length of the data
     return len(data)
+
+
+def calculate_length_batch(windows):
+    """
+    Calculate the number of data points for every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An integer array of shape (n_windows,) with the length of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_length_batch(np.array([[1, 2, 3], [4, 5, 6]]))
+    array([3, 3])
+    """
+    return np.full(windows.shape[0], windows.shape[1], dtype=np.int64)
+
+
+class IncrementalLength(IncrementalFeature):
+    """
+    Number of data points in the sliding window of a stream, which is its window size.
+
+    Examples
+    --------
+    >>> IncrementalLength(window_size=5).value()
+    5
+    """
+
+    def update(self, new, evicted=None):
+        pass
+
+    def value(self):
+        return self.window_size
+
+    def reset(self, window):
+        pass
@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from ...utils.rolling_moments import RollingMoments
 
 def calculate_linearity(data, normalize=True, use_derivative=True):
     """
@@ -29,6 +28,13 @@ def calculate_linearity(data, normalize=True, use_derivative=True):
     ValueError
         If the data is empty or contains insufficient unique points for regression.
 
+    Notes
+    -----
+    The R-squared of a least-squares line fitted against the sample index has the closed form
+    R^2 = Sxy^2 / (Sxx * Syy), where Sxx = n (n^2 - 1) / 12 depends only on the length. Since R^2
+    is invariant to shifting and scaling the data, normalization does not change the result and
+    only affects data that cannot be normalized (constant series).
+
     Examples
     --------
     >>> import pandas as pd
@@ -39,27 +45,137 @@ def calculate_linearity(data, normalize=True, use_derivative=True):
     >>> calculate_linearity(data)
     0.0
     """
-    if isinstance(data, np.ndarray):
-        data = pd.Series(data)
-
-    if normalize:
-        data = (data - data.mean()) / data.std()
+    values = np.asarray(data, dtype=np.float64)
 
     if use_derivative:
-        derivative_data = data.diff().dropna()
-        if len(np.unique(derivative_data)) <= 1:  
-            return 1.0 if len(np.unique(data)) > 1 else 0.0 
-        data = derivative_data
+        derivative = np.diff(values)
+        derivative = derivative[~np.isnan(derivative)]
+        if _is_constant(derivative):
+            return 1.0 if not _is_constant(values) else 0.0
+        values = derivative
 
-    if len(data) < 2 or len(np.unique(data)) < 2:
+    if len(values) < 2 or _is_constant(values):
         return 0.0
 
-    x = np.arange(len(data)).reshape(-1, 1)
-    y = data.values
+    return float(_r_squared(values[np.newaxis, :])[0])
+
+def calculate_linearity_batch(windows, normalize=True, use_derivative=True):
+    """
+    Calculate the linearity of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    normalize : bool, optional
+        Kept for compatibility with `calculate_linearity` (default is True).
+    use_derivative : bool, optional
+        Whether to calculate linearity on the first derivative of the data (default is True).
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the R-squared value of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_linearity_batch(np.array([[1, 2, 3, 4, 5], [5, 5, 5, 5, 5]]))
+    array([1., 0.])
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    values = np.diff(windows, axis=1) if use_derivative else windows
+
+    constant = np.all(values == values[:, :1], axis=1)
+    if values.shape[1] >= 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_squared = _r_squared(values)
+    else:
+        r_squared = np.zeros(len(values))
+
+    if use_derivative:
+        windows_constant = np.all(windows == windows[:, :1], axis=1)
+        return np.where(constant, np.where(windows_constant, 0.0, 1.0), r_squared)
+    return np.where(constant, 0.0, r_squared)
+
+def calculate_linearity_rolling(moments, normalize=True, use_derivative=True):
+    """
+    Calculate the linearity of every sliding window, in O(1) per window.
+
+    The co-moment of each window with the sample positions (Sxy) and its central second moment
+    (Syy) are obtained from running sums, so no window is fitted individually.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    normalize : bool, optional
+        Kept for compatibility with `calculate_linearity` (default is True).
+    use_derivative : bool, optional
+        Whether to calculate linearity on the first derivative of the data (default is True).
+
+    Returns
+    -------
+    np.ndarray
+        An array with the R-squared value of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> moments = RollingMoments(np.array([1., 2., 3., 4., 6., 9.]), window_size=4)
+    >>> calculate_linearity_rolling(moments)
+    array([1.  , 0.75, 1.  ])
+    """
+    values = moments.values
+    window_size = moments.window_size
+    stride = moments.stride
+    n_windows = moments.n_windows
 
+    changes = np.diff(values) != 0
+    windows_constant = _rolling_count(changes, window_size - 1, n_windows, stride) == 0
 
-    model = LinearRegression()
-    model.fit(x, y)
-    r_squared = model.score(x, y)
+    if use_derivative:
+        if window_size < 3:
+            return np.where(windows_constant, 0.0, 1.0)
+        derivative_constant = _rolling_count(np.diff(values, 2) != 0, window_size - 2, n_windows, stride) == 0
+        fit_moments = RollingMoments(np.diff(values), window_size - 1, stride, moments.anchor_every)
+    else:
+        if window_size < 2:
+            return np.zeros(len(windows_constant))
+        derivative_constant = windows_constant
+        fit_moments = moments
+
+    n = fit_moments.window_size
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = fit_moments.index_moment ** 2 / (n * (n ** 2 - 1) / 12 * fit_moments.m2)
+    r_squared = np.clip(r_squared, 0.0, 1.0)
+
+    if use_derivative:
+        return np.where(derivative_constant, np.where(windows_constant, 0.0, 1.0), r_squared)
+    return np.where(windows_constant, 0.0, r_squared)
+
+def _r_squared(values):
+    """
+    Calculate the R-squared of a least-squares line fitted to every row against its index.
+    """
+    n = values.shape[1]
+    positions = np.arange(n) - (n - 1) / 2
+    centered = values - values.mean(axis=1, keepdims=True)
+    sxy = centered @ positions
+    syy = np.einsum("ij,ij->i", centered, centered)
+    return np.minimum(sxy ** 2 / (n * (n ** 2 - 1) / 12 * syy), 1.0)
+
+def _is_constant(values):
+    """
+    Check whether all non-NaN values of an array are equal.
+    """
+    values = values[~np.isnan(values)]
+    return len(values) == 0 or bool(np.all(values == values[0]))
 
-    return r_squared
+def _rolling_count(mask, length, n_windows, stride):
+    """
+    Count the True values of a boolean mask over consecutive runs of `length` elements.
+    """
+    running = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    return (running[length:length + n_windows] - running[:n_windows])[::stride]
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalMomentFeature
 
 def calculate_mean(data):
     """
@@ -31,3 +32,69 @@ def calculate_mean(data):
     """
     # Calculate and return the mean, handling empty series by returning NaN
     return data.mean() if len(data) > 0 else np.nan
+
+
+def calculate_mean_batch(windows):
+    """
+    Calculate the mean value of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the mean of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_mean_batch(np.array([[1, 2, 3], [4, 5, 6]]))
+    array([2., 5.])
+    """
+    if windows.shape[1] == 0:
+        return np.full(windows.shape[0], np.nan)
+    return windows.mean(axis=1)
+
+
+def calculate_mean_rolling(moments):
+    """
+    Calculate the mean value of every sliding window from precomputed rolling moments.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+
+    Returns
+    -------
+    np.ndarray
+        An array with the mean of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_mean_rolling(RollingMoments(np.array([1., 2., 3., 4.]), window_size=2))
+    array([1.5, 2.5, 3.5])
+    """
+    return moments.mean
+
+
+class IncrementalMean(IncrementalMomentFeature):
+    """
+    Mean value of the sliding window of a stream, updated in O(1) per value.
+
+    Examples
+    --------
+    >>> state = IncrementalMean(window_size=3)
+    >>> for new, evicted in [(1., None), (2., None), (3., None), (4., 1.)]:
+    ...     state.update(new, evicted)
+    >>> state.value()
+    3.0
+    """
+
+    def value(self):
+        return self.moments.mean
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalFeature
 
 def calculate_missing_points(data, percentage=True):
     """
@@ -45,4 +46,76 @@ def calculate_missing_points(data, percentage=True):
     # Return either percentage or count of missing values
     if total_values == 0:
         return np.nan
-    return missing_values / total_values if percentage else missing_values
\ No newline at end of file
+    return missing_values / total_values if percentage else missing_values
+
+
+def calculate_missing_points_batch(windows, percentage=True):
+    """
+    Calculate the percentage or count of missing values in every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    percentage : bool, optional
+        If True, returns the percentage of missing values, otherwise their count.
+        Default is True.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the percentage or count of missing values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_missing_points_batch(np.array([[1, 2, np.nan, 4, np.nan], [1, 2, 3, 4, 5]]))
+    array([0.4, 0. ])
+    """
+    n_windows, window_size = windows.shape
+    if window_size == 0:
+        return np.full(n_windows, np.nan)
+
+    missing_values = np.isnan(windows).sum(axis=1)
+    return missing_values / window_size if percentage else missing_values
+
+
+class IncrementalMissingPoints(IncrementalFeature):
+    """
+    Percentage or count of missing values in the sliding window of a stream, updated in O(1)
+    per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    percentage : bool, optional
+        If True, returns the percentage of missing values, otherwise their count.
+        Default is True.
+
+    Examples
+    --------
+    >>> state = IncrementalMissingPoints(window_size=4)
+    >>> for new in [1., np.nan, 3., 4.]:
+    ...     state.update(new)
+    >>> state.value()
+    0.25
+    """
+
+    handles_nan = True
+
+    def __init__(self, window_size, percentage=True):
+        super().__init__(window_size)
+        self.percentage = percentage
+        self._missing = 0
+
+    def update(self, new, evicted=None):
+        self._missing += int(np.isnan(new))
+        if evicted is not None:
+            self._missing -= int(np.isnan(evicted))
+
+    def value(self):
+        return self._missing / self.window_size if self.percentage else self._missing
+
+    def reset(self, window):
+        self._missing = int(np.isnan(window).sum())
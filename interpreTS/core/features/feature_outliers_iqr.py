@@ -1,38 +1,37 @@
 import numpy as np
 import pandas as pd
+from ...utils.incremental import IncrementalFraction
 
-def calculate_outliers_iqr(data, training_data, epsilon=1e-6):
+def fit_outliers_iqr(training_data):
     """
-    Calculates the percentage of observations in a given window that fall below (Q1 - 1.5 * IQR) 
-    or above (Q3 + 1.5 * IQR) using the Interquartile Range (IQR) method.
+    Compute the IQR outlier bounds of the training data once, for reuse across windows.
 
     Parameters
     ----------
-    data : np.ndarray or pd.Series
-        The data window to analyze for outliers.
     training_data : np.ndarray or pd.Series
         The training data used to calculate Q1 (25th percentile), Q3 (75th percentile), and IQR.
-    epsilon : float, optional
-        A small tolerance added to bounds when training data contains a single unique value 
-        (default is 1e-6).
 
     Returns
     -------
-    float
-        The percentage of observations in the window that are considered outliers.
+    dict
+        A dictionary with the keys 'lower_bound' and 'upper_bound', which can be passed to
+        `calculate_outliers_iqr` (and its batch and rolling kernels) in place of the training data.
+        If the IQR is zero, the bounds are infinite so that no value is an outlier.
+
+    Raises
+    ------
+    ValueError
+        If the training data is missing or empty.
 
     Examples
     --------
     >>> import numpy as np
-    >>> training_data = np.array([10, 12, 14, 15, 16, 18, 19])
-    >>> data = np.array([9, 15, 20, 25])
-    >>> calculate_outliers_iqr(data, training_data)
-    0.25
+    >>> fit_outliers_iqr(np.array([10, 12, 14, 15, 16, 18, 19]))
+    {'lower_bound': 7.0, 'upper_bound': 23.0}
     """
-    if isinstance(training_data, pd.Series):
-        training_data = training_data.values
-    if isinstance(data, pd.Series):
-        data = data.values
+    if training_data is None or len(training_data) == 0:
+        raise ValueError("Training data must be provided to calculate the IQR bounds.")
+    training_data = np.asarray(training_data)
 
     # Handle single-value training data
     if np.all(training_data == training_data[0]):
@@ -45,13 +44,161 @@ def calculate_outliers_iqr(data, training_data, epsilon=1e-6):
         q3 = np.percentile(training_data, 75)
         iqr = q3 - q1
 
-        # Handle the case of zero IQR
+        # Handle the case of zero IQR: no value is an outlier
         if iqr == 0:
-            return 0.0
+            return {'lower_bound': -np.inf, 'upper_bound': np.inf}
 
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
 
+    return {'lower_bound': float(lower_bound), 'upper_bound': float(upper_bound)}
+
+
+def calculate_outliers_iqr(data, training_data=None, epsilon=1e-6, lower_bound=None, upper_bound=None):
+    """
+    Calculates the percentage of observations in a given window that fall below (Q1 - 1.5 * IQR) 
+    or above (Q3 + 1.5 * IQR) using the Interquartile Range (IQR) method.
+
+    Parameters
+    ----------
+    data : np.ndarray or pd.Series
+        The data window to analyze for outliers.
+    training_data : np.ndarray or pd.Series, optional
+        The training data used to calculate Q1 (25th percentile), Q3 (75th percentile), and IQR.
+    epsilon : float, optional
+        A small tolerance added to bounds when training data contains a single unique value 
+        (default is 1e-6).
+    lower_bound, upper_bound : float, optional
+        Precomputed outlier bounds (see `fit_outliers_iqr`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    float
+        The percentage of observations in the window that are considered outliers.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> training_data = np.array([10, 12, 14, 15, 16, 18, 19])
+    >>> data = np.array([9, 15, 20, 25])
+    >>> calculate_outliers_iqr(data, training_data)
+    0.25
+    """
+    if isinstance(data, pd.Series):
+        data = data.values
+
+    # Calculate the outlier bounds from the training dataset unless they were precomputed
+    if lower_bound is None or upper_bound is None:
+        bounds = fit_outliers_iqr(training_data)
+        lower_bound, upper_bound = bounds['lower_bound'], bounds['upper_bound']
+
     # Count the number of outliers in the window
     outliers = np.sum((data < lower_bound) | (data > upper_bound))
     return outliers / len(data)
+
+
+def calculate_outliers_iqr_batch(windows, training_data=None, epsilon=1e-6, lower_bound=None, upper_bound=None):
+    """
+    Calculate the percentage of IQR outliers for every window of a 2-D window matrix.
+
+    The quartiles of the training data are computed once for all windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    training_data : np.ndarray or pd.Series, optional
+        The training data used to calculate Q1, Q3 and IQR.
+    epsilon : float, optional
+        Kept for compatibility with `calculate_outliers_iqr` (default is 1e-6).
+    lower_bound, upper_bound : float, optional
+        Precomputed outlier bounds (see `fit_outliers_iqr`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the percentage of outliers in each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> training_data = np.array([10, 12, 14, 15, 16, 18, 19])
+    >>> calculate_outliers_iqr_batch(np.array([[9, 15, 20, 25], [12, 13, 14, 15]]), training_data)
+    array([0.25, 0.  ])
+    """
+    if lower_bound is None or upper_bound is None:
+        bounds = fit_outliers_iqr(training_data)
+        lower_bound, upper_bound = bounds['lower_bound'], bounds['upper_bound']
+
+    return ((windows < lower_bound) | (windows > upper_bound)).mean(axis=1)
+
+
+def calculate_outliers_iqr_rolling(moments, training_data=None, epsilon=1e-6, lower_bound=None, upper_bound=None):
+    """
+    Calculate the percentage of IQR outliers for every sliding window, using running counts.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    training_data : np.ndarray or pd.Series, optional
+        The training data used to calculate Q1, Q3 and IQR.
+    epsilon : float, optional
+        Kept for compatibility with `calculate_outliers_iqr` (default is 1e-6).
+    lower_bound, upper_bound : float, optional
+        Precomputed outlier bounds (see `fit_outliers_iqr`). If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array with the percentage of outliers in each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> moments = RollingMoments(np.array([9., 15., 20., 25., 14.]), window_size=4)
+    >>> calculate_outliers_iqr_rolling(moments, np.array([10, 12, 14, 15, 16, 18, 19]))
+    array([0.25, 0.25])
+    """
+    if lower_bound is None or upper_bound is None:
+        bounds = fit_outliers_iqr(training_data)
+        lower_bound, upper_bound = bounds['lower_bound'], bounds['upper_bound']
+
+    values = moments.values
+    return moments.rolling_count((values < lower_bound) | (values > upper_bound)) / moments.window_size
+
+
+class IncrementalOutliersIqr(IncrementalFraction):
+    """
+    Percentage of IQR outliers in the sliding window of a stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    training_data : np.ndarray or pd.Series, optional
+        The training data used to calculate Q1, Q3 and IQR.
+    epsilon : float, optional
+        Kept for compatibility with `calculate_outliers_iqr` (default is 1e-6).
+    lower_bound, upper_bound : float, optional
+        Precomputed outlier bounds (see `fit_outliers_iqr`). If given, `training_data` is not used.
+
+    Examples
+    --------
+    >>> state = IncrementalOutliersIqr(window_size=4, training_data=np.array([10, 12, 14, 15, 16, 18, 19]))
+    >>> for new in [9., 15., 20., 25.]:
+    ...     state.update(new)
+    >>> state.value()
+    0.25
+    """
+
+    def __init__(self, window_size, training_data=None, epsilon=1e-6, lower_bound=None, upper_bound=None):
+        super().__init__(window_size)
+        if lower_bound is None or upper_bound is None:
+            bounds = fit_outliers_iqr(training_data)
+            lower_bound, upper_bound = bounds['lower_bound'], bounds['upper_bound']
+        self.lower_bound, self.upper_bound = lower_bound, upper_bound
+
+    def _matches(self, value):
+        return (value < self.lower_bound) | (value > self.upper_bound)
@@ -1,7 +1,40 @@
 import numpy as np
 import pandas as pd
+from ...utils.incremental import IncrementalFraction
 
-def calculate_outliers_std(data, training_data):
+def fit_outliers_std(training_data):
+    """
+    Compute the mean and standard deviation of the training data once, for reuse across windows.
+
+    Parameters
+    ----------
+    training_data : np.ndarray or pd.Series
+        Training data used to calculate the mean and standard deviation.
+
+    Returns
+    -------
+    dict
+        A dictionary with the keys 'training_mean' and 'training_std', which can be passed to
+        `calculate_outliers_std` (and its batch and rolling kernels) in place of the training data.
+
+    Raises
+    ------
+    ValueError
+        If the training data is missing or empty.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> fit_outliers_std(np.array([1, 2, 3, 4, 5]))
+    {'training_mean': 3.0, 'training_std': 1.4142135623730951}
+    """
+    if training_data is None or len(training_data) == 0:
+        raise ValueError("Training data must be provided to calculate the mean and standard deviation.")
+    training_data = np.asarray(training_data)
+    return {'training_mean': float(np.mean(training_data)), 'training_std': float(np.std(training_data))}
+
+
+def calculate_outliers_std(data, training_data=None, training_mean=None, training_std=None):
     """
     Calculates the percentage of observations in a window that are above or below 
     3 standard deviations from the mean, based on the training dataset.
@@ -10,8 +43,11 @@ def calculate_outliers_std(data, training_data):
     ----------
     data : np.ndarray or pd.Series
         Window data to analyze.
-    training_data : np.ndarray or pd.Series
+    training_data : np.ndarray or pd.Series, optional
         Training data used to calculate the mean and standard deviation.
+    training_mean, training_std : float, optional
+        Precomputed mean and standard deviation of the training data (see `fit_outliers_std`).
+        If given, `training_data` is not used.
 
     Returns
     -------
@@ -30,12 +66,12 @@ def calculate_outliers_std(data, training_data):
     # Convert to numpy arrays for consistency
     if isinstance(data, pd.Series):
         data = data.values
-    if isinstance(training_data, pd.Series):
-        training_data = training_data.values
 
-    # Calculate mean and standard deviation from training data
-    mean_value = np.mean(training_data)
-    std_dev = np.std(training_data)
+    # Calculate mean and standard deviation from training data unless they were precomputed
+    if training_mean is None or training_std is None:
+        statistics = fit_outliers_std(training_data)
+        training_mean, training_std = statistics['training_mean'], statistics['training_std']
+    mean_value, std_dev = training_mean, training_std
 
     # Handle case where std_dev is 0
     if std_dev == 0:
@@ -49,3 +85,127 @@ def calculate_outliers_std(data, training_data):
     # Count observations outside the bounds
     outliers = np.sum((data < lower_bound) | (data > upper_bound))
     return outliers / len(data)
+
+
+def calculate_outliers_std_batch(windows, training_data=None, training_mean=None, training_std=None):
+    """
+    Calculate the percentage of observations more than 3 standard deviations from the training
+    mean for every window of a 2-D window matrix.
+
+    The training statistics are computed once for all windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    training_data : np.ndarray or pd.Series, optional
+        Training data used to calculate the mean and standard deviation.
+    training_mean, training_std : float, optional
+        Precomputed mean and standard deviation of the training data (see `fit_outliers_std`).
+        If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the percentage of outliers in each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> training_data = np.arange(1, 10)
+    >>> calculate_outliers_std_batch(np.array([[0, 10, 2, 3, 15], [1, 2, 3, 4, 5]]), training_data)
+    array([0.2, 0. ])
+    """
+    if training_mean is None or training_std is None:
+        statistics = fit_outliers_std(training_data)
+        training_mean, training_std = statistics['training_mean'], statistics['training_std']
+    mean_value, std_dev = training_mean, training_std
+
+    # Handle case where std_dev is 0
+    if std_dev == 0:
+        return (windows != mean_value).mean(axis=1)
+
+    lower_bound = mean_value - 3 * std_dev
+    upper_bound = mean_value + 3 * std_dev
+    return ((windows < lower_bound) | (windows > upper_bound)).mean(axis=1)
+
+
+def calculate_outliers_std_rolling(moments, training_data=None, training_mean=None, training_std=None):
+    """
+    Calculate the percentage of observations more than 3 standard deviations from the training
+    mean for every sliding window, using running counts.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    training_data : np.ndarray or pd.Series, optional
+        Training data used to calculate the mean and standard deviation.
+    training_mean, training_std : float, optional
+        Precomputed mean and standard deviation of the training data (see `fit_outliers_std`).
+        If given, `training_data` is not used.
+
+    Returns
+    -------
+    np.ndarray
+        An array with the percentage of outliers in each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> moments = RollingMoments(np.array([0., 10., 2., 3., 15.]), window_size=4)
+    >>> calculate_outliers_std_rolling(moments, np.arange(1, 10))
+    array([0.  , 0.25])
+    """
+    if training_mean is None or training_std is None:
+        statistics = fit_outliers_std(training_data)
+        training_mean, training_std = statistics['training_mean'], statistics['training_std']
+    mean_value, std_dev = training_mean, training_std
+    values = moments.values
+
+    # Handle case where std_dev is 0
+    if std_dev == 0:
+        outliers = values != mean_value
+    else:
+        outliers = (values < mean_value - 3 * std_dev) | (values > mean_value + 3 * std_dev)
+    return moments.rolling_count(outliers) / moments.window_size
+
+
+class IncrementalOutliersStd(IncrementalFraction):
+    """
+    Percentage of outliers (more than 3 standard deviations from the training mean) in the
+    sliding window of a stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    training_data : np.ndarray or pd.Series, optional
+        Training data used to calculate the mean and standard deviation.
+    training_mean, training_std : float, optional
+        Precomputed mean and standard deviation of the training data (see `fit_outliers_std`).
+        If given, `training_data` is not used.
+
+    Examples
+    --------
+    >>> state = IncrementalOutliersStd(window_size=4, training_data=np.arange(1, 10))
+    >>> for new, evicted in [(0., None), (10., None), (2., None), (3., None), (15., 0.)]:
+    ...     state.update(new, evicted)
+    >>> state.value()
+    0.25
+    """
+
+    def __init__(self, window_size, training_data=None, training_mean=None, training_std=None):
+        super().__init__(window_size)
+        if training_mean is None or training_std is None:
+            statistics = fit_outliers_std(training_data)
+            training_mean, training_std = statistics['training_mean'], statistics['training_std']
+        self.training_mean, self.training_std = training_mean, training_std
+
+    def _matches(self, value):
+        # Handle case where std_dev is 0
+        if self.training_std == 0:
+            return value != self.training_mean
+        deviation = 3 * self.training_std
+        return (value < self.training_mean - deviation) | (value > self.training_mean + deviation)
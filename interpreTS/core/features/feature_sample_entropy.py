@@ -0,0 +1,51 @@
+import numpy as np
+from .feature_approximate_entropy import count_template_matches
+
+def calculate_sample_entropy(data, m=2, r=0.2):
+    """
+    Calculate the Sample Entropy (SampEn) of a dataset.
+
+    Parameters
+    ----------
+    data : array-like
+        A 1D array or list of numerical data points.
+    m : int, optional
+        The length of the pattern to compare (embedding dimension). Default is 2.
+    r : float, optional
+        The tolerance value for defining similarity between points. Default is 0.2.
+
+    Returns
+    -------
+    float
+        The Sample Entropy of the dataset. NaN is returned if the dataset is too small
+        or if no matching templates are found.
+
+    Notes
+    -----
+    - Sample Entropy is the negative natural logarithm of the conditional probability that two
+      templates similar for m points remain similar for m + 1 points (Richman & Moorman, 2000).
+    - Unlike Approximate Entropy, self-matches are excluded, so the result does not depend on
+      the length of the data as strongly.
+    - The same N - m templates are used for both lengths, and matches are counted with the
+      template-matching engine shared with `calculate_approximate_entropy`.
+
+    Examples
+    --------
+    >>> calculate_sample_entropy([1, 2, 1, 2, 1, 2, 1, 2], m=2, r=0.5)
+    0.0
+    """
+    N = len(data)
+    if N <= m + 1:
+        return np.nan
+
+    counts_m, counts_m_plus_1 = count_template_matches(data, m, r)
+
+    # Use the first N - m templates of length m and remove the self-matches; matches with the
+    # last template are removed as well, which by symmetry are counted by that template itself
+    B = np.sum(counts_m[:N - m] - 1) - (counts_m[N - m] - 1)
+    A = np.sum(counts_m_plus_1 - 1)
+
+    if A == 0 or B == 0:
+        return np.nan
+
+    return float(np.log(B / A))
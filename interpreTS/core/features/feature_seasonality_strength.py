@@ -1,10 +1,8 @@
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.stattools import acf
+from ...utils.autocorrelation import batch_acf
 
-import warnings
-
-def calculate_seasonality_strength(data, period=2, max_lag=12):
+def calculate_seasonality_strength(data, period=2, max_lag=12, context=None):
     """
     Calculate the strength of the seasonality in a time series based on autocorrelation.
 
@@ -16,6 +14,9 @@ def calculate_seasonality_strength(data, period=2, max_lag=12):
         The periodic interval to check for seasonality (default is 2).
     max_lag : int, optional
         The maximum number of lags to consider for autocorrelation (default is 12).
+    context : WindowContext, optional
+        Shared intermediates of the window; if given and the window has no NaN values,
+        its autocorrelation function is reused.
 
     Returns
     -------
@@ -56,28 +57,99 @@ def calculate_seasonality_strength(data, period=2, max_lag=12):
     if np.all(data == data[0]):
         return 0.0
 
-    try:
-        # Suppress warnings from acf
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            autocorr_values = acf(data, nlags=max(max_lag, period), fft=True)
-        
-        # Ensure the autocorrelation result is valid
-        if len(autocorr_values) <= period:
-            return np.nan
-        
-        # Extract the autocorrelation value at the specified period
-        seasonality_strength = autocorr_values[period]
-        
-        # Ensure the strength value is in the range [0, 1]
-        seasonality_strength = max(0.0, min(seasonality_strength, 1.0))
-        return seasonality_strength
-    
-    except ZeroDivisionError:
-        # Handle division by zero in acf calculation (e.g., constant data)
-        return 0.0
-    
-    except Exception as e:
-        # Log or handle unexpected exceptions
-        print(f"Error calculating seasonality strength: {e}")
-        return np.nan
+    # Calculate the autocorrelation of the data up to the larger of the max lag and the period
+    if context is not None and not context.has_nan:
+        autocorr_values = context.acf(max(max_lag, period))
+    else:
+        autocorr_values = batch_acf(data.astype(np.float64)[np.newaxis, :], max(max_lag, period))[0]
+
+    return float(_seasonality_from_acf(autocorr_values[np.newaxis, :], period)[0])
+
+def calculate_seasonality_strength_batch(windows, period=2, max_lag=12):
+    """
+    Calculate the seasonality strength of every row of a (n_windows, window_size) array.
+
+    The autocorrelations of all windows without NaN values are calculated at once with
+    `batch_acf`; windows with NaN values are calculated individually without them.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+    period : int, optional
+        The periodic interval to check for seasonality (default is 2).
+    max_lag : int, optional
+        The maximum number of lags to consider for autocorrelation (default is 12).
+
+    Returns
+    -------
+    np.ndarray
+        The seasonality strength of each window.
+    """
+    if period <= 0:
+        raise ValueError("Period must be a positive integer.")
+
+    windows = np.asarray(windows, dtype=np.float64)
+    n_windows, window_size = windows.shape
+    result = np.full(n_windows, np.nan)
+
+    has_nan = np.isnan(windows).any(axis=1)
+    for i in np.flatnonzero(has_nan):
+        result[i] = calculate_seasonality_strength(windows[i], period, max_lag)
+
+    # Handle insufficient data length
+    if window_size <= period:
+        return result
+
+    complete = windows[~has_nan]
+    constant = np.all(complete == complete[:, :1], axis=1)
+    strength = _seasonality_from_acf(batch_acf(complete, max(max_lag, period)), period)
+    result[~has_nan] = np.where(constant, 0.0, strength)
+    return result
+
+def calculate_seasonality_strength_rolling(moments, period=2, max_lag=12):
+    """
+    Calculate the seasonality strength of all overlapping windows of a series.
+
+    The autocovariances of every window are obtained from running sums of lagged products
+    (see `RollingMoments.autocovariance`), so each window costs O(max(max_lag, period)).
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments describing the windows of the series.
+    period : int, optional
+        The periodic interval to check for seasonality (default is 2).
+    max_lag : int, optional
+        The maximum number of lags to consider for autocorrelation (default is 12).
+
+    Returns
+    -------
+    np.ndarray
+        The seasonality strength of each window.
+    """
+    if period <= 0:
+        raise ValueError("Period must be a positive integer.")
+
+    # Handle insufficient data length
+    if moments.window_size <= period:
+        return np.full(len(moments.constant), np.nan)
+
+    # Only the autocovariances up to the period are needed for its autocorrelation
+    autocovariance = moments.autocovariance(period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        autocorr_values = autocovariance / autocovariance[:, :1]
+
+    return np.where(moments.constant, 0.0, _seasonality_from_acf(autocorr_values, period))
+
+def _seasonality_from_acf(autocorr_values, period):
+    """
+    Take the autocorrelation at the period of every row as the seasonality strength.
+    """
+    # Ensure the autocorrelation result is valid
+    if autocorr_values.shape[1] <= period:
+        return np.full(len(autocorr_values), np.nan)
+
+    # Ensure the strength value is in the range [0, 1], with undefined values mapped to 0
+    seasonality_strength = autocorr_values[:, period]
+    return np.where(np.isnan(seasonality_strength), 0.0, np.clip(seasonality_strength, 0.0, 1.0))
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-def calculate_significant_changes(data):
+def calculate_significant_changes(data, context=None):
     """
     Calculate the proportion of significant increases or decreases in the signal within the given window.
      
@@ -9,6 +9,8 @@ def calculate_significant_changes(data):
     ----------
     data : pd.Series or np.ndarray
         The time series data for which the significant change is to be calculated.
+    context : WindowContext, optional
+        Shared intermediates of the window; if given, its differences are reused.
         
     Returns
     -------
@@ -31,7 +33,7 @@ def calculate_significant_changes(data):
         return 0.0  # Not enough data to compute differences
     
     # Compute differences between consecutive values
-    differences = np.diff(data)
+    differences = context.diff if context is not None else np.diff(data)
 
     # Check for all differences being zero or constant
     if np.all(differences == 0) or np.all(differences == differences[0]):
@@ -60,3 +62,44 @@ def calculate_significant_changes(data):
     proportion_significant_changes = significant_changes / len(differences)
 
     return proportion_significant_changes
+
+
+def calculate_significant_changes_batch(windows):
+    """
+    Calculate the proportion of significant changes for every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with proportions in the range [0, 1].
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_significant_changes_batch(np.array([[1, 2, 1, 3, 10, 2, 1], [1, 2, 3, 4, 5, 6, 7]]))
+    array([0., 0.])
+    """
+    n_windows, window_size = windows.shape
+    if window_size < 2:
+        return np.zeros(n_windows)
+
+    differences = np.diff(windows, axis=1)
+    constant = np.all(differences == differences[:, :1], axis=1)
+    abs_differences = np.abs(differences)
+
+    q1, q3 = np.percentile(abs_differences, [25, 75], axis=1)
+    iqr = q3 - q1
+
+    # Avoid issues with very small IQR
+    iqr = np.where(iqr == 0, np.where(q1 != 0, np.abs(q1) * 0.1, 0.1), iqr)
+
+    lower_bound = (q1 - 1.5 * iqr)[:, None]
+    upper_bound = (q3 + 1.5 * iqr)[:, None]
+    significant_changes = ((abs_differences < lower_bound) | (abs_differences > upper_bound)).sum(axis=1)
+
+    return np.where(constant, 0.0, significant_changes / differences.shape[1])
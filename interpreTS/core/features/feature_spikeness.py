@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalMomentFeature
 
 def calculate_spikeness(data):
     """
@@ -53,3 +54,117 @@ def calculate_spikeness(data):
         print(f"Warning: {original_length - len(data)} NaN values were dropped for spikeness calculation.")
 
     return spikeness
+
+
+def calculate_spikeness_batch(windows):
+    """
+    Calculate the spikeness (skewness) of every window of a 2-D window matrix.
+
+    NaN values are skipped and the adjusted Fisher-Pearson coefficient is used,
+    matching `calculate_spikeness` (pd.Series.skew).
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the spikeness of each window.
+        Windows with fewer than three valid values yield NaN.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_spikeness_batch(np.array([[1, 2, 3, 4, 5], [1, 1, 1, 1, 10]]))
+    array([0.        , 2.23606798])
+    """
+    mask = np.isnan(windows)
+    count = (~mask).sum(axis=1)
+    values = np.where(mask, 0.0, windows)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = values.sum(axis=1) / count
+        adjusted = np.where(mask, 0.0, values - mean[:, None])
+        adjusted2 = adjusted ** 2
+        m2 = adjusted2.sum(axis=1)
+        m3 = (adjusted2 * adjusted).sum(axis=1)
+
+        # Treat floating point noise as zero, as pandas does
+        m2 = np.where(np.abs(m2) < 1e-14, 0.0, m2)
+        m3 = np.where(np.abs(m3) < 1e-14, 0.0, m3)
+        spikeness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+
+    spikeness = np.where(m2 == 0, 0.0, spikeness)
+    spikeness[count < 3] = np.nan
+
+    # Overlapping windows share their NaN values, so the windows are counted instead of the values
+    affected = int(mask.any(axis=1).sum())
+    if affected:
+        print(f"Warning: NaN values were dropped for spikeness calculation in {affected} windows.")
+
+    return spikeness
+
+
+def calculate_spikeness_rolling(moments):
+    """
+    Calculate the spikeness (skewness) of every sliding window from precomputed rolling moments.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of a series without NaN values (see `interpreTS.utils.rolling_moments`).
+
+    Returns
+    -------
+    np.ndarray
+        An array with the spikeness of each window. Windows shorter than three points yield NaN.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_spikeness_rolling(RollingMoments(np.array([1., 1., 1., 1., 10., 1.]), window_size=5))
+    array([2.23606798, 2.23606798])
+    """
+    count = moments.window_size
+    if count < 3:
+        return np.full_like(moments.mean, np.nan)
+
+    # Treat floating point noise as zero, as pandas does
+    m2 = np.where(moments.constant | (np.abs(moments.m2) < 1e-14), 0.0, moments.m2)
+    m3 = np.where(np.abs(moments.m3) < 1e-14, 0.0, moments.m3)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spikeness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+
+    return np.where(m2 == 0, 0.0, spikeness)
+
+
+class IncrementalSpikeness(IncrementalMomentFeature):
+    """
+    Spikeness (skewness) of the sliding window of a stream, updated in O(1) per value.
+
+    Examples
+    --------
+    >>> state = IncrementalSpikeness(window_size=5)
+    >>> for new in [1., 1., 1., 1., 10.]:
+    ...     state.update(new)
+    >>> round(state.value(), 8)
+    2.23606798
+    """
+
+    def value(self):
+        count = self.window_size
+        if count < 3:
+            return np.nan
+
+        # Treat floating point noise as zero, as pandas does
+        m2 = self.moments.m2
+        m3 = self.moments.m3
+        m2 = 0.0 if abs(m2) < 1e-14 else m2
+        m3 = 0.0 if abs(m3) < 1e-14 else m3
+        if m2 == 0:
+            return 0.0
+        return (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
@@ -1,8 +1,8 @@
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.stattools import acf
+from ...utils.autocorrelation import batch_acf
 
-def calculate_stability(data, max_lag=None):
+def calculate_stability(data, max_lag=None, context=None):
     """
     Calculate the stability of a time series based on autocorrelation.
 
@@ -13,6 +13,8 @@ def calculate_stability(data, max_lag=None):
     max_lag : int, optional
         The maximum number of lags to consider for autocorrelation.
         If None, it will be set to `min(12, len(data) - 1)`.
+    context : WindowContext, optional
+        Shared intermediates of the window; if given, its autocorrelation function is reused.
 
     Returns
     -------
@@ -53,24 +55,93 @@ def calculate_stability(data, max_lag=None):
     if data.var() == 0:
         return 1.0
 
-    try:
-        # Calculate the autocorrelation of the data up to the max lag
-        autocorr_values = acf(data, nlags=max_lag, fft=True)
+    # Calculate the autocorrelation of the data up to the max lag
+    if context is not None:
+        autocorr_values = context.acf(max_lag)
+    else:
+        autocorr_values = batch_acf(data.to_numpy(dtype=np.float64)[np.newaxis, :], max_lag)[0]
 
-        # Exclude the first autocorrelation (lag 0) as it is always 1
-        autocorr_values = autocorr_values[1:]
+    return float(_stability_from_acf(autocorr_values[np.newaxis, :])[0])
 
-        # Calculate stability based on variance of autocorrelation values at higher lags
-        mean_autocorr = np.mean(np.abs(autocorr_values))
-        variance_autocorr = np.var(autocorr_values)
+def calculate_stability_batch(windows, max_lag=None):
+    """
+    Calculate the stability of every row of a (n_windows, window_size) array.
 
-        # Combine mean and variance to get a measure of stability
-        stability_strength = 1 - (mean_autocorr + variance_autocorr) / 2
-        stability_strength = max(0, min(stability_strength, 1))  # Ensure result is within [0, 1]
+    The autocorrelations of all windows are calculated at once with `batch_acf`.
 
-        return stability_strength
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+    max_lag : int, optional
+        The maximum number of lags to consider for autocorrelation.
+        If None, it will be set to `min(12, window_size - 1)`.
 
-    except Exception as e:
-        # Log unexpected exceptions and return NaN
-        print(f"Error calculating stability: {e}")
-        return np.nan
+    Returns
+    -------
+    np.ndarray
+        The stability strength of each window.
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    n_windows, window_size = windows.shape
+
+    if max_lag is None:
+        max_lag = min(12, window_size - 1)
+
+    # Handle insufficient data
+    if window_size <= max_lag or max_lag < 1:
+        return np.full(n_windows, np.nan)
+
+    # Windows with zero variance are perfectly stable
+    constant = np.all(windows == windows[:, :1], axis=1)
+    return np.where(constant, 1.0, _stability_from_acf(batch_acf(windows, max_lag)))
+
+def calculate_stability_rolling(moments, max_lag=None):
+    """
+    Calculate the stability of all overlapping windows of a series.
+
+    The autocovariances of every window are obtained from running sums of lagged products
+    (see `RollingMoments.autocovariance`), so each window costs O(max_lag).
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments describing the windows of the series.
+    max_lag : int, optional
+        The maximum number of lags to consider for autocorrelation.
+        If None, it will be set to `min(12, window_size - 1)`.
+
+    Returns
+    -------
+    np.ndarray
+        The stability strength of each window.
+    """
+    window_size = moments.window_size
+    if max_lag is None:
+        max_lag = min(12, window_size - 1)
+
+    # Handle insufficient data
+    if window_size <= max_lag or max_lag < 1:
+        return np.full(len(moments.constant), np.nan)
+
+    autocovariance = moments.autocovariance(max_lag)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        autocorr_values = autocovariance / autocovariance[:, :1]
+
+    # Windows with zero variance are perfectly stable
+    return np.where(moments.constant, 1.0, _stability_from_acf(autocorr_values))
+
+def _stability_from_acf(autocorr_values):
+    """
+    Combine the autocorrelations of every row, excluding lag 0, into a stability strength.
+    """
+    # Exclude the first autocorrelation (lag 0) as it is always 1
+    autocorr_values = autocorr_values[:, 1:]
+
+    # Combine the mean and variance of the autocorrelation values at higher lags
+    mean_autocorr = np.mean(np.abs(autocorr_values), axis=1)
+    variance_autocorr = np.var(autocorr_values, axis=1)
+    stability_strength = 1 - (mean_autocorr + variance_autocorr) / 2
+
+    # Ensure result is within [0, 1], with undefined autocorrelations mapped to 0
+    return np.where(np.isnan(stability_strength), 0.0, np.clip(stability_strength, 0.0, 1.0))
@@ -35,3 +35,29 @@ def calculate_std_1st_der(data):
 
     # Calculate and return the standard deviation of the first derivative
     return np.std(np.gradient(data))
+
+
+def calculate_std_1st_der_batch(windows):
+    """
+    Calculate the standard deviation of the first derivative of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the standard deviation of the first derivative.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_std_1st_der_batch(np.array([[1, 2, 3, 4, 5], [1, 2, 4, 8, 16]]))
+    array([0.        , 2.69072481])
+    """
+    n_windows, window_size = windows.shape
+    if window_size == 1:
+        return np.zeros(n_windows)
+    return np.std(np.gradient(windows, axis=1), axis=1)
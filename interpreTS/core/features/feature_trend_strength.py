@@ -1,8 +1,7 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import linregress
 
-def calculate_trend_strength(data):
+def calculate_trend_strength(data, context=None):
     """
     Calculate the strength of the trend in a time series using linear regression.
 
@@ -10,19 +9,27 @@ def calculate_trend_strength(data):
     ----------
     data : pd.Series or np.ndarray
         The time series data for which the trend strength is to be calculated.
-        
+    context : WindowContext, optional
+        Shared intermediates of the window; if given, its float values are reused.
+
     Returns
     -------
     float
         The R-squared value representing the strength of the trend (0 to 1).
-        
+
     Raises
     ------
     TypeError
         If the data is not a valid time series type.
     ValueError
         If the data contains NaN values or is empty.
-        
+
+    Notes
+    -----
+    The R-squared of a least-squares line fitted against the index is computed in closed form as
+    R^2 = Sxy^2 / (Sxx * Syy), where Sxx = n (n^2 - 1) / 12. A constant series has no trend
+    and yields 0.0.
+
     Examples
     --------
     >>> import pandas as pd
@@ -30,18 +37,82 @@ def calculate_trend_strength(data):
     >>> calculate_trend_strength(data)
     1.0
     """
-    
+
     # Handle empty or insufficient data by returning NaN
     if len(data) < 2:
         return np.nan
-    
-    # Generate an index as a proxy for time
-    x = np.arange(len(data))
-    
-    # Fit a linear regression and calculate the R-squared value
-    slope, intercept, r_value, p_value, std_err = linregress(x, data)
-    
-    # R-squared value as trend strength
-    trend_strength = r_value ** 2
-    
-    return trend_strength
+
+    values = context.values if context is not None else np.asarray(data, dtype=np.float64)
+
+    # R-squared value of a linear fit against the index as trend strength
+    return float(calculate_trend_strength_batch(values[np.newaxis, :])[0])
+
+def calculate_trend_strength_batch(windows):
+    """
+    Calculate the trend strength of every row of a (n_windows, window_size) array.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+
+    Returns
+    -------
+    np.ndarray
+        The R-squared value of each window; NaN for windows shorter than 2 values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_trend_strength_batch(np.array([[1, 2, 3], [3, 2, 1], [1, 1, 1]]))
+    array([1., 1., 0.])
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    n = windows.shape[1]
+    if n < 2:
+        return np.full(len(windows), np.nan)
+
+    positions = np.arange(n) - (n - 1) / 2
+    centered = windows - windows.mean(axis=1, keepdims=True)
+    sxy = centered @ positions
+    syy = np.einsum("ij,ij->i", centered, centered)
+    return _r_squared(sxy, syy, n)
+
+def calculate_trend_strength_rolling(moments):
+    """
+    Calculate the trend strength of all overlapping windows of a series in O(1) per window.
+
+    Sxy and Syy of every window are obtained from running sums of y, y^2 and i*y (see
+    `RollingMoments.index_moment` and `RollingMoments.m2`), so no window is fitted individually.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments describing the windows of the series.
+
+    Returns
+    -------
+    np.ndarray
+        The R-squared value of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_trend_strength_rolling(RollingMoments(np.array([1., 2., 3., 3., 3.]), window_size=3))
+    array([1.  , 0.75, 0.  ])
+    """
+    n = moments.window_size
+    if n < 2:
+        return np.full(len(moments.mean), np.nan)
+
+    # Constant windows are detected exactly, as rounding may leave a tiny positive m2
+    return np.where(moments.constant, 0.0, _r_squared(moments.index_moment, moments.m2, n))
+
+def _r_squared(sxy, syy, n):
+    """
+    Calculate R^2 = Sxy^2 / (Sxx * Syy) of a fit against the index, with 0.0 for constant windows.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.minimum(sxy ** 2 / (n * (n ** 2 - 1) / 12 * syy), 1.0)
+    return np.where(syy == 0, 0.0, r_squared)
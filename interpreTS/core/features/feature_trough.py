@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+import warnings
+from ...utils.incremental import IncrementalFeature, SlidingExtremum
 
 def calculate_trough(data, start=None, end=None):
     """
@@ -43,5 +45,96 @@ def calculate_trough(data, start=None, end=None):
         start = 0
     data = data[start:end]
 
+    # Skip NaN values in arrays the same way pd.Series.min() does
+    if isinstance(data, np.ndarray):
+        data = data[~np.isnan(data)]
+
     # Calculate and return the minimum, handling empty series by returning NaN
     return data.min() if len(data) > 0 else np.nan
+
+
+def calculate_trough_batch(windows, start=None, end=None):
+    """
+    Calculate the local minimum of every window of a 2-D window matrix.
+
+    NaN values are skipped, consistent with `calculate_trough` on a pd.Series.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    start : int or None, optional
+        The starting position within each window. If None, windows start from the beginning.
+    end : int or None, optional
+        The ending position within each window. If None, windows end at the last value.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the minimum of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> windows = np.array([[1, 2, 5, 4, 3], [3, np.nan, 1, 0, 2]])
+    >>> calculate_trough_batch(windows)
+    array([1., 0.])
+    >>> calculate_trough_batch(windows, start=1, end=3)
+    array([2., 1.])
+    """
+    windows = windows[:, start:end]
+    if windows.shape[1] == 0:
+        return np.full(windows.shape[0], np.nan)
+
+    with warnings.catch_warnings():
+        # All-NaN windows yield NaN, as pd.Series.min() does
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmin(windows, axis=1)
+
+
+class IncrementalTrough(IncrementalFeature):
+    """
+    The local minimum of the sliding window of a stream, maintained with a monotonic deque in
+    amortized O(1) per value.
+
+    NaN values are skipped, consistent with `calculate_trough` on a pd.Series.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    start : None
+        Only whole windows are supported; kept for signature compatibility.
+    end : None
+        Only whole windows are supported; kept for signature compatibility.
+
+    Raises
+    ------
+    ValueError
+        If `start` or `end` is given.
+
+    Examples
+    --------
+    >>> state = IncrementalTrough(window_size=3)
+    >>> for new, evicted in [(1., None), (5., None), (2., None), (3., 1.), (4., 5.)]:
+    ...     state.update(new, evicted)
+    >>> state.value()
+    2.0
+    """
+
+    handles_nan = True
+
+    def __init__(self, window_size, start=None, end=None):
+        if start is not None or end is not None:
+            raise ValueError("Incremental trough supports whole windows only.")
+        super().__init__(window_size)
+        self._extremum = SlidingExtremum(window_size, maximum=False)
+
+    def update(self, new, evicted=None):
+        self._extremum.update(new)
+
+    def value(self):
+        return self._extremum.value
+
+    def reset(self, window):
+        self._extremum.reset(window)
@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
+from ...utils.incremental import IncrementalMomentFeature
 
-def calculate_variance(data, ddof=0):
+def calculate_variance(data, ddof=0, context=None):
     """
     Calculate the variance value of a time series with specified degrees of freedom.
     
@@ -12,6 +13,8 @@ def calculate_variance(data, ddof=0):
     ddof : int, optional
         Delta degrees of freedom. The divisor used in calculations is N - ddof, where N is the number of elements. 
         A ddof of 1 provides the sample variance, and a ddof of 0 provides the population variance. Default is 1.
+    context : WindowContext, optional
+        Shared intermediates of the window; if given, its variance is reused.
         
     Returns
     -------
@@ -46,4 +49,94 @@ def calculate_variance(data, ddof=0):
         return 0.0
 
     # Calculate and return the variance with specified ddof, handling empty series by returning NaN
-    return np.var(data, ddof=ddof) if len(data) > 0 else np.nan
\ No newline at end of file
+    if len(data) == 0:
+        return np.nan
+    return context.variance(ddof) if context is not None else np.var(data, ddof=ddof)
+
+
+def calculate_variance_batch(windows, ddof=0):
+    """
+    Calculate the variance of every window of a 2-D window matrix.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        Array of shape (n_windows, window_size) with one window per row.
+    ddof : int, optional
+        Delta degrees of freedom, as in `calculate_variance` (default is 0).
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_windows,) with the variance of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> calculate_variance_batch(np.array([[2, 4, 6, 8, 10], [1, 1, 1, 1, 1]]))
+    array([8., 0.])
+    """
+    n_windows, window_size = windows.shape
+    if window_size == 1:
+        return np.zeros(n_windows)
+    if window_size == 0:
+        return np.full(n_windows, np.nan)
+    return np.var(windows, axis=1, ddof=ddof)
+
+
+def calculate_variance_rolling(moments, ddof=0):
+    """
+    Calculate the variance of every sliding window from precomputed rolling moments.
+
+    Parameters
+    ----------
+    moments : RollingMoments
+        Rolling moments of the series (see `interpreTS.utils.rolling_moments`).
+    ddof : int, optional
+        Delta degrees of freedom, as in `calculate_variance` (default is 0).
+
+    Returns
+    -------
+    np.ndarray
+        An array with the variance of each window.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from interpreTS.utils.rolling_moments import RollingMoments
+    >>> calculate_variance_rolling(RollingMoments(np.array([2., 4., 6., 8., 10.]), window_size=3))
+    array([2.66666667, 2.66666667, 2.66666667])
+    """
+    if moments.window_size == 1:
+        return np.zeros_like(moments.mean)
+    return np.where(moments.constant, 0.0, moments.m2 / (moments.window_size - ddof))
+
+
+class IncrementalVariance(IncrementalMomentFeature):
+    """
+    Variance of the sliding window of a stream, updated in O(1) per value.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    ddof : int, optional
+        Delta degrees of freedom, as in `calculate_variance` (default is 0).
+
+    Examples
+    --------
+    >>> state = IncrementalVariance(window_size=3)
+    >>> for new, evicted in [(2., None), (4., None), (6., None), (8., 2.)]:
+    ...     state.update(new, evicted)
+    >>> round(state.value(), 8)
+    2.66666667
+    """
+
+    def __init__(self, window_size, ddof=0):
+        super().__init__(window_size)
+        self.ddof = ddof
+
+    def value(self):
+        if self.window_size == 1:
+            return 0.0
+        return self.moments.m2 / (self.window_size - self.ddof)
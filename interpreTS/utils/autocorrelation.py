@@ -0,0 +1,260 @@
+import numpy as np
+
+# Up to this many lags the autocovariances are summed directly, which is faster than the FFT
+DIRECT_ACF_MAX_LAGS = 32
+
+def batch_acf(windows, max_lag, max_block_elements=2**22):
+    """
+    Calculate the autocorrelation function of every row of a (n_windows, window_size) array.
+
+    Each row is demeaned and the autocovariances of all rows are obtained at once: for up to
+    `DIRECT_ACF_MAX_LAGS` lags as direct lagged products, otherwise with a single batched real
+    FFT of the zero-padded rows (Wiener-Khinchin theorem). The result matches
+    `statsmodels.tsa.stattools.acf(row, nlags=max_lag, fft=True)` for every row.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        A 2D array with one window per row.
+    max_lag : int
+        The maximum lag to calculate. Lags beyond `window_size - 1` are not returned.
+    max_block_elements : int, optional
+        Upper bound on the number of padded elements transformed at once, which bounds the
+        memory used for many windows (default is 2**22).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_windows, min(max_lag, window_size - 1) + 1) with the autocorrelations
+        for lags 0 to `max_lag`. Rows with zero variance or NaN values yield NaN.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> batch_acf(np.array([[1., 2., 3., 4.]]), max_lag=2)
+    array([[ 1.  ,  0.25, -0.3 ]])
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    n_windows, window_size = windows.shape
+    n_lags = min(max_lag, window_size - 1) + 1
+    if window_size == 0 or n_lags < 1:
+        return np.empty((n_windows, 0))
+
+    # Padding to at least 2 * window_size - 1 avoids circular wrap-around of the correlation
+    n_fft = 1 << (2 * window_size - 2).bit_length()
+    block_size = max(1, max_block_elements // n_fft)
+
+    result = np.empty((n_windows, n_lags))
+    for start in range(0, n_windows, block_size):
+        block = windows[start:start + block_size]
+        centered = block - block.mean(axis=1, keepdims=True)
+        if n_lags <= DIRECT_ACF_MAX_LAGS:
+            autocovariance = _lagged_products(centered, n_lags)
+        else:
+            spectrum = np.fft.rfft(centered, n=n_fft, axis=1)
+            autocovariance = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=n_fft, axis=1)[:, :n_lags]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[start:start + block_size] = autocovariance / autocovariance[:, :1]
+    return result
+
+def _lagged_products(centered, n_lags):
+    """
+    Sum the products of every row with itself shifted by each lag from 0 to `n_lags - 1`.
+    """
+    window_size = centered.shape[1]
+    autocovariance = np.empty((len(centered), n_lags))
+    for lag in range(n_lags):
+        autocovariance[:, lag] = np.einsum("ij,ij->i", centered[:, :window_size - lag], centered[:, lag:])
+    return autocovariance
+
+def centered_autocovariance(products, total, head_sums, tail_sums, window_size):
+    """
+    Convert raw lagged products of windows into sums of products of deviations from the mean.
+
+    For lag k, sum((x[i] - m) * (x[i + k] - m)) = P_k - m * (A_k + B_k) + (n - k) * m^2, where P_k
+    is the sum of x[i] * x[i + k], A_k the sum of all but the last k values and B_k the sum of
+    all but the first k values. Shifting all values by a constant does not change the result,
+    so the inputs may be computed from shifted values.
+
+    Parameters
+    ----------
+    products : np.ndarray
+        Array of shape (..., n_lags) with the raw lagged products P_k of every window.
+    total : np.ndarray or float
+        The sum of every window, with shape (...).
+    head_sums : np.ndarray
+        Array of shape (..., n_lags) with the sums of the first k values of every window.
+    tail_sums : np.ndarray
+        Array of shape (..., n_lags) with the sums of the last k values of every window.
+    window_size : int
+        Number of values in each window.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (..., n_lags) with the centered autocovariances (unnormalized).
+    """
+    total = np.asarray(total, dtype=np.float64)[..., np.newaxis]
+    mean = total / window_size
+    lags = np.arange(products.shape[-1])
+    return products - mean * (2 * total - head_sums - tail_sums) + (window_size - lags) * mean ** 2
+
+class SlidingAutocorrelation:
+    """
+    Autocorrelation function of the last `window_size` values of a stream, updated incrementally.
+
+    Each new value adds the products x_new * x[-k] and evicts the products x_old * x[k] of the
+    oldest value for every lag k, so an update costs O(max_lag) instead of a correlation of
+    the whole window. To bound the accumulated rounding error, the sums are recomputed from the
+    buffered window every `resync_every` updates, which keeps the amortized cost at O(max_lag).
+
+    Attributes
+    ----------
+    window_size : int
+        Number of most recent values the autocorrelation is calculated over.
+    max_lag : int
+        The maximum lag to calculate.
+    resync_every : int
+        Number of incremental updates between exact recomputations of the sums.
+    """
+
+    def __init__(self, window_size, max_lag, resync_every=None):
+        """
+        Initialize an empty accumulator.
+
+        Parameters
+        ----------
+        window_size : int
+            Number of most recent values the autocorrelation is calculated over.
+        max_lag : int
+            The maximum lag to calculate. Lags beyond `window_size - 1` are not returned.
+        resync_every : int, optional
+            Number of incremental updates between exact recomputations of the sums
+            (default is `window_size`).
+        """
+        if window_size < 1:
+            raise ValueError("Window size must be a positive integer.")
+
+        self.window_size = window_size
+        self.max_lag = max_lag
+        self.resync_every = resync_every if resync_every is not None else window_size
+        self._n_lags = min(max_lag, window_size - 1) + 1
+        self._lags = np.arange(self._n_lags)
+        self._buffer = np.empty(window_size, dtype=np.float64)
+        self._count = 0
+        self._position = 0
+        self._n_nan = 0
+        self._stale = True
+        self._updates = 0
+        self._shift = 0.0
+        self._total = 0.0
+        self._products = np.zeros(self._n_lags)
+
+    @property
+    def is_full(self):
+        """bool: Whether `window_size` values have been received."""
+        return self._count == self.window_size
+
+    @property
+    def window(self):
+        """np.ndarray: The buffered values, oldest first."""
+        if not self.is_full:
+            return self._buffer[:self._count].copy()
+        return np.roll(self._buffer, -self._position)
+
+    def update(self, value):
+        """
+        Append a value to the stream, evicting the oldest value once the window is full.
+
+        Parameters
+        ----------
+        value : float
+            The new value.
+        """
+        value = float(value)
+        window_size = self.window_size
+
+        if not self.is_full:
+            self._buffer[self._count] = value
+            self._count += 1
+            self._n_nan += int(np.isnan(value))
+            self._position = self._count % window_size
+            self._stale = True
+            return
+
+        position = self._position
+        evicted = self._buffer[position]
+        self._n_nan += int(np.isnan(value)) - int(np.isnan(evicted))
+
+        if not self._stale and self._n_nan == 0 and self._updates < self.resync_every:
+            lags = self._lags
+            shifted_new = value - self._shift
+            shifted_old = evicted - self._shift
+            # x[k] of the current window and x[-k] of the new window (x_new itself for k = 0)
+            heads = self._buffer[(position + lags) % window_size] - self._shift
+            tails = self._buffer[(position - lags) % window_size] - self._shift
+            tails[0] = shifted_new
+            self._products += shifted_new * tails - shifted_old * heads
+            self._total += shifted_new - shifted_old
+            self._updates += 1
+        else:
+            self._stale = True
+
+        self._buffer[position] = value
+        self._position = (position + 1) % window_size
+
+    def extend(self, values):
+        """
+        Append several values to the stream at once.
+
+        The buffered window is replaced in bulk and the sums are recomputed on the next call
+        to `acf`, which is cheaper than updating them value by value for long chunks.
+
+        Parameters
+        ----------
+        values : array-like
+            The new values, oldest first.
+        """
+        window = np.concatenate((self.window, np.asarray(values, dtype=np.float64)))[-self.window_size:]
+        self._buffer[:len(window)] = window
+        self._count = len(window)
+        self._position = self._count % self.window_size
+        self._n_nan = int(np.isnan(window).sum())
+        self._stale = True
+
+    def acf(self):
+        """
+        Calculate the autocorrelation function of the current window.
+
+        Returns
+        -------
+        np.ndarray
+            Autocorrelation values for lags 0 to `min(max_lag, window_size - 1)`. NaN values are
+            returned while the window is not full, or if it has zero variance or NaN values.
+        """
+        if not self.is_full or self._n_nan > 0:
+            return np.full(self._n_lags, np.nan)
+        if self._stale or self._updates >= self.resync_every:
+            self._resync()
+
+        # Only the first and last max_lag values of the window are needed, oldest first
+        lags = self._lags[:-1]
+        head = self._buffer[(self._position + lags) % self.window_size] - self._shift
+        tail = self._buffer[(self._position - 1 - lags) % self.window_size] - self._shift
+        head_sums = np.concatenate(([0.0], np.cumsum(head)))
+        tail_sums = np.concatenate(([0.0], np.cumsum(tail)))
+        autocovariance = centered_autocovariance(self._products, self._total, head_sums, tail_sums, self.window_size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return autocovariance / autocovariance[0]
+
+    def _resync(self):
+        """
+        Recompute the lagged products of the window exactly, shifted by the window mean.
+        """
+        window = self.window
+        self._shift = window.mean()
+        shifted = window - self._shift
+        self._total = shifted.sum()
+        self._products = np.array([shifted[:len(shifted) - lag] @ shifted[lag:] for lag in range(self._n_lags)])
+        self._stale = False
+        self._updates = 0
@@ -1,32 +1,34 @@
 from .feature_loader import Features
-from ..core.features.feature_spikeness import calculate_spikeness
-from ..core.features.feature_entropy import calculate_entropy
-from ..core.features.feature_stability import calculate_stability
-from ..core.features.feature_length import calculate_length
-from ..core.features.feature_mean import calculate_mean
-from ..core.features.feature_seasonality_strength import calculate_seasonality_strength
-from ..core.features.feature_variance import calculate_variance
-from ..core.features.feature_peak import calculate_peak
-from ..core.features.feature_trough import calculate_trough
-from ..core.features.feature_heterogeneity import calculate_heterogeneity
-from ..core.features.feature_absolute_energy import calculate_absolute_energy
-from ..core.features.feature_missing_points import calculate_missing_points
+from ..core.features.feature_spikeness import calculate_spikeness, calculate_spikeness_batch, calculate_spikeness_rolling, IncrementalSpikeness
+from ..core.features.feature_entropy import calculate_entropy, calculate_entropy_batch
+from ..core.features.feature_stability import calculate_stability, calculate_stability_batch, calculate_stability_rolling
+from ..core.features.feature_length import calculate_length, calculate_length_batch, IncrementalLength
+from ..core.features.feature_mean import calculate_mean, calculate_mean_batch, calculate_mean_rolling, IncrementalMean
+from ..core.features.feature_seasonality_strength import calculate_seasonality_strength, calculate_seasonality_strength_batch, calculate_seasonality_strength_rolling
+from ..core.features.feature_variance import calculate_variance, calculate_variance_batch, calculate_variance_rolling, IncrementalVariance
+from ..core.features.feature_peak import calculate_peak, calculate_peak_batch, IncrementalPeak
+from ..core.features.feature_trough import calculate_trough, calculate_trough_batch, IncrementalTrough
+from ..core.features.feature_heterogeneity import calculate_heterogeneity, calculate_heterogeneity_batch, calculate_heterogeneity_rolling, IncrementalHeterogeneity
+from ..core.features.feature_absolute_energy import calculate_absolute_energy, calculate_absolute_energy_batch, calculate_absolute_energy_rolling, IncrementalAbsoluteEnergy
+from ..core.features.feature_missing_points import calculate_missing_points, calculate_missing_points_batch, IncrementalMissingPoints
 from ..core.features.feature_distance_to_the_last_change_point import calculate_distance_to_last_trend_change
-from ..core.features.feature_above_9th_decile import calculate_above_9th_decile
-from ..core.features.feature_below_1st_decile import calculate_below_1st_decile
-from ..core.features.feature_binarize_mean import calculate_binarize_mean
-from ..core.features.feature_crossing_points import calculate_crossing_points
-from ..core.features.feature_flat_spots import calculate_flat_spots
-from ..core.features.feature_outliers_iqr import calculate_outliers_iqr
-from ..core.features.feature_outliers_std import calculate_outliers_std
-from ..core.features.feature_std_1st_der import calculate_std_1st_der
+from ..core.features.feature_above_9th_decile import calculate_above_9th_decile, calculate_above_9th_decile_batch, calculate_above_9th_decile_rolling, fit_above_9th_decile, IncrementalAbove9thDecile
+from ..core.features.feature_below_1st_decile import calculate_below_1st_decile, calculate_below_1st_decile_batch, calculate_below_1st_decile_rolling, fit_below_1st_decile, IncrementalBelow1stDecile
+from ..core.features.feature_binarize_mean import calculate_binarize_mean, calculate_binarize_mean_batch, IncrementalBinarizeMean
+from ..core.features.feature_crossing_points import calculate_crossing_points, calculate_crossing_points_batch, IncrementalCrossingPoints
+from ..core.features.feature_flat_spots import calculate_flat_spots, calculate_flat_spots_batch, calculate_flat_spots_rolling
+from ..core.features.feature_outliers_iqr import calculate_outliers_iqr, calculate_outliers_iqr_batch, calculate_outliers_iqr_rolling, fit_outliers_iqr, IncrementalOutliersIqr
+from ..core.features.feature_outliers_std import calculate_outliers_std, calculate_outliers_std_batch, calculate_outliers_std_rolling, fit_outliers_std, IncrementalOutliersStd
+from ..core.features.feature_std_1st_der import calculate_std_1st_der, calculate_std_1st_der_batch
 from ..core.features.feature_histogram_dominant import calculate_dominant
 from ..core.features.feature_mean_change import calculate_mean_change
-from ..core.features.feature_trend_strength import calculate_trend_strength
-from ..core.features.feature_significant_changes import calculate_significant_changes
+from ..core.features.feature_trend_strength import calculate_trend_strength, calculate_trend_strength_batch, calculate_trend_strength_rolling
+from ..core.features.feature_significant_changes import calculate_significant_changes, calculate_significant_changes_batch
 from ..core.features.feature_variability_in_sub_periods import calculate_variability_in_sub_periods
 from ..core.features.feature_variance_change import calculate_change_in_variance
-from ..core.features.feature_linearity import calculate_linearity
+from ..core.features.feature_linearity import calculate_linearity, calculate_linearity_batch, calculate_linearity_rolling
+from ..core.features.feature_approximate_entropy import calculate_approximate_entropy
+from ..core.features.feature_sample_entropy import calculate_sample_entropy
 
 def load_metadata():
     return {
@@ -141,6 +143,14 @@ def load_metadata():
         Features.LINEARITY:{
             'level': 'moderate',
             'description': 'Measure of how well the time series can be approximated by a linear trend, quantified using the R-squared value from linear regression.'
+        },
+        Features.APPROXIMATE_ENTROPY: {
+            'level': 'advanced',
+            'description': 'Approximate entropy, measuring the regularity of the signal; lower values indicate more repetitive patterns.'
+        },
+        Features.SAMPLE_ENTROPY: {
+            'level': 'advanced',
+            'description': 'Sample entropy, the negative logarithm of the probability that similar patterns remain similar at the next point, excluding self-matches.'
         }
     } 
 
@@ -202,9 +212,149 @@ def load_feature_functions():
             Features.SIGNIFICANT_CHANGES: calculate_significant_changes,
             Features.VARIABILITY_IN_SUB_PERIODS: calculate_variability_in_sub_periods,
             Features.CHANGE_IN_VARIANCE: calculate_change_in_variance,
-            Features.LINEARITY: calculate_linearity
+            Features.LINEARITY: calculate_linearity,
+            Features.APPROXIMATE_ENTROPY: calculate_approximate_entropy,
+            Features.SAMPLE_ENTROPY: calculate_sample_entropy
+        }
+
+def load_batch_feature_functions():
+    """
+    Load the batch kernels of features that can be computed for many windows at once.
+
+    Each kernel takes an array of shape (n_windows, window_size) together with the same
+    parameters as its per-window function and returns an array of shape (n_windows,).
+
+    Returns
+    -------
+    dict
+        A dictionary mapping feature names to their batch kernels.
+    """
+    return {
+            Features.LENGTH: calculate_length_batch,
+            Features.MEAN: calculate_mean_batch,
+            Features.VARIANCE: calculate_variance_batch,
+            Features.SPIKENESS: calculate_spikeness_batch,
+            Features.PEAK: calculate_peak_batch,
+            Features.TROUGH: calculate_trough_batch,
+            Features.HETEROGENEITY: calculate_heterogeneity_batch,
+            Features.ABSOLUTE_ENERGY: calculate_absolute_energy_batch,
+            Features.MISSING_POINTS: calculate_missing_points_batch,
+            Features.ABOVE_9TH_DECILE: calculate_above_9th_decile_batch,
+            Features.BELOW_1ST_DECILE: calculate_below_1st_decile_batch,
+            Features.BINARIZE_MEAN: calculate_binarize_mean_batch,
+            Features.CROSSING_POINTS: calculate_crossing_points_batch,
+            Features.FLAT_SPOTS: calculate_flat_spots_batch,
+            Features.LINEARITY: calculate_linearity_batch,
+            Features.TREND_STRENGTH: calculate_trend_strength_batch,
+            Features.STABILITY: calculate_stability_batch,
+            Features.SEASONALITY_STRENGTH: calculate_seasonality_strength_batch,
+            Features.ENTROPY: calculate_entropy_batch,
+            Features.OUTLIERS_IQR: calculate_outliers_iqr_batch,
+            Features.OUTLIERS_STD: calculate_outliers_std_batch,
+            Features.STD_1ST_DER: calculate_std_1st_der_batch,
+            Features.SIGNIFICANT_CHANGES: calculate_significant_changes_batch
+        }
+
+def load_rolling_feature_functions():
+    """
+    Load the rolling kernels of features that can be updated in O(1) per window step.
+
+    Each kernel takes a `RollingMoments` instance describing all overlapping windows of a
+    series together with the same parameters as its per-window function.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping feature names to their rolling kernels.
+    """
+    return {
+            Features.MEAN: calculate_mean_rolling,
+            Features.VARIANCE: calculate_variance_rolling,
+            Features.ABSOLUTE_ENERGY: calculate_absolute_energy_rolling,
+            Features.HETEROGENEITY: calculate_heterogeneity_rolling,
+            Features.SPIKENESS: calculate_spikeness_rolling,
+            Features.ABOVE_9TH_DECILE: calculate_above_9th_decile_rolling,
+            Features.BELOW_1ST_DECILE: calculate_below_1st_decile_rolling,
+            Features.OUTLIERS_STD: calculate_outliers_std_rolling,
+            Features.OUTLIERS_IQR: calculate_outliers_iqr_rolling,
+            Features.FLAT_SPOTS: calculate_flat_spots_rolling,
+            Features.LINEARITY: calculate_linearity_rolling,
+            Features.TREND_STRENGTH: calculate_trend_strength_rolling,
+            Features.STABILITY: calculate_stability_rolling,
+            Features.SEASONALITY_STRENGTH: calculate_seasonality_strength_rolling
         }
     
+def load_incremental_feature_states():
+    """
+    Load the incremental states of features that can be updated in O(1) per streamed value.
+
+    Each state is an `IncrementalFeature` subclass constructed with the window size and the same
+    parameters as its per-window function; it raises ValueError for parameters it does not support.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping feature names to their incremental state classes.
+    """
+    return {
+            Features.LENGTH: IncrementalLength,
+            Features.MEAN: IncrementalMean,
+            Features.VARIANCE: IncrementalVariance,
+            Features.ABSOLUTE_ENERGY: IncrementalAbsoluteEnergy,
+            Features.HETEROGENEITY: IncrementalHeterogeneity,
+            Features.SPIKENESS: IncrementalSpikeness,
+            Features.PEAK: IncrementalPeak,
+            Features.TROUGH: IncrementalTrough,
+            Features.MISSING_POINTS: IncrementalMissingPoints,
+            Features.BINARIZE_MEAN: IncrementalBinarizeMean,
+            Features.CROSSING_POINTS: IncrementalCrossingPoints,
+            Features.ABOVE_9TH_DECILE: IncrementalAbove9thDecile,
+            Features.BELOW_1ST_DECILE: IncrementalBelow1stDecile,
+            Features.OUTLIERS_STD: IncrementalOutliersStd,
+            Features.OUTLIERS_IQR: IncrementalOutliersIqr
+        }
+
+def load_reference_statistics_functions():
+    """
+    Load the functions computing the training-data statistics of features that compare windows
+    against a reference (training) dataset.
+
+    Each function takes the training data and returns a dictionary of parameters that can be
+    passed to the feature (and its kernels) in place of `training_data`.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping feature names to their reference statistics functions.
+    """
+    return {
+            Features.ABOVE_9TH_DECILE: fit_above_9th_decile,
+            Features.BELOW_1ST_DECILE: fit_below_1st_decile,
+            Features.OUTLIERS_IQR: fit_outliers_iqr,
+            Features.OUTLIERS_STD: fit_outliers_std
+        }
+
+def load_feature_dependencies():
+    """
+    Load the shared window intermediates that each feature depends on.
+
+    Features listed here accept a `context` keyword argument with the `WindowContext` of the
+    window, from which the listed intermediates are taken instead of being recomputed.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping feature names to the names of the intermediates they use.
+    """
+    return {
+            Features.VARIANCE: ['variance'],
+            Features.HETEROGENEITY: ['mean', 'std'],
+            Features.SIGNIFICANT_CHANGES: ['diff'],
+            Features.STABILITY: ['acf'],
+            Features.SEASONALITY_STRENGTH: ['acf'],
+            Features.TREND_STRENGTH: ['values']
+        }
+
 def load_validation_requirements():
     return {
             Features.LINEARITY: {
@@ -398,5 +548,17 @@ def load_validation_requirements():
                 "allow_nan": False,
                 "check_one_dimensional": True,
                 "min_length": 2
+            },
+            Features.APPROXIMATE_ENTROPY: {
+                "require_datetime_index": False,
+                "allow_nan": False,
+                "check_one_dimensional": True,
+                "min_length": 2
+            },
+            Features.SAMPLE_ENTROPY: {
+                "require_datetime_index": False,
+                "allow_nan": False,
+                "check_one_dimensional": True,
+                "min_length": 3
             }
         }
\ No newline at end of file
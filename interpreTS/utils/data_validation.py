@@ -69,7 +69,7 @@ def validate_time_series_data(
         if not np.issubdtype(data.dtype, np.number):
             raise TypeError("Data must contain only numeric values.")
         
-        if data.ndim > 1 and not requirements.get('allow_nan', True):
+        if not requirements.get('allow_nan', True):
             if np.isnan(data).any():
                 raise ValueError("Data contains NaN values.")
     
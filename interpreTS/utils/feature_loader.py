@@ -27,6 +27,8 @@ class Features:
     BELOW_1ST_DECILE = 'below_1st_decile'
     ABSOLUTE_ENERGY = 'absolute_energy'
     BINARIZE_MEAN = 'binarize_mean'
+    APPROXIMATE_ENTROPY = 'approximate_entropy'
+    SAMPLE_ENTROPY = 'sample_entropy'
     
 class FeatureLoader:
     
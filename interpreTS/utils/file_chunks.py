@@ -0,0 +1,130 @@
+import os
+
+import pandas as pd
+
+
+def _file_format(path):
+    """
+    Return the format of a data file from its extension.
+    """
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file format: {path}. Supported formats are Parquet ('.parquet', '.pq') and CSV ('.csv').")
+
+
+def _import_parquet():
+    """
+    Import pyarrow, which reads and writes Parquet files.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Parquet files. Install it with `pip install pyarrow`.") from e
+    return pyarrow
+
+
+def read_chunks(paths, columns=None, chunk_size=100_000):
+    """
+    Read data files one chunk of rows at a time.
+
+    Parquet files are read batch by batch from their row groups and CSV files with a chunked
+    reader, so only one chunk of each file is held in memory at once.
+
+    Parameters
+    ----------
+    paths : str, path-like or list of str or path-like
+        The files to read, in order.
+    columns : list of str, optional
+        The columns to read. If None (default), all columns are read.
+    chunk_size : int, optional
+        Maximum number of rows per chunk (default is 100000).
+
+    Yields
+    ------
+    pd.DataFrame
+        The chunks of all files, in order.
+
+    Raises
+    ------
+    ValueError
+        If a file is neither a Parquet nor a CSV file.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        if _file_format(path) == "parquet":
+            pyarrow = _import_parquet()
+            parquet_file = pyarrow.parquet.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+
+
+class ChunkWriter:
+    """
+    Writer appending DataFrames to a Parquet or CSV file, one chunk at a time.
+
+    The schema of a Parquet file is taken from the first chunk, to which the later chunks are
+    converted.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the writer; the file is created with the first chunk.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The output file, whose extension gives its format (Parquet or CSV).
+
+        Raises
+        ------
+        ValueError
+            If the file is neither a Parquet nor a CSV file.
+        """
+        self.path = path
+        self.format = _file_format(path)
+        self.rows = 0
+        self._writer = None
+
+    def write(self, frame):
+        """
+        Append the rows of a DataFrame to the file.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            The rows to append, with the same columns for every chunk.
+        """
+        if self.format == "parquet":
+            pyarrow = _import_parquet()
+            if self._writer is None:
+                table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            else:
+                table = pyarrow.Table.from_pandas(frame, schema=self._writer.schema, preserve_index=False)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        self.rows += len(frame)
+
+    def close(self):
+        """
+        Finish the file. An empty CSV file is created if no rows were written.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self.format == "csv" and not self.rows:
+            open(self.path, "w").close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,304 @@
+import math
+from collections import deque
+
+import numpy as np
+
+# Running sums that have carried more than this multiple of the second moment of the current
+# window have lost too many digits to cancellation, and the state is rebuilt from the window
+MAX_CANCELLATION = 1e4
+
+
+class IncrementalFeature:
+    """
+    Base class of the state of a feature over the sliding window of a stream.
+
+    As each value of a stream enters the window, `update` receives it together with the value
+    it evicts, and `value` returns the feature of the current window, both independently of the
+    window size. Streaming engines periodically call `reset` with the current window to
+    rebuild the state exactly, which bounds the rounding error of running sums, and also
+    whenever `stale` reports that the state has lost accuracy (e.g. after a level shift).
+
+    Attributes
+    ----------
+    window_size : int
+        Number of values in the sliding window.
+    handles_nan : bool
+        Whether `value` matches the per-window feature for windows containing NaN values;
+        otherwise such windows are calculated from the window itself.
+    """
+
+    handles_nan = False
+
+    def __init__(self, window_size):
+        """
+        Initialize the state of an empty window.
+
+        Parameters
+        ----------
+        window_size : int
+            Number of values in the sliding window.
+        """
+        self.window_size = window_size
+
+    def update(self, new, evicted=None):
+        """
+        Update the state with a value entering the window.
+
+        Parameters
+        ----------
+        new : float
+            The value entering the window.
+        evicted : float or None, optional
+            The value leaving the window, or None while the window is not full.
+        """
+        raise NotImplementedError
+
+    def value(self):
+        """
+        Return the feature of the current (full) window.
+        """
+        raise NotImplementedError
+
+    def reset(self, window):
+        """
+        Rebuild the state from the values of the current window.
+
+        Parameters
+        ----------
+        window : np.ndarray
+            The values of the window, oldest first.
+        """
+        raise NotImplementedError
+
+    @property
+    def stale(self):
+        """bool: Whether the state has lost accuracy and should be rebuilt with `reset`."""
+        return False
+
+
+class StreamingMoments:
+    """
+    Count and power sums of the non-NaN values of a sliding window.
+
+    The power sums are taken over values shifted by the mean of the window at the last `reset`,
+    so central moments can be derived without catastrophic cancellation. The mean itself is
+    taken from the running sum of the unshifted values, which is exact for integer data, so
+    comparisons of values against the mean agree with `np.mean`. Constant windows are
+    detected exactly from the length of the trailing run of equal values.
+
+    Values far from the shift, e.g. after a level shift, leave a rounding residue in the sums
+    once they are removed. The squared shifted values added and removed since the last `reset`
+    bound that residue, so `stale` reports when it is no longer negligible.
+    """
+
+    def __init__(self):
+        """
+        Initialize the moments of an empty window.
+        """
+        self.reset(np.empty(0))
+
+    def update(self, new, evicted=None):
+        """
+        Add the value entering the window and remove the value leaving it.
+
+        Parameters
+        ----------
+        new : float
+            The value entering the window.
+        evicted : float or None, optional
+            The value leaving the window, or None while the window is not full.
+        """
+        self._run = self._run + 1 if new == self._last else 1
+        self._last = new
+        if not math.isnan(new):
+            if self.count == 0:
+                # Shift the sums of an empty window by its first value
+                self.shift, self.total, self.s1, self.s2, self.s3 = new, 0.0, 0.0, 0.0, 0.0
+                self._magnitude = 0.0
+            self._add(new, 1)
+        if evicted is not None and not math.isnan(evicted):
+            self._add(evicted, -1)
+
+    def reset(self, window):
+        """
+        Recompute the sums exactly from the values of the window.
+
+        Parameters
+        ----------
+        window : np.ndarray
+            The values of the window.
+        """
+        values = np.asarray(window, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.shift = float(values.mean()) if len(values) > 0 else 0.0
+        shifted = values - self.shift
+        self.count = len(values)
+        self.total = float(values.sum())
+        self.s1 = float(shifted.sum())
+        self.s2 = float(np.sum(shifted ** 2))
+        self.s3 = float(np.sum(shifted ** 3))
+        self._magnitude = self.s2
+
+        window = np.asarray(window, dtype=np.float64)
+        self._last = window[-1] if len(window) > 0 else np.nan
+        changes = np.flatnonzero(window != self._last)
+        self._run = len(window) - (changes[-1] + 1 if len(changes) > 0 else 0)
+
+    def _add(self, value, sign):
+        """
+        Add (sign 1) or remove (sign -1) a value from the sums.
+        """
+        shifted = value - self.shift
+        self.count += sign
+        self.total += sign * value
+        self.s1 += sign * shifted
+        self.s2 += sign * shifted ** 2
+        self.s3 += sign * shifted ** 3
+        self._magnitude += shifted ** 2
+
+    @property
+    def mean(self):
+        """float: Mean of the values."""
+        return self.total / self.count
+
+    @property
+    def constant(self):
+        """bool: Whether all values are equal."""
+        return self._run >= self.count > 0
+
+    @property
+    def stale(self):
+        """bool: Whether the rounding residue of the sums is too large for the current window."""
+        return self.count > 0 and not self.constant and self._magnitude > MAX_CANCELLATION * self.m2
+
+    @property
+    def m2(self):
+        """float: Sum of squared deviations from the mean, exactly 0 for constant windows."""
+        if self.constant:
+            return 0.0
+        return max(self.s2 - self.s1 ** 2 / self.count, 0.0)
+
+    @property
+    def m3(self):
+        """float: Sum of cubed deviations from the mean, exactly 0 for constant windows."""
+        if self.constant:
+            return 0.0
+        offset = self.s1 / self.count
+        return self.s3 - 3 * offset * self.s2 + 2 * self.s1 * offset ** 2
+
+    @property
+    def sum_squares(self):
+        """float: Sum of squared values."""
+        return self.s2 + 2 * self.shift * self.s1 + self.count * self.shift ** 2
+
+
+class SlidingExtremum:
+    """
+    Maximum (or minimum) of the non-NaN values of a sliding window using a monotonic deque.
+
+    The deque holds the candidates for the extremum in decreasing (or increasing) order, so
+    each value is pushed and popped at most once and updates take amortized O(1).
+    """
+
+    def __init__(self, window_size, maximum=True):
+        """
+        Initialize the extremum of an empty window.
+
+        Parameters
+        ----------
+        window_size : int
+            Number of values in the sliding window.
+        maximum : bool, optional
+            Whether to track the maximum (default) or the minimum.
+        """
+        self.window_size = window_size
+        self.maximum = maximum
+        self.reset(np.empty(0))
+
+    def update(self, new):
+        """
+        Add the value entering the window, dropping candidates that left it.
+
+        Parameters
+        ----------
+        new : float
+            The value entering the window.
+        """
+        self._index += 1
+        if not math.isnan(new):
+            while self._candidates and (
+                self._candidates[-1][1] <= new if self.maximum else self._candidates[-1][1] >= new
+            ):
+                self._candidates.pop()
+            self._candidates.append((self._index, new))
+        while self._candidates and self._candidates[0][0] <= self._index - self.window_size:
+            self._candidates.popleft()
+
+    def reset(self, window):
+        """
+        Rebuild the candidates from the values of the window.
+
+        Parameters
+        ----------
+        window : np.ndarray
+            The values of the window, oldest first.
+        """
+        self._candidates = deque()
+        self._index = -1
+        for value in window:
+            self.update(float(value))
+
+    @property
+    def value(self):
+        """float: The extremum of the window, or NaN if it has no non-NaN values."""
+        return self._candidates[0][1] if self._candidates else np.nan
+
+
+class IncrementalMomentFeature(IncrementalFeature):
+    """
+    Base class of features derived from the `StreamingMoments` of the window.
+    """
+
+    def __init__(self, window_size):
+        super().__init__(window_size)
+        self.moments = StreamingMoments()
+
+    def update(self, new, evicted=None):
+        self.moments.update(new, evicted)
+
+    def reset(self, window):
+        self.moments.reset(window)
+
+    @property
+    def stale(self):
+        return self.moments.stale
+
+
+class IncrementalFraction(IncrementalFeature):
+    """
+    Base class of features given by the fraction of window values matching a fixed condition.
+
+    The number of matching values is updated with the value entering and the value leaving the
+    window, so subclasses only define `_matches`.
+    """
+
+    def __init__(self, window_size):
+        super().__init__(window_size)
+        self._count = 0
+
+    def _matches(self, value):
+        """
+        Return whether a value (or each value of an array) counts towards the fraction.
+        """
+        raise NotImplementedError
+
+    def update(self, new, evicted=None):
+        self._count += int(self._matches(new))
+        if evicted is not None:
+            self._count -= int(self._matches(evicted))
+
+    def value(self):
+        return self._count / self.window_size
+
+    def reset(self, window):
+        self._count = int(np.count_nonzero(self._matches(np.asarray(window, dtype=np.float64))))
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of the most recent values of a stream.
+
+    Every value is written twice, at its slot and at the slot shifted by the capacity, into a
+    preallocated array of twice the capacity. The buffered values, oldest first, are then
+    always a contiguous slice of that array, so the current window is exposed as a zero-copy
+    view and appending a value costs O(1).
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of values kept in the buffer.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        """
+        Initialize an empty buffer.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of values kept in the buffer.
+        dtype : data-type, optional
+            Data type of the buffered values (default is np.float64).
+
+        Raises
+        ------
+        ValueError
+            If the capacity is not a positive integer.
+        """
+        if not isinstance(capacity, (int, np.integer)) or capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+
+        self.capacity = int(capacity)
+        self._data = np.empty(2 * self.capacity, dtype=dtype)
+        self._count = 0
+        self._position = 0
+
+    def __len__(self):
+        """int: Number of values currently in the buffer."""
+        return min(self._count, self.capacity)
+
+    @property
+    def is_full(self):
+        """bool: Whether the buffer holds `capacity` values."""
+        return self._count >= self.capacity
+
+    def append(self, value):
+        """
+        Append a value, evicting the oldest value once the buffer is full.
+
+        Parameters
+        ----------
+        value : scalar
+            The new value.
+
+        Returns
+        -------
+        scalar or None
+            The evicted value, or None if the buffer was not full.
+        """
+        position = self._position
+        evicted = self._data[position] if self.is_full else None
+
+        self._data[position] = value
+        self._data[position + self.capacity] = value
+        self._position = (position + 1) % self.capacity
+        self._count += 1
+        return evicted
+
+    def extend(self, values):
+        """
+        Append several values at once, evicting the oldest values once the buffer is full.
+
+        Parameters
+        ----------
+        values : array-like
+            The new values, oldest first.
+        """
+        values = np.asarray(values, dtype=self._data.dtype)
+        if len(values) >= self.capacity:
+            tail = values[len(values) - self.capacity:]
+            self._data[:self.capacity] = tail
+            self._data[self.capacity:] = tail
+            self._position = 0
+        else:
+            positions = (self._position + np.arange(len(values))) % self.capacity
+            self._data[positions] = values
+            self._data[positions + self.capacity] = values
+            self._position = (self._position + len(values)) % self.capacity
+        self._count += len(values)
+
+    def view(self):
+        """
+        Return the buffered values, oldest first, without copying them.
+
+        The view is read-only and is overwritten by later appends, so it must be copied to be
+        kept beyond the next call to `append`.
+
+        Returns
+        -------
+        np.ndarray
+            A read-only view of the `len(self)` buffered values.
+        """
+        if self.is_full:
+            window = self._data[self._position:self._position + self.capacity]
+        else:
+            window = self._data[:self._count]
+        window.flags.writeable = False
+        return window
@@ -0,0 +1,368 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .autocorrelation import batch_acf, centered_autocovariance
+
+# Upper bound on the number of samples whose block moments are held in memory at once
+BLOCK_CHUNK_SAMPLES = 2**20
+
+# Windows whose running sums of lagged products exceed their own second moment by more than
+# this factor lose too many digits to cancellation and are recomputed directly
+MAX_CANCELLATION = 1e6
+
+
+class RollingMoments:
+    """
+    Sliding-window moments of a 1-D series computed in O(N) total.
+
+    The series is split into blocks of `window_size` samples, so every window is a suffix of
+    one block followed by a prefix of the next. The mean and central moments of all prefixes
+    and suffixes are accumulated with Welford updates and merged per window (Chan et al.), so
+    each additional window costs O(1) and no window depends on an anchor far from its own
+    mean: level shifts and flat stretches are as accurate as a direct two-pass computation.
+
+    Window sums and lagged products are taken as differences of running (cumulative) sums,
+    re-anchored every `anchor_every` windows on data shifted by the segment mean. Windows
+    whose running sums are too large compared with their own variance (e.g. after a level
+    shift within a segment) are recomputed directly.
+
+    Attributes
+    ----------
+    values : np.ndarray
+        The underlying float64 series.
+    window_size : int
+        Number of samples in each window.
+    stride : int
+        Step between the starts of consecutive windows.
+    anchor_every : int
+        Number of consecutive windows sharing one anchor (shift) in the running sums.
+    """
+
+    def __init__(self, values, window_size, stride=1, anchor_every=4096):
+        """
+        Initialize the rolling moments of a series.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 1-D float64 array without NaN values.
+        window_size : int
+            Number of samples in each window.
+        stride : int, optional
+            Step between the starts of consecutive windows (default is 1).
+        anchor_every : int, optional
+            Number of windows between re-anchoring of the running sums (default is 4096).
+
+        Raises
+        ------
+        ValueError
+            If the series is shorter than the window or contains NaN values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("Data must be one-dimensional.")
+        if window_size < 1 or window_size > len(values):
+            raise ValueError(f"Window size ({window_size}) must be between 1 and the series length ({len(values)}).")
+        if np.isnan(values).any():
+            raise ValueError("Data contains NaN values.")
+
+        self.values = values
+        self.window_size = window_size
+        self.stride = stride
+        self.anchor_every = max(int(anchor_every), 1)
+        self.n_windows = len(values) - window_size + 1
+        self._cache = {}
+
+    def rolling_sum(self, values):
+        """
+        Calculate the sum of a series aligned with the data over every window.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            A 1-D array aligned with the series (e.g. a transformed copy of it).
+
+        Returns
+        -------
+        np.ndarray
+            Window sums, one per window (after applying the stride).
+        """
+        return self._window_sums(lambda segment, start, stop: values[start:stop])
+
+    def rolling_count(self, mask):
+        """
+        Count the True values of a boolean mask over every window.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            A 1-D boolean array aligned with the series.
+
+        Returns
+        -------
+        np.ndarray
+            Integer counts, one per window.
+        """
+        running = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+        counts = running[self.window_size:] - running[:-self.window_size]
+        return counts[::self.stride]
+
+    @property
+    def mean(self):
+        """np.ndarray: Mean of every window."""
+        self._compute_central_moments()
+        return self._cache["mean"]
+
+    @property
+    def m2(self):
+        """np.ndarray: Sum of squared deviations from the mean of every window."""
+        self._compute_central_moments()
+        return self._cache["m2"]
+
+    @property
+    def m3(self):
+        """np.ndarray: Sum of cubed deviations from the mean of every window."""
+        self._compute_central_moments()
+        return self._cache["m3"]
+
+    @property
+    def index_moment(self):
+        """np.ndarray: Co-moment of every window with the sample positions, sum of (j - (W - 1) / 2) * x[j]."""
+        self._compute_central_moments()
+        return self._cache["index_moment"]
+
+    @property
+    def constant(self):
+        """np.ndarray: Whether all values of every window are exactly equal."""
+        if "constant" not in self._cache:
+            # A window is constant if no value changes after its first sample
+            changes = np.concatenate(([False], self.values[1:] != self.values[:-1]))
+            window_starts = np.arange(0, self.n_windows, self.stride)
+            self._cache["constant"] = self.rolling_count(changes) - changes[window_starts] == 0
+        return self._cache["constant"]
+
+    def autocovariance(self, max_lag):
+        """
+        Calculate the autocovariances (unnormalized) of every window for lags 0 to `max_lag`.
+
+        The lagged products x[i] * x[i + k] are summed over every window from running sums, so
+        each window costs O(max_lag) instead of a full correlation of the window. Windows whose
+        running sums are more than `MAX_CANCELLATION` times their own second moment are
+        recomputed directly with `batch_acf`, and constant windows yield zeros.
+
+        Parameters
+        ----------
+        max_lag : int
+            The maximum lag. Lags beyond `window_size - 1` are not returned.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_windows, min(max_lag, window_size - 1) + 1) with the sums of
+            products of deviations from the window mean, as used by `batch_acf`.
+        """
+        window_size = self.window_size
+        n_lags = min(max_lag, window_size - 1) + 1
+        anchors = self._anchors()
+        result = np.empty((self.n_windows, n_lags))
+        magnitude = np.empty(self.n_windows)
+
+        for segment, start, stop in self._segments():
+            shifted = self.values[start : stop + window_size - 1] - anchors[segment]
+            running = np.concatenate(([0.0], np.cumsum(shifted)))
+            n_segment = stop - start
+            windows = np.arange(n_segment)
+
+            products = np.empty((n_segment, n_lags))
+            for lag in range(n_lags):
+                lagged = np.concatenate(([0.0], np.cumsum(shifted[:len(shifted) - lag] * shifted[lag:])))
+                products[:, lag] = lagged[window_size - lag : window_size - lag + n_segment] - lagged[:n_segment]
+
+            # Sums of the first and of the last `lag` samples of every window
+            lags = np.arange(n_lags)
+            head_sums = running[windows[:, None] + lags] - running[windows][:, None]
+            tail_sums = running[windows + window_size][:, None] - running[windows[:, None] + window_size - lags]
+            total = running[windows + window_size] - running[windows]
+
+            result[start:stop] = centered_autocovariance(products, total, head_sums, tail_sums, window_size)
+            # The rounding error of every window grows with the running sum of squares up to its end
+            magnitude[start:stop] = np.cumsum(np.square(shifted))[window_size - 1:]
+
+        result = result[::self.stride]
+        result[self.constant] = 0.0
+        unstable = np.flatnonzero((magnitude[::self.stride] > MAX_CANCELLATION * self.m2) & ~self.constant)
+        if len(unstable):
+            windows = sliding_window_view(self.values, window_size)[::self.stride]
+            block_size = max(1, BLOCK_CHUNK_SAMPLES // window_size)
+            for start in range(0, len(unstable), block_size):
+                rows = unstable[start:start + block_size]
+                result[rows] = batch_acf(windows[rows], max_lag) * self.m2[rows, np.newaxis]
+
+        return result
+
+    @property
+    def sum_squares(self):
+        """np.ndarray: Sum of squared values of every window."""
+        if "sum_squares" not in self._cache:
+            # Taken from the per-window moments: a running sum of squares would keep the
+            # rounding error of a large value for the rest of its segment
+            self._cache["sum_squares"] = self.m2 + self.window_size * np.square(self.mean)
+        return self._cache["sum_squares"]
+
+    def _segments(self):
+        """
+        Yield `(segment, start, stop)` ranges of windows sharing one anchor.
+        """
+        for segment, start in enumerate(range(0, self.n_windows, self.anchor_every)):
+            yield segment, start, min(start + self.anchor_every, self.n_windows)
+
+    def _window_sums(self, chunk_values):
+        """
+        Calculate window sums segment by segment, restarting the running sum in each segment.
+
+        Parameters
+        ----------
+        chunk_values : callable
+            Called as `chunk_values(segment, start, stop)` to obtain the samples at positions
+            `start:stop` of the series, already transformed for summation.
+
+        Returns
+        -------
+        np.ndarray
+            Window sums, one per window (after applying the stride).
+        """
+        window_size = self.window_size
+        sums = np.empty(self.n_windows, dtype=np.float64)
+
+        for segment, start, stop in self._segments():
+            chunk = chunk_values(segment, start, stop + window_size - 1)
+            running = np.concatenate(([0.0], np.cumsum(chunk, dtype=np.float64)))
+            sums[start:stop] = running[window_size:] - running[:-window_size]
+
+        return sums[::self.stride]
+
+    def _anchors(self):
+        """
+        Return the anchor (mean of the covered samples) of every segment of windows.
+        """
+        if "anchors" not in self._cache:
+            self._cache["anchors"] = np.array([
+                self.values[start : stop + self.window_size - 1].mean() for _, start, stop in self._segments()
+            ])
+        return self._cache["anchors"]
+
+    def _compute_central_moments(self):
+        """
+        Compute the window mean, central moments and co-moment with the sample positions.
+
+        The series is split into blocks of `window_size` samples. Window `i` starts at offset
+        `r = i % window_size` of block `b = i // window_size` and is the suffix of block `b`
+        from `r` followed by the first `r` samples of block `b + 1`. Both parts are taken from
+        Welford scans of the blocks, forwards from the first and backwards from the last sample
+        of each block, with the samples shifted by the sample the scan starts from. The two
+        parts of a window are thus anchored at adjacent samples and merged with the pairwise
+        update formulas, which never subtract large sums, so constant windows yield exactly
+        zero moments.
+        """
+        if "mean" in self._cache:
+            return
+
+        window_size = self.window_size
+        n_blocks = -(-len(self.values) // window_size)
+        # Pad the last block with its final value; padded samples never belong to a window
+        padded = np.pad(self.values, (0, n_blocks * window_size - len(self.values)), mode="edge")
+        blocks = padded.reshape(n_blocks, window_size)
+
+        window_starts = np.arange(0, self.n_windows, self.stride)
+        moments = {name: np.empty(len(window_starts)) for name in ("mean", "m2", "m3", "index_moment")}
+
+        # Process the blocks in chunks to bound memory, each with the block following it
+        chunk_blocks = max(1, BLOCK_CHUNK_SAMPLES // window_size)
+        for first in range(0, n_blocks, chunk_blocks):
+            last = min(first + chunk_blocks, n_blocks)
+            selected = (window_starts >= first * window_size) & (window_starts < last * window_size)
+            if not selected.any():
+                continue
+
+            chunk = blocks[first : min(last + 1, n_blocks)]
+            reversed_chunk = chunk[:, ::-1]
+            prefix = _welford_scan(chunk - chunk[:, :1])
+            suffix = _welford_scan(reversed_chunk - reversed_chunk[:, :1])
+            suffix = {name: values[:, ::-1] for name, values in suffix.items()}
+            # Positions of the reversed scan run backwards
+            suffix["index_moment"] = -suffix["index_moment"]
+
+            starts = window_starts[selected]
+            block = starts // window_size - first
+            offset = starts % window_size
+            following = np.minimum(block + 1, len(chunk) - 1)
+
+            n_head = window_size - offset
+            n_tail = offset
+            head = {name: values[block, offset] for name, values in suffix.items()}
+            tail = {name: values[following, offset - 1] for name, values in prefix.items()}
+            has_tail = n_tail > 0
+
+            head_anchor = chunk[block, -1]
+            tail_anchor = chunk[following, 0]
+            delta = np.where(has_tail, (tail["mean"] - head["mean"]) + (tail_anchor - head_anchor), 0.0)
+            m2_head = head["m2"]
+            m2_tail = np.where(has_tail, tail["m2"], 0.0)
+            weight = n_head * n_tail / window_size
+
+            moments["mean"][selected] = head_anchor + (head["mean"] + delta * n_tail / window_size)
+            moments["m2"][selected] = m2_head + m2_tail + delta ** 2 * weight
+            moments["m3"][selected] = (
+                head["m3"] + np.where(has_tail, tail["m3"], 0.0)
+                + delta ** 3 * weight * (n_head - n_tail) / window_size
+                + 3 * delta * (n_head * m2_tail - n_tail * m2_head) / window_size
+            )
+            # The mean positions of the two parts are window_size / 2 apart
+            moments["index_moment"][selected] = (
+                head["index_moment"] + np.where(has_tail, tail["index_moment"], 0.0)
+                + delta * weight * window_size / 2
+            )
+
+        self._cache.update(moments)
+
+
+def _welford_scan(blocks):
+    """
+    Calculate the moments of every prefix of every row with Welford updates.
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        A 2D array with one block of samples per row.
+
+    Returns
+    -------
+    dict
+        Arrays shaped like `blocks` with the mean, the sums of squared and cubed deviations
+        from the mean ("m2", "m3") and the co-moment with the sample positions
+        ("index_moment") of the samples up to and including each position.
+    """
+    n_rows, length = blocks.shape
+    scan = {name: np.empty((n_rows, length)) for name in ("mean", "m2", "m3", "index_moment")}
+    mean = np.zeros(n_rows)
+    m2 = np.zeros(n_rows)
+    m3 = np.zeros(n_rows)
+    index_moment = np.zeros(n_rows)
+
+    for position in range(length):
+        values = blocks[:, position]
+        count = position + 1
+        delta = values - mean
+        delta_n = delta / count
+        term = delta * delta_n * position
+        mean = mean + delta_n
+        m3 = m3 + term * delta_n * (count - 2) - 3 * delta_n * m2
+        m2 = m2 + term
+        # The position deviates from the mean of the previous positions by count / 2
+        index_moment = index_moment + count / 2 * (values - mean)
+
+        scan["mean"][:, position] = mean
+        scan["m2"][:, position] = m2
+        scan["m3"][:, position] = m3
+        scan["index_moment"][:, position] = index_moment
+
+    return scan
@@ -0,0 +1,110 @@
+import os
+import tempfile
+
+import numpy as np
+
+
+class SharedCounter:
+    """
+    Counters of the steps processed by parallel workers, shared through a memory-mapped file.
+
+    Each task is given its own slot (see `slot`), which only that task writes, so workers
+    update their count without locks or messages, and the parent reads the total at any time
+    by summing the slots. Updating a slot costs a write to memory, so it can be done after
+    every unit of work.
+
+    Attributes
+    ----------
+    path : str
+        Path of the memory-mapped file holding the counters.
+    n_slots : int
+        Number of counters.
+    """
+
+    def __init__(self, n_slots, folder=None):
+        """
+        Create zeroed counters.
+
+        Parameters
+        ----------
+        n_slots : int
+            Number of counters, one per task.
+        folder : str, optional
+            Folder of the memory-mapped file. If None (default), the temporary directory is used.
+        """
+        handle, self.path = tempfile.mkstemp(prefix="interpreTS-", suffix=".counter", dir=folder)
+        os.close(handle)
+        self.n_slots = max(int(n_slots), 1)
+        self._counts = np.memmap(self.path, dtype=np.int64, mode="w+", shape=(self.n_slots,))
+
+    def slot(self, index):
+        """
+        Return the counter of a task, which can be sent to a worker process.
+
+        Parameters
+        ----------
+        index : int
+            Position of the counter.
+
+        Returns
+        -------
+        CounterSlot
+            The counter.
+        """
+        return CounterSlot(self.path, self.n_slots, index)
+
+    def total(self):
+        """
+        Return the sum of all counters.
+
+        Returns
+        -------
+        int
+            The number of steps processed by all tasks so far.
+        """
+        return int(self._counts.sum())
+
+    def close(self):
+        """
+        Release and delete the memory-mapped file.
+        """
+        if self._counts is not None:
+            self._counts = None
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CounterSlot:
+    """
+    Counter of the steps processed by a single task, mapped in the process running the task.
+    """
+
+    def __init__(self, path, n_slots, index):
+        self.path = path
+        self.n_slots = n_slots
+        self.index = index
+        self._counts = None
+
+    def add(self, steps):
+        """
+        Add processed steps to the counter.
+
+        Parameters
+        ----------
+        steps : int
+            Number of steps processed.
+        """
+        if self._counts is None:
+            self._counts = np.memmap(self.path, dtype=np.int64, mode="r+", shape=(self.n_slots,))
+        self._counts[self.index] += steps
+
+    def __getstate__(self):
+        # The mapping is reopened in the worker process
+        state = self.__dict__.copy()
+        state["_counts"] = None
+        return state
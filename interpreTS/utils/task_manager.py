@@ -1,12 +1,138 @@
+import os
+import tempfile
+import threading
+import time
+from collections import deque
 import numpy as np
 import pandas as pd
-import dask.dataframe as dd
 from pandas.tseries.frequencies import to_offset
-from joblib import Parallel, delayed
-from dask.diagnostics import ProgressBar
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from ..utils.data_validation import validate_time_series_data
 from ..utils.feature_loader import FeatureLoader
+from ..utils.window_engine import GroupWindows, WindowTasks
+from ..utils.rolling_moments import RollingMoments
+from ..utils.window_context import WindowContext
+from ..utils.shared_counter import SharedCounter
+
+# Target duration of a chunk of windows dispatched to a worker in parallel mode, and the
+# minimum duration below which the dispatch overhead outweighs the work
+PARALLEL_CHUNK_SECONDS = 0.5
+PARALLEL_MIN_CHUNK_SECONDS = 0.05
+# Number of windows processed locally to measure the cost of a window in parallel mode
+PARALLEL_CALIBRATION_WINDOWS = 64
+# Minimum number of chunks per worker for load balancing in parallel mode
+PARALLEL_CHUNKS_PER_WORKER = 4
+# Number of samples per partition in Dask mode
+DASK_PARTITION_ROWS = 100_000
+# Interval in seconds between progress reports in parallel modes
+PROGRESS_INTERVAL = 0.1
+# Minimum number of windows processed between progress reports in sequential mode, below which
+# setting up the rolling kernels of every chunk outweighs the work
+SEQUENTIAL_CHUNK_WINDOWS = 4096
+
+
+def _take_windows(ranges, count):
+    """
+    Split off about `count` windows from the front of a list of window ranges.
+
+    Parameters
+    ----------
+    ranges : collections.deque of tuple
+        Ranges `(group_windows, start, stop)` of windows of one or more groups, from which
+        the taken windows are removed.
+    count : int
+        Number of windows to take.
+
+    Returns
+    -------
+    list of tuple
+        The ranges of the taken windows.
+    """
+    taken = []
+    while ranges and count > 0:
+        group_windows, start, stop = ranges[0]
+        if stop - start <= count:
+            taken.append(ranges.popleft())
+            count -= stop - start
+        else:
+            taken.append((group_windows, start, start + count))
+            ranges[0] = (group_windows, start + count, stop)
+            count = 0
+    return taken
+
+def _subsets(ranges):
+    """
+    Take the windows of a list of window ranges as `GroupWindows` holding only their samples.
+    """
+    return [group_windows.subset(start, stop) for group_windows, start, stop in ranges]
+
+def _shared_memory_folder():
+    """
+    Return the folder of the files shared between processes: `/dev/shm` where available, so
+    they stay in memory, else None for the default temporary directory.
+    """
+    folder = "/dev/shm"
+    return folder if os.path.isdir(folder) and os.access(folder, os.W_OK) else None
+
+def _write_numeric_block(results, row_offset, block):
+    """
+    Write a block of features into rows of a float64 result matrix or frame.
+
+    Returns
+    -------
+    bool
+        Whether the block was written, i.e. all its features are numbers or missing.
+    """
+    try:
+        values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+    except (TypeError, ValueError):
+        return False
+    if isinstance(results, pd.DataFrame):
+        results.iloc[row_offset:row_offset + len(block)] = values
+    else:
+        results[row_offset:row_offset + len(block)] = values
+    return True
+
+def _process_shared_chunk(task_manager, input_path, input_shape, output_path, output_shape, feature_columns, chunk, progress=None):
+    """
+    Process a chunk of windows in shared memory, writing their features into the result matrix.
+
+    Parameters
+    ----------
+    task_manager : TaskManager
+        The task manager calculating the features.
+    input_path, output_path : str
+        Paths of the memory-mapped (n_columns, n_samples) data and (n_windows, n_features)
+        result arrays.
+    input_shape, output_shape : tuple of int
+        Shapes of the data and result arrays.
+    feature_columns : list of str
+        Columns for feature extraction.
+    chunk : list of tuple
+        Ranges of windows `(sample_offset, n_samples, window_size, stride, row_offset, n_windows)`.
+    progress : CounterSlot, optional
+        The counter of processed windows of the chunk, updated after each range.
+
+    Returns
+    -------
+    tuple
+        The blocks `(row_offset, block)` with features that are not numbers, which are not
+        written, and the number of processed windows.
+    """
+    values = np.memmap(input_path, dtype=np.float64, mode="r", shape=input_shape)
+    results = np.memmap(output_path, dtype=np.float64, mode="r+", shape=output_shape)
+    fallback = []
+    steps = 0
+    for sample_offset, n_samples, window_size, stride, row_offset, n_windows in chunk:
+        group_windows = GroupWindows.from_buffer(values[:, sample_offset:sample_offset + n_samples], feature_columns, window_size, stride)
+        block = task_manager._process_group_windows(group_windows)
+        if not _write_numeric_block(results, row_offset, block):
+            fallback.append((row_offset, block))
+        steps += n_windows
+        if progress is not None:
+            progress.add(n_windows)
+    results.flush()
+    return fallback, steps
 
 class TaskManager:
     """
@@ -27,11 +153,19 @@ class TaskManager:
         Additional parameters for specific feature calculations.
     validation_requirements : dict
         Validation requirements for each feature.
+    batch_feature_functions : dict
+        A dictionary mapping feature names to kernels that calculate the feature
+        for a whole (n_windows, window_size) matrix at once.
+    rolling_feature_functions : dict
+        A dictionary mapping feature names to kernels that calculate the feature for all
+        overlapping windows of a series from rolling moments in O(1) per window.
+    feature_dependencies : dict
+        A dictionary mapping feature names to the shared window intermediates they use.
     warning_registry : set
         A set to keep track of warnings already issued during feature extraction.
     """
     
-    def __init__(self, feature_functions, window_size, features, stride, feature_params, validation_requirements):
+    def __init__(self, feature_functions, window_size, features, stride, feature_params, validation_requirements, batch_feature_functions=None, rolling_feature_functions=None, feature_dependencies=None):
         """
         Initialize the TaskManager.
 
@@ -49,6 +183,14 @@ class TaskManager:
             Parameters for each feature calculation.
         validation_requirements : dict
             Validation requirements for each feature.
+        batch_feature_functions : dict, optional
+            Mapping of feature names to their batch kernels. Features without a kernel
+            are calculated window by window.
+        rolling_feature_functions : dict, optional
+            Mapping of feature names to their rolling kernels, used for overlapping windows.
+        feature_dependencies : dict, optional
+            Mapping of feature names to the shared window intermediates they use. These
+            features receive a `WindowContext` of the window as the `context` argument.
         """
         self.feature_functions = feature_functions
         self.window_size = window_size
@@ -56,9 +198,12 @@ class TaskManager:
         self.stride = stride
         self.feature_params = feature_params
         self.validation_requirements = validation_requirements
+        self.batch_feature_functions = batch_feature_functions if batch_feature_functions is not None else {}
+        self.rolling_feature_functions = rolling_feature_functions if rolling_feature_functions is not None else {}
+        self.feature_dependencies = feature_dependencies if feature_dependencies is not None else {}
         self.warning_registry = set()
     
-    def _calculate_feature(self, feature_name, feature_data, params):
+    def _calculate_feature(self, feature_name, feature_data, params, context=None):
         """
         Calculate a specific feature using its corresponding function.
 
@@ -70,6 +215,8 @@ class TaskManager:
             Time-series data for feature calculation.
         params : dict
             Additional parameters for the feature calculation.
+        context : WindowContext, optional
+            Shared intermediates of the window, passed to features that depend on them.
 
         Returns
         -------
@@ -85,9 +232,73 @@ class TaskManager:
             params = params.copy()
             if "window_size" in params:
                 params["window_size"] = self.window_size
+            if context is not None and feature_name in self.feature_dependencies:
+                params["context"] = context
             return self.feature_functions[feature_name](feature_data, **params)
         else:
             raise ValueError(f"Feature '{feature_name}' is not supported.")
+
+    def _calculate_batch_feature(self, feature_name, windows, params):
+        """
+        Calculate a specific feature for many windows at once using its batch kernel.
+
+        Parameters
+        ----------
+        feature_name : str
+            Name of the feature to calculate.
+        windows : np.ndarray
+            Array of shape (n_windows, window_size) with one window per row.
+        params : dict
+            Additional parameters for the feature calculation.
+
+        Returns
+        -------
+        np.ndarray
+            The calculated feature values, one per window.
+
+        Raises
+        ------
+        ValueError
+            If the feature has no batch kernel.
+        """
+        if feature_name in self.batch_feature_functions:
+            params = params.copy()
+            if "window_size" in params:
+                params["window_size"] = self.window_size
+            return self.batch_feature_functions[feature_name](windows, **params)
+        else:
+            raise ValueError(f"Feature '{feature_name}' has no batch kernel.")
+
+    def _calculate_rolling_feature(self, feature_name, moments, params):
+        """
+        Calculate a specific feature for all overlapping windows of a series using its rolling kernel.
+
+        Parameters
+        ----------
+        feature_name : str
+            Name of the feature to calculate.
+        moments : RollingMoments
+            Rolling moments of the series.
+        params : dict
+            Additional parameters for the feature calculation.
+
+        Returns
+        -------
+        np.ndarray
+            The calculated feature values, one per window.
+
+        Raises
+        ------
+        ValueError
+            If the feature has no rolling kernel.
+        """
+        if feature_name in self.rolling_feature_functions:
+            params = params.copy()
+            if "window_size" in params:
+                params["window_size"] = self.window_size
+            return self.rolling_feature_functions[feature_name](moments, **params)
+        else:
+            raise ValueError(f"Feature '{feature_name}' has no rolling kernel.")
     
     @staticmethod
     def _validate_parameters(features, feature_params, window_size, stride, id_column, sort_column):
@@ -197,77 +408,96 @@ class TaskManager:
                 f"or {'NaN' if allow_nan else 'not NaN'}."
             )
             
-    def _execute_dask(self, grouped_data, feature_columns):
+    def _execute_dask(self, grouped_data, feature_columns, lazy=False):
         """
         Execute feature extraction using Dask for parallel processing.
 
+        The windows of all groups are split into partitions of about `DASK_PARTITION_ROWS`
+        samples, several small groups sharing a partition. Each partition holds the samples of
+        its windows, i.e. its rows plus a halo of the `window_size - 1` following samples, so no
+        window spanning a partition boundary is lost, and is processed as one Dask task with the
+        rolling and batch kernels of `_process_group_windows`. The partitions are indexed by
+        the global window position, so the result is in the same order as in sequential mode.
+        The tasks run on the active Dask scheduler, e.g. a `distributed` cluster when a client
+        is connected.
+
         Parameters
         ----------
         grouped_data : pd.DataFrameGroupBy
             Grouped time-series data.
         feature_columns : list of str
             Columns for feature extraction.
+        lazy : bool, optional
+            Whether to return a lazy Dask DataFrame instead of computing it (default is False).
 
         Returns
         -------
-        pd.DataFrame
+        pd.DataFrame or dask.dataframe.DataFrame
             Extracted features for all groups.
-        """
-        dask_tasks = []
-
-        for _, group in grouped_data:
-            group_ddf = dd.from_pandas(group, npartitions=max(1, len(group) // 1000))
 
-            window_size = self._convert_window_to_observations(self.window_size, group) if not pd.isna(self.window_size) else len(group)
-            stride = self._convert_window_to_observations(self.stride, group)
+        Raises
+        ------
+        ImportError
+            If Dask is not installed.
+        """
+        try:
+            import dask
+            import dask.dataframe as dd
+            from dask.diagnostics import ProgressBar
+        except ImportError as e:
+            raise ImportError("Dask is required for mode='dask'. Install it with `pip install \"dask[dataframe]\"`.") from e
 
-            if window_size > len(group):
-                print(f"Warning: Window size ({window_size}) exceeds group length ({len(group)}). Skipping group.")
-                continue
+        tasks = self._generate_tasks(grouped_data, feature_columns)
+        ranges = deque((group_windows, 0, len(group_windows)) for group_windows in tasks.groups if len(group_windows) > 0)
+        keys = [f"{feature}_{col}" for feature in self.features for col in feature_columns]
+        meta = pd.DataFrame({key: pd.Series(dtype=np.float64) for key in keys})
 
-            meta = pd.DataFrame(columns=[f"{feature}_{col}" for feature in self.features for col in feature_columns])
+        partitions = []
+        divisions = [0]
+        while ranges:
+            group_windows = ranges[0][0]
+            partition = _subsets(_take_windows(ranges, max(1, DASK_PARTITION_ROWS // group_windows.stride)))
+            partitions.append(dask.delayed(self._process_dask_partition)(partition, divisions[-1]))
+            divisions.append(divisions[-1] + sum(len(part) for part in partition))
 
-            dask_tasks.append(
-                group_ddf.map_partitions(
-                    lambda partition: self._process_partition(partition, feature_columns, window_size, stride),
-                    meta=meta
-            ))
+        if not partitions:
+            return dd.from_pandas(meta, npartitions=1) if lazy else pd.DataFrame()
 
+        # The last division is inclusive
+        divisions[-1] -= 1
+        result = dd.from_delayed(partitions, meta=meta, divisions=divisions, verify_meta=False)
+        if lazy:
+            return result
         with ProgressBar():
-            dask_result = dd.concat(dask_tasks).compute()
-
-        return dask_result
+            return result.compute()
 
-    def _process_partition(self, partition, feature_columns, window_size, stride):
+    def _process_dask_partition(self, partition, row_offset):
         """
-        Process a single partition of data to calculate features.
+        Process a partition of window ranges in a Dask task.
 
         Parameters
         ----------
-        partition : pd.DataFrame
-            The partition of data to process.
-        feature_columns : list of str
-            The columns of the partition to process.
-        window_size : int
-            The size of the window for feature extraction.
+        partition : list of GroupWindows
+            Contiguous ranges of windows of one or more groups.
+        row_offset : int
+            Position of the first window among the windows of all groups.
 
         Returns
         -------
         pd.DataFrame
-            A DataFrame with calculated features for each partition.
+            The features of the windows, indexed by their position.
         """
-        results = []
-
-        for start in range(0, len(partition) - window_size + 1, stride):
-            window = partition.iloc[start : start + window_size]
-            results.append(self._process_window(window, feature_columns))
+        result = pd.concat(self._process_chunk(partition), ignore_index=True)
+        result.index = pd.RangeIndex(row_offset, row_offset + len(result))
+        return result
 
-        return pd.DataFrame(results)
-    
     def _generate_tasks(self, grouped_data, feature_columns):
         """
         Generate feature extraction tasks for all groups and windows.
 
+        Windows are not materialized: each group's feature columns are copied once into a
+        contiguous float64 buffer and every window is a strided view over that buffer.
+
         Parameters
         ----------
         grouped_data : pd.DataFrameGroupBy
@@ -277,10 +507,10 @@ class TaskManager:
 
         Returns
         -------
-        list of tuple
-            A list of tasks where each task contains a window of data and corresponding feature columns.
+        WindowTasks
+            A lazy sequence of tasks where each task contains a window of data and corresponding feature columns.
         """
-        tasks = []
+        tasks = WindowTasks()
         for _, group in grouped_data:
             group_length = len(group)
             window_size = group_length if pd.isna(self.window_size) else self._convert_window_to_observations(self.window_size, group)
@@ -290,53 +520,324 @@ class TaskManager:
                 print(f"Warning: Window size ({window_size}) exceeds group length ({group_length}). Skipping group.")
                 continue
 
-            for start in range(0, group_length - window_size + 1, stride):
-                window = group.iloc[start : start + window_size]
-                tasks.append((window, feature_columns))
+            tasks.append(GroupWindows(group, feature_columns, window_size, stride))
         return tasks
           
-    def _execute_parallel(self, tasks, n_jobs, progress_callback, total_steps):
+    def _execute_parallel(self, tasks, n_jobs, progress_callback, total_steps, chunk_size=None):
         """
         Execute feature extraction in parallel mode.
 
+        The windows are dispatched in chunks rather than one by one: each worker receives
+        contiguous ranges of windows of one or more groups (see `GroupWindows.subset`), processes
+        them with the rolling and batch kernels of `_process_group_windows` and returns a
+        columnar block per range. Unless `chunk_size` is given, the windows of the first
+        chunk are processed locally to measure the cost of a window, from which chunks are
+        sized to take about `PARALLEL_CHUNK_SECONDS` while giving every worker several chunks.
+        If the remaining windows take less than a chunk, they are processed locally as well,
+        so cheap extractions are not slowed down by starting the workers. The workers count
+        their processed windows in shared memory, from which progress is reported (see
+        `_run_parallel`).
+
         Parameters
         ----------
-        tasks : list of tuple
-            List of tasks generated for feature extraction.
+        tasks : WindowTasks or list of tuple
+            Tasks generated for feature extraction.
         n_jobs : int
             Number of parallel jobs to run.
         progress_callback : callable or None
             Function to report progress during task execution.
         total_steps : int
             Total number of steps for progress tracking.
+        chunk_size : int, optional
+            Number of windows per chunk. If None (default), it is determined automatically.
 
         Returns
         -------
-        list
+        list or pd.DataFrame
             Results of feature extraction for all tasks.
         """
-        results = []
+        n_workers = effective_n_jobs(n_jobs)
         completed_steps = 0
 
-        def update_progress():
+        def update_progress(steps):
             nonlocal completed_steps
-            completed_steps += 1
+            completed_steps += steps
             if progress_callback:
                 progress_callback(int((completed_steps / total_steps) * 100))
 
-        results = Parallel(n_jobs=n_jobs)(
-            delayed(self._process_window_with_progress)(task, update_progress) for task in tasks
-        )
+        if not isinstance(tasks, WindowTasks):
+            tasks = list(tasks)
+            chunk_size = chunk_size or max(1, -(-len(tasks) // (n_workers * PARALLEL_CHUNKS_PER_WORKER)))
+            chunks = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+            results = self._run_parallel(
+                lambda progress: (delayed(self._process_window_chunk)(chunk, progress(index)) for index, chunk in enumerate(chunks)),
+                len(chunks), n_jobs, progress_callback, total_steps
+            )
+            return [result for chunk_results in results for result in chunk_results]
+
+        ranges = deque((group_windows, 0, len(group_windows)) for group_windows in tasks.groups if len(group_windows) > 0)
+        blocks = []
+        if chunk_size is None and ranges:
+            # Process the first windows locally to measure the cost of a window
+            calibration = _take_windows(ranges, PARALLEL_CALIBRATION_WINDOWS)
+            started = time.perf_counter()
+            blocks.extend(self._process_chunk(_subsets(calibration)))
+            calibrated = sum(stop - start for _, start, stop in calibration)
+            window_seconds = max((time.perf_counter() - started) / calibrated, 1e-9)
+            update_progress(calibrated)
+
+            remaining = sum(stop - start for _, start, stop in ranges)
+            if remaining * window_seconds <= PARALLEL_CHUNK_SECONDS or n_workers == 1:
+                chunk_size = max(remaining, 1)
+            else:
+                balanced_size = -(-remaining // (n_workers * PARALLEL_CHUNKS_PER_WORKER))
+                chunk_size = max(
+                    int(PARALLEL_MIN_CHUNK_SECONDS / window_seconds),
+                    min(int(PARALLEL_CHUNK_SECONDS / window_seconds), balanced_size), 1
+                )
+
+        chunks = []
+        while ranges:
+            chunks.append(_subsets(_take_windows(ranges, chunk_size)))
+
+        if len(chunks) == 1 and blocks:
+            # The remaining windows take less than a chunk: not worth starting the workers
+            blocks.extend(self._process_chunk(chunks[0]))
+            update_progress(total_steps - completed_steps)
+        elif chunks:
+            results = self._run_parallel(
+                lambda progress: (delayed(self._process_chunk)(chunk, progress(index)) for index, chunk in enumerate(chunks)),
+                len(chunks), n_jobs, progress_callback, total_steps, completed_steps
+            )
+            for chunk_blocks in results:
+                blocks.extend(chunk_blocks)
+        return pd.concat(blocks, ignore_index=True) if blocks else pd.DataFrame()
+
+    def _run_parallel(self, calls, n_tasks, n_jobs, progress_callback, total_steps, completed_steps=0):
+        """
+        Run tasks with joblib, reporting the progress counted by the workers.
+
+        Each task is given a slot of a `SharedCounter`, which it updates as it processes its
+        windows. The tasks run in a helper thread while the calling thread reads the counters
+        every `PROGRESS_INTERVAL` seconds and calls `progress_callback` with the percentage of
+        processed steps, only when it changes, so progress is reported from the calling thread
+        as in sequential mode, and reporting costs the workers nothing but a memory write. The
+        counters are read once more after the tasks finish, so the final progress is always
+        reported, however quickly the tasks complete.
+
+        Parameters
+        ----------
+        calls : callable
+            A function that takes a function returning the counter of the task at a given index
+            (or None without progress reporting), and returns the delayed calls of the tasks.
+        n_tasks : int
+            Number of tasks.
+        n_jobs : int
+            Number of parallel jobs to run.
+        progress_callback : callable or None
+            Function to report progress during task execution.
+        total_steps : int
+            Total number of steps for progress tracking.
+        completed_steps : int, optional
+            Number of steps already completed and reported before the tasks (default is 0).
+
+        Returns
+        -------
+        list
+            The results of the tasks, in order.
+        """
+        if progress_callback is None:
+            return Parallel(n_jobs=n_jobs)(calls(lambda index: None))
+
+        with SharedCounter(n_tasks, _shared_memory_folder()) as counter:
+            delayed_calls = list(calls(counter.slot))
+            outcome = {}
+
+            def run():
+                try:
+                    outcome["results"] = Parallel(n_jobs=n_jobs)(delayed_calls)
+                except BaseException as e:
+                    outcome["error"] = e
+
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            # The steps completed before the tasks have already been reported by the caller
+            reported = int((completed_steps / total_steps) * 100) if completed_steps else None
+            while True:
+                thread.join(PROGRESS_INTERVAL)
+                finished = not thread.is_alive()
+                progress = int(((completed_steps + counter.total()) / total_steps) * 100)
+                if progress != reported:
+                    progress_callback(progress)
+                    reported = progress
+                if finished:
+                    break
+
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["results"]
+
+    def _execute_shared_memory(self, tasks, n_jobs, progress_callback, total_steps):
+        """
+        Execute feature extraction in parallel with the data and results in shared memory.
+
+        The buffers of all numeric groups are copied once into one (n_columns, n_samples)
+        array and a (n_windows, n_features) result matrix is preallocated, both memory-mapped
+        from files in shared memory (`/dev/shm` where available, else the temporary directory).
+        Workers only receive the paths, the feature configuration and the sample and row
+        offsets of their windows; they map both arrays, process their windows in place and
+        write the features directly into their rows of the result matrix, so neither the data
+        nor the results are serialized. Blocks with features that are not numbers (e.g. lists
+        of crossing points) are returned to the parent instead, as are groups with
+        non-numeric columns, which are processed in the parent.
+
+        Parameters
+        ----------
+        tasks : WindowTasks
+            Tasks generated for feature extraction.
+        n_jobs : int
+            Number of parallel jobs to run.
+        progress_callback : callable or None
+            Function to report progress during task execution.
+        total_steps : int
+            Total number of steps for progress tracking.
+
+        Returns
+        -------
+        pd.DataFrame
+            Results of feature extraction for all tasks, numeric features as float64.
+        """
+        if not isinstance(tasks, WindowTasks):
+            return self._execute_parallel(tasks, n_jobs, progress_callback, total_steps)
+        groups = [group_windows for group_windows in tasks.groups if len(group_windows) > 0]
+        if not groups:
+            return pd.DataFrame()
+
+        feature_columns = groups[0].feature_columns
+        # Features listed twice yield one column, as in the other modes
+        keys = [f"{feature_name}_{col}" for feature_name in dict.fromkeys(self.features) for col in feature_columns]
+        row_offsets = np.concatenate(([0], np.cumsum([len(group_windows) for group_windows in groups])))
+        numeric = [index for index, group_windows in enumerate(groups) if group_windows.is_numeric]
+        sample_offsets = np.concatenate(([0], np.cumsum([groups[index].buffer.shape[1] for index in numeric])))
+        completed_steps = 0
+
+        def update_progress(steps):
+            nonlocal completed_steps
+            completed_steps += steps
+            if progress_callback:
+                progress_callback(int((completed_steps / total_steps) * 100))
+
+        with tempfile.TemporaryDirectory(prefix="interpreTS-", dir=_shared_memory_folder()) as folder:
+            input_path = os.path.join(folder, "input.mmap")
+            output_path = os.path.join(folder, "output.mmap")
+            input_shape = (len(feature_columns), max(int(sample_offsets[-1]), 1))
+            output_shape = (int(row_offsets[-1]), len(keys))
+
+            values = np.memmap(input_path, dtype=np.float64, mode="w+", shape=input_shape)
+            for position, index in enumerate(numeric):
+                values[:, sample_offsets[position]:sample_offsets[position + 1]] = groups[index].buffer
+            values.flush()
+            del values
+            results = np.memmap(output_path, dtype=np.float64, mode="w+", shape=output_shape)
+            results[:] = np.nan
+
+            # Ranges of windows described by their sample and row offsets in the shared arrays
+            ranges = deque()
+            for position, index in enumerate(numeric):
+                group_windows = groups[index]
+                ranges.append(((int(sample_offsets[position]), int(row_offsets[index]), group_windows.window_size, group_windows.stride), 0, len(group_windows)))
+            n_workers = effective_n_jobs(n_jobs)
+            chunk_size = max(1, -(-sum(len(groups[index]) for index in numeric) // (n_workers * PARALLEL_CHUNKS_PER_WORKER)))
+            chunks = []
+            while ranges:
+                chunks.append([
+                    (sample_offset + start * stride, (stop - start - 1) * stride + window_size, window_size, stride, row_offset + start, stop - start)
+                    for (sample_offset, row_offset, window_size, stride), start, stop in _take_windows(ranges, chunk_size)
+                ])
+
+            fallback = []
+            for index, group_windows in enumerate(groups):
+                if not group_windows.is_numeric:
+                    fallback.append((int(row_offsets[index]), self._process_group_windows(group_windows)))
+                    update_progress(len(group_windows))
+            outputs = self._run_parallel(
+                lambda progress: (
+                    delayed(_process_shared_chunk)(self, input_path, input_shape, output_path, output_shape, feature_columns, chunk, progress(index))
+                    for index, chunk in enumerate(chunks)
+                ),
+                len(chunks), n_jobs, progress_callback, total_steps, completed_steps
+            )
+            for chunk_fallback, _ in outputs:
+                fallback.extend(chunk_fallback)
+
+            frame = pd.DataFrame(np.array(results), columns=keys)
+            del results
+
+        for row_offset, block in fallback:
+            if not _write_numeric_block(frame, row_offset, block):
+                frame = frame.astype(object)
+                frame.iloc[row_offset:row_offset + len(block)] = block.to_numpy(dtype=object)
+        return frame.infer_objects() if any(dtype == object for dtype in frame.dtypes) else frame
+
+    def _process_chunk(self, chunk, progress=None):
+        """
+        Process a chunk of window ranges in a worker.
+
+        Parameters
+        ----------
+        chunk : list of GroupWindows
+            Contiguous ranges of windows of one or more groups.
+        progress : CounterSlot, optional
+            The counter of processed windows of the chunk, updated after each range.
+
+        Returns
+        -------
+        list of pd.DataFrame
+            The features of the windows of each range.
+        """
+        blocks = []
+        for group_windows in chunk:
+            blocks.append(self._process_group_windows(group_windows))
+            if progress is not None:
+                progress.add(len(group_windows))
+        return blocks
+
+    def _process_window_chunk(self, tasks, progress=None):
+        """
+        Process a chunk of window tasks in a worker.
+
+        Parameters
+        ----------
+        tasks : list of tuple
+            Tasks containing a window of data and the feature columns.
+        progress : CounterSlot, optional
+            The counter of processed windows of the chunk, updated after each window.
+
+        Returns
+        -------
+        list of dict
+            Calculated features for each window.
+        """
+        results = []
+        for window, feature_columns in tasks:
+            results.append(self._process_window(window, feature_columns))
+            if progress is not None:
+                progress.add(1)
         return results
-        
+
     def _execute_sequential(self, tasks, progress_callback, total_steps):
         """
         Execute feature extraction in sequential mode.
 
+        When tasks are window views produced by `_generate_tasks`, the windows of each group are
+        processed in chunks of about 1% of all windows (at least `SEQUENTIAL_CHUNK_WINDOWS`),
+        features with a rolling or batch kernel being calculated for all windows of a chunk in
+        one call, and progress is reported after each chunk.
+
         Parameters
         ----------
-        tasks : list of tuple
-            List of tasks generated for feature extraction.
+        tasks : WindowTasks or list of tuple
+            Tasks generated for feature extraction.
         progress_callback : callable or None
             Function to report progress during task execution.
         total_steps : int
@@ -344,9 +845,29 @@ class TaskManager:
 
         Returns
         -------
-        list
+        list or pd.DataFrame
             Results of feature extraction for all tasks.
         """
+        if isinstance(tasks, WindowTasks):
+            results = []
+            completed_steps = 0
+            chunk_size = max(SEQUENTIAL_CHUNK_WINDOWS, -(-total_steps // 100))
+            for group_windows in tasks.groups:
+                if len(group_windows) <= chunk_size:
+                    chunks = [group_windows]
+                else:
+                    chunks = (
+                        group_windows.subset(start, min(start + chunk_size, len(group_windows)))
+                        for start in range(0, len(group_windows), chunk_size)
+                    )
+                for chunk in chunks:
+                    results.append(self._process_group_windows(chunk))
+                    completed_steps += len(chunk)
+                    if progress_callback:
+                        progress = int((completed_steps / total_steps) * 100)
+                        progress_callback(progress)
+            return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
         results = []
         for completed_steps, (window, feature_columns) in enumerate(tasks, 1):
             results.append(self._process_window(window, feature_columns))
@@ -354,38 +875,158 @@ class TaskManager:
                 progress = int((completed_steps / total_steps) * 100)
                 progress_callback(progress)
         return results
-        
-    def _process_window_with_progress(self, task, progress_callback):
+
+    def _process_group_windows(self, group_windows):
         """
-        Process a single window and report progress.
+        Process all windows of a single group to calculate features.
+
+        For each feature and column the cheapest available path is used:
+
+        - overlapping windows (stride smaller than the window) of columns without NaN values
+          use rolling kernels, which update running sums in O(1) per window,
+        - otherwise batch kernels compute the whole (n_windows, window_size) matrix at once,
+        - the remaining features fall back to per-window calls.
 
         Parameters
         ----------
-        task : tuple
-            A task containing a window of data and feature columns.
-        progress_callback : callable
-            Function to report progress.
+        group_windows : GroupWindows
+            The windows of the group to process.
 
         Returns
         -------
-        dict
-            Calculated features for the window.
+        pd.DataFrame
+            A DataFrame with one row of calculated features per window.
         """
-        window, feature_columns = task
-        result = self._process_window(window, feature_columns)
-        progress_callback()
-        return result
+        feature_columns = group_windows.feature_columns
+        use_rolling = group_windows.is_numeric and len(group_windows) > 1 and group_windows.stride < group_windows.window_size
+        moments_cache = {}
+
+        columns = {}
+        window_features = []
+        for feature_name in self.features:
+            params = self.feature_params.get(feature_name, {})
+            for col_index, col in enumerate(feature_columns):
+                values = None
+                if use_rolling and feature_name in self.rolling_feature_functions:
+                    values = self._process_rolling(feature_name, group_windows, col_index, params, moments_cache)
+                if values is None and group_windows.is_numeric and feature_name in self.batch_feature_functions:
+                    try:
+                        values = self._process_batch(feature_name, group_windows.column_windows(col_index), col, params)
+                    except Exception:
+                        values = None
+                if values is None:
+                    # Fall back to per-window calculation, which reports any failure
+                    window_features.append(feature_name)
+                    break
+                columns[f"{feature_name}_{col}"] = values
+
+        if window_features:
+            window_results = [self._process_window(window, feature_columns, window_features) for window in group_windows]
+            for feature_name in window_features:
+                for col in feature_columns:
+                    key = f"{feature_name}_{col}"
+                    columns[key] = [result[key] for result in window_results]
 
-    def _process_window(self, window, feature_columns):
+        ordered_keys = [f"{feature_name}_{col}" for feature_name in self.features for col in feature_columns]
+        return pd.DataFrame({key: columns[key] for key in ordered_keys}, index=pd.RangeIndex(len(group_windows)))
+
+    def _process_rolling(self, feature_name, group_windows, col_index, params, moments_cache):
+        """
+        Calculate a feature for all overlapping windows of a single column with its rolling kernel.
+
+        Parameters
+        ----------
+        feature_name : str
+            Name of the feature to calculate.
+        group_windows : GroupWindows
+            The windows of the group to process.
+        col_index : int
+            Position of the column in `group_windows.feature_columns`.
+        params : dict
+            Additional parameters for the feature calculation.
+        moments_cache : dict
+            Rolling moments already computed for the columns of the group, shared between features.
+
+        Returns
+        -------
+        np.ndarray or None
+            The calculated feature values, one per window, or None if the rolling path does not
+            apply (e.g. the column contains NaN values or the parameters are unsupported).
+        """
+        if col_index not in moments_cache:
+            column = group_windows.buffer[col_index]
+            moments_cache[col_index] = None if np.isnan(column).any() else RollingMoments(
+                column, group_windows.window_size, group_windows.stride
+            )
+
+        moments = moments_cache[col_index]
+        if moments is None:
+            return None
+        try:
+            with np.errstate(all="ignore"):
+                return np.asarray(self._calculate_rolling_feature(feature_name, moments, params))
+        except Exception:
+            return None
+
+    def _process_batch(self, feature_name, windows, col, params):
+        """
+        Calculate a feature for all windows of a single column with its batch kernel.
+
+        Windows that fail validation (e.g. contain NaN values for a feature that does not
+        allow them) yield NaN, consistent with the per-window path.
+
+        Parameters
+        ----------
+        feature_name : str
+            Name of the feature to calculate.
+        windows : np.ndarray
+            Array of shape (n_windows, window_size) with one window per row.
+        col : str
+            Name of the column the windows come from.
+        params : dict
+            Additional parameters for the feature calculation.
+
+        Returns
+        -------
+        np.ndarray
+            The calculated feature values, one per window.
+        """
+        requirements = self.validation_requirements.get(feature_name, {'allow_nan': False, 'require_datetime_index': False})
+        with np.errstate(all="ignore"):
+            values = np.asarray(self._calculate_batch_feature(feature_name, windows, params))
+
+        if not requirements.get('allow_nan', True):
+            invalid = np.isnan(windows).any(axis=1)
+            if invalid.any():
+                warning_key = f"{feature_name}_{col}_Data contains NaN values."
+                if warning_key not in self.warning_registry:
+                    print(f"Warning: Failed to calculate {feature_name} for column {col}: Data contains NaN values.")
+                    self.warning_registry.add(warning_key)
+                if values.dtype != object:
+                    values = values.astype(np.float64)
+                values[invalid] = np.nan
+        return values
+
+    def _process_window(self, window, feature_columns, features=None, contexts=None):
         """
         Process a single window to calculate features.
 
+        Intermediates shared by several features (e.g. moments, differences, the ACF or a
+        linear fit) are memoized in one `WindowContext` per column, so each is computed once
+        per window.
+
         Parameters
         ----------
-        window : pd.DataFrame
-            The window of data to process.
+        window : pd.DataFrame or np.ndarray
+            The window of data to process, either as a DataFrame or as an array
+            of shape (len(feature_columns), window_size) with one row per column.
         feature_columns : list of str
             The columns of the window to process.
+        features : list of str, optional
+            Features to calculate. If None, all configured features are calculated.
+        contexts : dict, optional
+            Prepared `WindowContext` objects by column, e.g. seeded with intermediates that
+            are maintained incrementally over a stream.
 
         Returns
         -------
@@ -393,18 +1034,24 @@ class TaskManager:
             A dictionary of calculated features.
         """
         extracted_features = {}
-        for feature_name in self.features:
+        contexts = dict(contexts) if contexts is not None else {}
+        for feature_name in (self.features if features is None else features):
             params = self.feature_params.get(feature_name, {})
-            for col in feature_columns:
+            for col_index, col in enumerate(feature_columns):
                 try:
-                    feature_data = window[col]
+                    feature_data = window[col_index] if isinstance(window, np.ndarray) else window[col]
                     
                     self._validate_feature_data(feature_name, feature_data)
                     
-                    if feature_data.empty:
+                    if len(feature_data) == 0:
                         extracted_features[f"{feature_name}_{col}"] = pd.NA
                     else:
-                        extracted_features[f"{feature_name}_{col}"] = self._calculate_feature(feature_name, feature_data, params)
+                        context = None
+                        if feature_name in self.feature_dependencies:
+                            if col not in contexts:
+                                contexts[col] = WindowContext(feature_data)
+                            context = contexts[col]
+                        extracted_features[f"{feature_name}_{col}"] = self._calculate_feature(feature_name, feature_data, params, context)
                 except Exception as e:
                     warning_key = f"{feature_name}_{col}_{str(e)}"
                     if warning_key not in self.warning_registry:
@@ -0,0 +1,130 @@
+import numpy as np
+from .autocorrelation import batch_acf
+
+
+class WindowContext:
+    """
+    Lazily computed intermediates of a single window, shared by the features calculated on it.
+
+    Features that declare a dependency on an intermediate (see `load_feature_dependencies`)
+    receive the context of the window as the `context` keyword argument. Each intermediate is
+    computed on first use and memoized, so it is calculated once per window regardless of how
+    many features rely on it.
+
+    Attributes
+    ----------
+    data : pd.Series or np.ndarray
+        The data of the window for a single column.
+    """
+
+    def __init__(self, data):
+        """
+        Initialize the context of a window.
+
+        Parameters
+        ----------
+        data : pd.Series or np.ndarray
+            The data of the window for a single column.
+        """
+        self.data = data
+        self._cache = {}
+
+    def _memoize(self, key, compute):
+        """
+        Return the cached intermediate `key`, computing it with `compute()` on first use.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def values(self):
+        """np.ndarray: The window as a float64 array."""
+        return self._memoize("values", lambda: np.asarray(self.data, dtype=np.float64))
+
+    @property
+    def has_nan(self):
+        """bool: Whether the window contains NaN values."""
+        return self._memoize("has_nan", lambda: bool(np.isnan(self.values).any()))
+
+    @property
+    def mean(self):
+        """float: Mean of the window."""
+        return self._memoize("mean", lambda: np.mean(self.values))
+
+    def variance(self, ddof=0):
+        """
+        Calculate the variance of the window.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom (default is 0).
+
+        Returns
+        -------
+        float
+            The variance of the window.
+        """
+        return self._memoize(("variance", ddof), lambda: np.var(self.values, ddof=ddof))
+
+    def std(self, ddof=0):
+        """
+        Calculate the standard deviation of the window.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom (default is 0).
+
+        Returns
+        -------
+        float
+            The standard deviation of the window.
+        """
+        return self._memoize(("std", ddof), lambda: np.sqrt(self.variance(ddof)))
+
+    @property
+    def diff(self):
+        """np.ndarray: Differences between consecutive values of the window."""
+        return self._memoize("diff", lambda: np.diff(self.values))
+
+    def acf(self, nlags):
+        """
+        Calculate the autocorrelation function of the window up to `nlags`.
+
+        The ACF of fewer lags is a prefix of the ACF of more lags, so a request is served from
+        any cached ACF with at least as many lags.
+
+        Parameters
+        ----------
+        nlags : int
+            The number of lags to return.
+
+        Returns
+        -------
+        np.ndarray
+            Autocorrelation values for lags 0 to `nlags`.
+        """
+        cached = self._cache.setdefault("acf", {})
+        for cached_lags, values in cached.items():
+            if cached_lags >= nlags:
+                return values[:nlags + 1]
+
+        cached[nlags] = batch_acf(self.values[np.newaxis, :], nlags)[0]
+        return cached[nlags]
+
+    def seed_acf(self, values, nlags):
+        """
+        Provide the autocorrelation function of the window, e.g. maintained incrementally by a
+        `SlidingAutocorrelation` accumulator, so that it is not recomputed.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Autocorrelation values for lags 0 to `nlags` (truncated to the window length).
+        nlags : int
+            The number of lags the values were calculated for.
+        """
+        self._cache.setdefault("acf", {})[nlags] = np.asarray(values, dtype=np.float64)
+
@@ -0,0 +1,318 @@
+import bisect
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def to_window_buffer(group, feature_columns):
+    """
+    Copy the feature columns of a group into one contiguous float64 buffer.
+
+    Parameters
+    ----------
+    group : pd.DataFrame
+        The data of a single group (time series).
+    feature_columns : list of str
+        The columns to place in the buffer.
+
+    Returns
+    -------
+    np.ndarray or None
+        A C-contiguous array of shape (n_columns, n_samples), one row per feature column,
+        or None if any of the columns cannot be represented as float64.
+    """
+    for col in feature_columns:
+        dtype = group[col].dtype
+        if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)):
+            return None
+
+    buffer = np.empty((len(feature_columns), len(group)), dtype=np.float64)
+    for i, col in enumerate(feature_columns):
+        buffer[i] = group[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return buffer
+
+
+def sliding_windows(buffer, window_size, stride=1):
+    """
+    Create strided sliding-window views over the last axis of a buffer without copying it.
+
+    Parameters
+    ----------
+    buffer : np.ndarray
+        A 1-D array of samples or a 2-D array of shape (n_columns, n_samples).
+    window_size : int
+        Number of samples in each window.
+    stride : int, optional
+        Step between the starts of consecutive windows (default is 1).
+
+    Returns
+    -------
+    np.ndarray
+        A read-only view of shape (n_windows, window_size) for 1-D input,
+        or (n_columns, n_windows, window_size) for 2-D input.
+
+    Examples
+    --------
+    >>> sliding_windows(np.arange(5.0), window_size=3)
+    array([[0., 1., 2.],
+           [1., 2., 3.],
+           [2., 3., 4.]])
+    """
+    windows = sliding_window_view(buffer, window_size, axis=-1)
+    return windows[..., ::stride, :]
+
+
+class GroupWindows:
+    """
+    Lazy collection of sliding windows over the feature columns of a single group.
+
+    Numeric groups are held as one (n_columns, n_samples) float64 buffer and every window
+    is a zero-copy view of shape (n_columns, window_size). Groups with non-numeric feature
+    columns fall back to DataFrame slices so that per-feature validation still applies.
+
+    Attributes
+    ----------
+    feature_columns : list of str
+        Columns included in every window.
+    window_size : int
+        Number of samples in each window.
+    stride : int
+        Step between the starts of consecutive windows.
+    buffer : np.ndarray or None
+        The contiguous column buffer, or None for groups handled as DataFrame slices.
+    windows : np.ndarray or None
+        Strided view of shape (n_columns, n_windows, window_size) over `buffer`.
+    """
+
+    def __init__(self, group, feature_columns, window_size, stride):
+        """
+        Initialize the windows of a group.
+
+        Parameters
+        ----------
+        group : pd.DataFrame
+            The data of a single group (time series).
+        feature_columns : list of str
+            Columns for feature extraction.
+        window_size : int
+            Number of samples in each window.
+        stride : int
+            Step between the starts of consecutive windows.
+        """
+        self.feature_columns = feature_columns
+        self.window_size = window_size
+        self.stride = stride
+        self.buffer = to_window_buffer(group, feature_columns)
+
+        if self.buffer is not None:
+            self.frame = None
+            self.windows = sliding_windows(self.buffer, window_size, stride)
+            self._length = self.windows.shape[1]
+        else:
+            self.frame = group
+            self.windows = None
+            self._length = len(range(0, len(group) - window_size + 1, stride))
+
+    @classmethod
+    def from_buffer(cls, buffer, feature_columns, window_size, stride):
+        """
+        Wrap an existing (n_columns, n_samples) float64 buffer, e.g. a slice of an array in
+        shared memory, without copying it.
+
+        Parameters
+        ----------
+        buffer : np.ndarray
+            The samples of the feature columns, one row per column.
+        feature_columns : list of str
+            Columns included in every window.
+        window_size : int
+            Number of samples in each window.
+        stride : int
+            Step between the starts of consecutive windows.
+
+        Returns
+        -------
+        GroupWindows
+            The windows over the buffer.
+        """
+        group_windows = cls.__new__(cls)
+        group_windows.feature_columns = feature_columns
+        group_windows.window_size = window_size
+        group_windows.stride = stride
+        group_windows.buffer = buffer
+        group_windows.frame = None
+        group_windows.windows = sliding_windows(buffer, window_size, stride)
+        group_windows._length = group_windows.windows.shape[1]
+        return group_windows
+
+    @classmethod
+    def from_windows(cls, windows, feature_columns):
+        """
+        Wrap an array of windows that are not taken from a single buffer, e.g. windows of
+        several series gathered from a stream.
+
+        As the windows need not overlap, rolling kernels are not used for them.
+
+        Parameters
+        ----------
+        windows : np.ndarray
+            Array of shape (n_columns, n_windows, window_size).
+        feature_columns : list of str
+            Columns included in every window.
+
+        Returns
+        -------
+        GroupWindows
+            The windows, handled by batch kernels and per-window calls.
+        """
+        group_windows = cls.__new__(cls)
+        group_windows.feature_columns = feature_columns
+        group_windows.window_size = windows.shape[-1]
+        group_windows.stride = group_windows.window_size
+        group_windows.buffer = None
+        group_windows.frame = None
+        group_windows.windows = windows
+        group_windows._length = windows.shape[1]
+        return group_windows
+
+    def subset(self, start, stop):
+        """
+        Return a contiguous range of the windows, holding only the samples they span.
+
+        The subset is what a worker needs to process these windows on its own: its buffer is a
+        view of the samples spanned by the windows, so pickling it copies only these samples,
+        and overlapping windows can still use rolling kernels.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first window.
+        stop : int
+            Index after the last window.
+
+        Returns
+        -------
+        GroupWindows
+            The windows `start` to `stop - 1`.
+        """
+        first = start * self.stride
+        last = (stop - 1) * self.stride + self.window_size
+
+        group_windows = self.__class__.__new__(self.__class__)
+        group_windows.feature_columns = self.feature_columns
+        group_windows.window_size = self.window_size
+        group_windows.stride = self.stride
+        group_windows.buffer = None
+        group_windows.frame = None
+        group_windows.windows = None
+        group_windows._length = stop - start
+        if self.buffer is not None:
+            group_windows.buffer = self.buffer[:, first:last]
+            group_windows.windows = sliding_windows(group_windows.buffer, self.window_size, self.stride)
+        elif self.windows is not None:
+            group_windows.windows = self.windows[:, start:stop]
+        else:
+            group_windows.frame = self.frame.iloc[first:last]
+        return group_windows
+
+    def __getstate__(self):
+        # Pickle the buffer rather than the strided view, which would be copied window by window
+        state = self.__dict__.copy()
+        if self.buffer is not None:
+            state["windows"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.buffer is not None:
+            self.windows = sliding_windows(self.buffer, self.window_size, self.stride)
+
+    @property
+    def is_numeric(self):
+        """bool: Whether the windows are float64 arrays."""
+        return self.windows is not None
+
+    def column_windows(self, col_index):
+        """
+        Return all windows of a single column as a 2-D view.
+
+        Parameters
+        ----------
+        col_index : int
+            Position of the column in `feature_columns`.
+
+        Returns
+        -------
+        np.ndarray
+            A view of shape (n_windows, window_size).
+        """
+        return self.windows[col_index]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Window index out of range.")
+        if self.windows is not None:
+            return self.windows[:, index, :]
+        start = index * self.stride
+        return self.frame.iloc[start : start + self.window_size]
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+
+class WindowTasks:
+    """
+    Lazy sequence of feature extraction tasks over the windows of all groups.
+
+    Each task is a `(window, feature_columns)` tuple, where `window` is produced on demand
+    by the owning `GroupWindows` instead of being materialized up front.
+    """
+
+    def __init__(self, groups=None):
+        """
+        Initialize the task sequence.
+
+        Parameters
+        ----------
+        groups : list of GroupWindows, optional
+            Windows of the groups to include.
+        """
+        self.groups = []
+        self._offsets = [0]
+        for group_windows in groups or []:
+            self.append(group_windows)
+
+    def append(self, group_windows):
+        """
+        Add the windows of one group to the sequence.
+
+        Parameters
+        ----------
+        group_windows : GroupWindows
+            Windows of the group to add.
+        """
+        self.groups.append(group_windows)
+        self._offsets.append(self._offsets[-1] + len(group_windows))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Task index out of range.")
+        group_index = bisect.bisect_right(self._offsets, index) - 1
+        group_windows = self.groups[group_index]
+        return group_windows[index - self._offsets[group_index]], group_windows.feature_columns
+
+    def __iter__(self):
+        for group_windows in self.groups:
+            for window in group_windows:
+                yield window, group_windows.feature_columns
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from interpreTS.core.features.feature_approximate_entropy import calculate_approximate_entropy
+from interpreTS.core.features.feature_approximate_entropy import calculate_approximate_entropy, count_template_matches
 
 def test_approximate_entropy_basic_case():
     data = [1, 2, 3, 4, 5]
@@ -26,3 +26,25 @@ def test_approximate_entropy_with_custom_params():
     data = [1, 3, 5, 7, 9]
     result = calculate_approximate_entropy(data, m=3, r=0.2)
     assert result >= -5, "ApEn should not be significantly negative for data with some variance"
+
+# Test that the vectorized engine matches a pair-by-pair template comparison
+def test_approximate_entropy_matches_naive():
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 4, size=60).astype(float)
+    m, r = 2, 0.5
+    N = len(data)
+
+    def phi(length):
+        templates = np.array([data[i:i + length] for i in range(N - length + 1)])
+        counts = np.array([np.sum(np.max(np.abs(templates - t), axis=1) < r) for t in templates])
+        return np.sum(np.log(counts / len(templates) + 1e-10))
+
+    assert np.isclose(calculate_approximate_entropy(data, m=m, r=r), phi(m) - phi(m + 1))
+
+# Test that blocked template matching gives the same counts for any block size
+def test_count_template_matches_block_size():
+    data = np.random.default_rng(1).normal(size=100)
+    full = count_template_matches(data, 2, 0.3)
+    blocked = count_template_matches(data, 2, 0.3, max_block_elements=50)
+    np.testing.assert_array_equal(full[0], blocked[0])
+    np.testing.assert_array_equal(full[1], blocked[1])
@@ -80,3 +80,20 @@ def test_crossing_points_empty_series():
     result = calculate_crossing_points(data)
     expected = {'crossing_count': 0, 'crossing_points': []}
     assert result == expected, f"Expected {expected}, got {result}"
+
+# Test the count-only output
+def test_crossing_points_count_output():
+    data = pd.Series([1, -1, 2, -2, 3, -3])
+    assert calculate_crossing_points(data, output='count') == 5
+    assert calculate_crossing_points(pd.Series([], dtype=float), output='count') == 0
+
+# Test the compact int32 indices output
+def test_crossing_points_indices_output():
+    result = calculate_crossing_points(np.array([-3, -1, -4, -2, -5]), output='indices')
+    assert result.dtype == np.int32
+    np.testing.assert_array_equal(result, [2, 3, 4])
+
+# Test that an unsupported output format raises an error
+def test_crossing_points_invalid_output():
+    with pytest.raises(ValueError, match="output must be one of"):
+        calculate_crossing_points([1, 2, 3], output='list')
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_entropy import calculate_entropy
+from interpreTS.core.features.feature_entropy import calculate_entropy, calculate_entropy_batch
 
 def test_calculate_entropy_full_series():
     data = pd.Series([1, 3, 5, 2, 7])
@@ -54,3 +54,20 @@ def test_calculate_entropy_with_large_variation():
     data = pd.Series(np.random.rand(10000))
     result = calculate_entropy(data)
     assert result > 0, "Entropy should be greater than 0 for random data"
+
+# Test that the binned KDE matches the exact gaussian_kde within the documented tolerance
+def test_calculate_entropy_matches_gaussian_kde():
+    from scipy.stats import gaussian_kde
+    rng = np.random.default_rng(0)
+    for data in [rng.normal(size=200), rng.exponential(size=500) ** 3, rng.integers(0, 5, size=50).astype(float)]:
+        x = np.linspace(data.min(), data.max(), 100)
+        probabilities = gaussian_kde(data)(x)
+        probabilities /= probabilities.sum()
+        expected = -np.sum(probabilities * np.log2(probabilities)) / np.log2(100)
+        assert calculate_entropy(data) == pytest.approx(expected, abs=1e-3)
+
+# Test that processing the windows in blocks does not change the result
+def test_entropy_batch_blocks():
+    windows = np.random.default_rng(1).normal(size=(20, 40))
+    windows[2] = 3.0
+    np.testing.assert_array_equal(calculate_entropy_batch(windows, max_block_elements=2000), calculate_entropy_batch(windows))
@@ -44,3 +44,12 @@ def test_calculate_linearity_with_derivative():
     assert result_with_derivative > result_no_derivative, (
         f"Expected derivative to increase linearity for cumulative data. Got: {result_with_derivative} vs {result_no_derivative}"
     )
+
+# Test that the closed form matches the least-squares fit of numpy
+def test_calculate_linearity_matches_polyfit():
+    data = np.random.default_rng(0).normal(size=40)
+    derivative = np.diff(data)
+    positions = np.arange(len(derivative))
+    residuals = derivative - np.polyval(np.polyfit(positions, derivative, 1), positions)
+    expected = 1 - np.sum(residuals ** 2) / np.sum((derivative - derivative.mean()) ** 2)
+    assert calculate_linearity(data) == pytest.approx(expected)
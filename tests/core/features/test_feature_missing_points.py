@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_missing_points import calculate_missing_points 
+from interpreTS.core.features.feature_missing_points import calculate_missing_points
 
 # Test basic functionality with missing points
 def test_missing_points_basic():
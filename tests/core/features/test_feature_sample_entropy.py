@@ -0,0 +1,39 @@
+import pytest
+import numpy as np
+from interpreTS.core.features.feature_sample_entropy import calculate_sample_entropy
+
+# Test sample entropy for a perfectly periodic series
+def test_sample_entropy_periodic():
+    data = [1, 2, 1, 2, 1, 2, 1, 2]
+    assert calculate_sample_entropy(data, m=2, r=0.5) == 0.0
+
+# Test that sample entropy is NaN for too short series
+def test_sample_entropy_too_short():
+    assert np.isnan(calculate_sample_entropy([1, 2, 3], m=2))
+
+# Test that sample entropy is NaN when no templates match
+def test_sample_entropy_no_matches():
+    data = [1, 10, 100, 1000, 10000]
+    assert np.isnan(calculate_sample_entropy(data, m=2, r=0.2))
+
+# Test that sample entropy matches a pair-by-pair template comparison
+def test_sample_entropy_matches_naive():
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 3, size=50).astype(float)
+    m, r = 2, 0.5
+    N = len(data)
+
+    def matches(length):
+        templates = np.array([data[i:i + length] for i in range(N - m)])
+        distances = np.max(np.abs(templates[:, None, :] - templates[None, :, :]), axis=2)
+        return np.sum(distances < r) - len(templates)
+
+    expected = -np.log(matches(m + 1) / matches(m))
+    assert calculate_sample_entropy(data, m=m, r=r) == pytest.approx(expected)
+
+# Test that random data is less regular than periodic data
+def test_sample_entropy_random_vs_periodic():
+    rng = np.random.default_rng(1)
+    periodic = np.tile([0.0, 1.0, 2.0], 50)
+    noisy = rng.normal(size=150)
+    assert calculate_sample_entropy(noisy) > calculate_sample_entropy(periodic)
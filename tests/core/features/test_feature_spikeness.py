@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_spikeness import calculate_spikeness
+from interpreTS.core.features.feature_spikeness import calculate_spikeness, calculate_spikeness_batch
 
 # Test spikeness for a simple symmetric series
 def test_calculate_spikeness_simple_case():
@@ -55,3 +55,9 @@ def test_calculate_spikeness_non_numeric():
     data = pd.Series(["a", "b", "c", "d"])
     with pytest.raises(TypeError, match="Data must contain only numeric values."):
         calculate_spikeness(data)
+
+# Test that the batch warning counts the windows with NaN values, not their overlapping values
+def test_spikeness_batch_nan_warning(capsys):
+    windows = np.lib.stride_tricks.sliding_window_view(np.r_[np.arange(6.0), np.nan, np.arange(6.0)], 5)
+    calculate_spikeness_batch(windows)
+    assert capsys.readouterr().out == "Warning: NaN values were dropped for spikeness calculation in 5 windows.\n"
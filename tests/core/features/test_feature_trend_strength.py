@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_trend_strength import calculate_trend_strength
+from interpreTS.core.features.feature_trend_strength import calculate_trend_strength, calculate_trend_strength_batch, calculate_trend_strength_rolling
+from interpreTS.utils.rolling_moments import RollingMoments
 
 # Test for a perfect increasing trend
 def test_trend_strength_increasing_data():
@@ -57,3 +58,19 @@ def test_trend_strength_with_random_data():
     data = pd.Series(rng.normal(size=100))
     result = calculate_trend_strength(data)
     assert 0.0 <= result <= 1.0, f"Expected trend strength between 0 and 1, got {result}"
+
+# Test that the closed form matches the R-squared of scipy's linear regression
+def test_trend_strength_matches_linregress():
+    from scipy.stats import linregress
+    data = np.random.default_rng(0).normal(size=50)
+    expected = linregress(np.arange(50), data).rvalue ** 2
+    assert calculate_trend_strength(data) == pytest.approx(expected)
+
+# Test that the rolling kernel stays accurate after a level shift at the default anchoring
+def test_trend_strength_rolling_level_shift():
+    rng = np.random.default_rng(3)
+    data = np.concatenate([rng.normal(size=3000), 1e6 + rng.normal(size=3000), np.full(500, 1e6)])
+    windows = np.lib.stride_tricks.sliding_window_view(data, 40)
+    result = calculate_trend_strength_rolling(RollingMoments(data, window_size=40))
+    np.testing.assert_allclose(result, calculate_trend_strength_batch(windows), atol=1e-10)
+    np.testing.assert_array_equal(result[-400:], 0.0)
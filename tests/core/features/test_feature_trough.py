@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_trough import calculate_trough  
+from interpreTS.core.features.feature_trough import calculate_trough
 
 # Test trough calculation for the full series
 def test_calculate_trough_full_series():
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from interpreTS.core.features.feature_variance import calculate_variance
+from interpreTS.core.features.feature_variance import calculate_variance, calculate_variance_batch
 
 # Test variance calculation for a basic series
 def test_calculate_variance_basic():
@@ -38,3 +38,9 @@ def test_calculate_variance_all_identical_values():
     expected = 0.0  # Variance of identical values is 0
     result = calculate_variance(data)
     assert result == expected, f"Expected {expected}, but got {result}."
+
+# Test that the batch kernel honours ddof
+def test_variance_batch_ddof():
+    windows = np.array([[1, 2, 3, 4, 5], [5, 5, 5, 5, 5], [-1, 0, 2, 7, 3], [2, 9, 1, 1, 4]], dtype=float)
+    expected = [calculate_variance(window, ddof=1) for window in windows]
+    np.testing.assert_allclose(calculate_variance_batch(windows, ddof=1), np.asarray(expected, dtype=float))
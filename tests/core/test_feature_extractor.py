@@ -1,10 +1,14 @@
+import asyncio
+import itertools
 import re
 import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import MagicMock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from interpreTS.utils.feature_loader import Features
 from interpreTS.core.feature_extractor import FeatureExtractor
+from interpreTS.core.feature_stream import FeatureStream
 
 @pytest.fixture
 def mock_feature_extractor():
@@ -72,6 +76,80 @@ def test_extract_features_sequential(mock_feature_extractor):
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 2
 
+# Test that the shared-memory mode matches the sequential mode, including windows with NaN values
+def test_extract_features_shared_memory():
+    values = np.random.default_rng(8).normal(size=300)
+    values[[40, 250]] = np.nan
+    data = pd.DataFrame({"id": np.repeat([1, 2, 3], 100), "value": values})
+    extractor = FeatureExtractor(window_size=20, stride=3, id_column="id", feature_column="value")
+    expected = extractor.extract_features(data)
+
+    progress = []
+    result = extractor.extract_features(data, progress_callback=progress.append, mode="shared-memory", n_jobs=2)
+    pd.testing.assert_frame_equal(result, expected.astype(float))
+    assert progress[-1] == 100
+
+# Test that features listed twice, as in the built-in feature sets, yield one column in shared-memory mode
+@pytest.mark.parametrize("features", ["default-big", [Features.MEAN, Features.MEAN]])
+def test_extract_features_shared_memory_duplicate_features(features):
+    data = pd.DataFrame({"id": np.repeat([1, 2], 60), "value": np.random.default_rng(11).normal(size=120)})
+    extractor = FeatureExtractor(features=features, window_size=20, stride=5, id_column="id", feature_column="value")
+    expected = extractor.extract_features(data)
+    result = extractor.extract_features(data, mode="shared-memory", n_jobs=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+# Test that parallel extraction matches the sequential extraction on level shifts and flat segments
+@pytest.mark.parametrize("mode", ["parallel", "shared-memory"])
+def test_extract_features_parallel_level_shift(mode):
+    rng = np.random.default_rng(10)
+    values = np.r_[rng.normal(size=3000), 1e6 + rng.normal(size=3000), np.full(2000, 1e4), np.full(2000, 1e3)]
+    data = pd.DataFrame({"value": values})
+    extractor = FeatureExtractor(
+        features=[Features.MEAN, Features.VARIANCE, Features.HETEROGENEITY, Features.SPIKENESS],
+        window_size=40, stride=1, feature_column="value"
+    )
+    expected = extractor.extract_features(data)
+    result = extractor.extract_features(data, mode=mode, n_jobs=2)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9, atol=1e-9)
+
+# Test that extraction from files in chunks matches the extraction of each series, for any chunk size
+@pytest.mark.parametrize("window_size, stride, chunk_size", [(10, 1, 7), (10, 4, 64), (5, 13, 1000)])
+def test_extract_features_from_files(tmp_path, window_size, stride, chunk_size):
+    rng = np.random.default_rng(9)
+    data = pd.DataFrame({"id": np.repeat(np.arange(12), rng.integers(3, 80, size=12))})
+    data["value"] = rng.normal(size=len(data))
+    data.loc[::37, "value"] = np.nan
+    data.iloc[:200].to_parquet(tmp_path / "first.parquet", row_group_size=50)
+    data.iloc[200:].to_parquet(tmp_path / "second.parquet", row_group_size=50)
+    data.to_csv(tmp_path / "data.csv", index=False)
+
+    extractor = FeatureExtractor(window_size=window_size, stride=stride, id_column="id", feature_column="value")
+    expected = pd.concat(
+        [extractor.extract_features(group).assign(id=series_id) for series_id, group in data.groupby("id") if len(group) >= window_size],
+        ignore_index=True
+    ).astype(float)
+
+    progress = []
+    extractor.extract_features_from_files(
+        [tmp_path / "first.parquet", tmp_path / "second.parquet"], output=tmp_path / "features.parquet",
+        chunk_size=chunk_size, progress_callback=progress.append
+    )
+    assert progress[-1] == len(data)
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "features.parquet").astype(float), expected)
+    result = extractor.extract_features_from_files(tmp_path / "data.csv", chunk_size=chunk_size)
+    pd.testing.assert_frame_equal(result.astype(float), expected)
+
+# Test that extraction from files requires inputs sorted by series and windows of a number of samples
+def test_extract_features_from_files_invalid(tmp_path):
+    pd.DataFrame({"id": [1, 1, 2, 2, 1, 1], "value": np.arange(6.0)}).to_csv(tmp_path / "data.csv", index=False)
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size=2, id_column="id", feature_column="value")
+    with pytest.raises(ValueError, match="must be sorted by 'id'"):
+        extractor.extract_features_from_files(tmp_path / "data.csv", chunk_size=3)
+
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size="1min", id_column="id", feature_column="value")
+    with pytest.raises(ValueError, match="numbers of samples"):
+        extractor.extract_features_from_files(tmp_path / "data.csv")
+
 def test_validate_time_based_window_and_stride(mock_feature_extractor):
     # Test with missing datetime index
     data = pd.DataFrame({
@@ -193,3 +271,276 @@ def test_create_extractor_with_feature_list():
     assert extractor.features.__len__() == FeatureExtractor.FOR_ML.__len__()
     assert not features.empty
     assert features.columns.__len__() == FeatureExtractor.FOR_ML.__len__()*3
+
+# Test that fit precomputes training statistics and gives the same features as raw training data
+def test_fit_transform_reference_statistics():
+    rng = np.random.default_rng(0)
+    training_data = rng.normal(size=1000)
+    data = pd.DataFrame({"value": rng.normal(size=60)})
+    features = [Features.ABOVE_9TH_DECILE, Features.BELOW_1ST_DECILE, Features.OUTLIERS_IQR, Features.OUTLIERS_STD]
+    feature_params = {feature: {"training_data": training_data} for feature in features}
+
+    expected = FeatureExtractor(features=features, feature_params=feature_params, window_size=10, stride=5).extract_features(data)
+    extractor = FeatureExtractor(features=features, feature_params=feature_params, window_size=10, stride=5)
+    result = extractor.fit_transform(data)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert extractor.reference_statistics[Features.ABOVE_9TH_DECILE]["ninth_decile"] == np.percentile(training_data, 90)
+    assert all("training_data" not in extractor.feature_params[feature] for feature in features)
+    assert "training_data" in feature_params[Features.OUTLIERS_STD]
+
+# Test that a fitted extractor can be pickled and reused
+def test_fit_pickle():
+    import pickle
+    data = pd.DataFrame({"value": np.arange(20.0)})
+    extractor = FeatureExtractor(features=[Features.ABOVE_9TH_DECILE], window_size=5, stride=5).fit(np.arange(10.0))
+    restored = pickle.loads(pickle.dumps(extractor))
+    pd.testing.assert_frame_equal(restored.transform(data), extractor.transform(data))
+    assert restored.reference_statistics == extractor.reference_statistics
+
+# Test that fitting without training data raises an error
+def test_fit_without_training_data():
+    extractor = FeatureExtractor(features=[Features.OUTLIERS_STD], window_size=5)
+    with pytest.raises(ValueError, match="Training data is required"):
+        extractor.fit()
+
+# Test that streamed stability and seasonality strength match the batch extraction
+def test_extract_features_stream_incremental_acf():
+    values = np.cumsum(np.random.default_rng(0).normal(size=80))
+    extractor = FeatureExtractor(
+        features=[Features.STABILITY, Features.SEASONALITY_STRENGTH], window_size=20,
+        id_column="id", feature_column="value", feature_params={Features.SEASONALITY_STRENGTH: {"period": 4}}
+    )
+    results = pd.DataFrame(extractor.extract_features_stream({"id": 1, "value": value} for value in values))
+    expected = extractor.extract_features(pd.DataFrame({"id": 1, "value": values}))
+    np.testing.assert_allclose(results[["stability_value", "seasonality_strength_value"]].to_numpy(dtype=float), expected.to_numpy(dtype=float), atol=1e-9)
+
+# Test that streamed windows of interleaved series match the batch extraction per series
+def test_extract_features_stream_interleaved_series():
+    values = np.random.default_rng(1).normal(size=60)
+    ids = np.tile([1, 2], 30)
+    extractor = FeatureExtractor(features=[Features.MEAN, Features.VARIANCE], window_size=10, id_column="id", feature_column="value")
+    results = pd.DataFrame(extractor.extract_features_stream({"id": i, "value": v} for i, v in zip(ids, values)))
+    for series_id in [1, 2]:
+        expected = extractor.extract_features(pd.DataFrame({"id": series_id, "value": values[ids == series_id]}))
+        streamed = results[results["id"] == series_id][["mean_value", "variance_value"]]
+        np.testing.assert_allclose(streamed.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+# Test that features with incremental states match the per-window extraction, including windows with NaN values
+def test_extract_features_stream_incremental_states():
+    values = np.round(np.random.default_rng(2).normal(size=120) * 3)
+    values[[17, 18, 64]] = np.nan
+    features = [
+        Features.MEAN, Features.VARIANCE, Features.PEAK, Features.TROUGH, Features.MISSING_POINTS,
+        Features.BINARIZE_MEAN, Features.CROSSING_POINTS, Features.ABSOLUTE_ENERGY, Features.ENTROPY
+    ]
+    extractor = FeatureExtractor(
+        features=features, window_size=15, id_column="id", feature_column="value",
+        feature_params={Features.CROSSING_POINTS: {"output": "count"}}
+    )
+    assert set(FeatureStream(extractor)._stream_incremental_states()) == set(features) - {Features.ENTROPY}
+
+    results = pd.DataFrame(extractor.extract_features_stream({"id": 1, "value": value} for value in values))
+    expected = extractor.extract_features(pd.DataFrame({"id": 1, "value": values}))
+    assert list(results.columns[:-1]) == list(expected.columns)
+    np.testing.assert_allclose(
+        results[expected.columns].mask(results[expected.columns].isna()).to_numpy(dtype=float), expected.mask(expected.isna()).to_numpy(dtype=float), rtol=1e-9
+    )
+
+# Test that time-based stream windows hold the points of (t - window_size, t] for irregular timestamps
+def test_extract_features_stream_time_window():
+    rng = np.random.default_rng(3)
+    times = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.cumsum(rng.integers(1, 90, size=200)), unit="s")
+    values = rng.normal(size=200)
+    extractor = FeatureExtractor(features=[Features.MEAN, Features.LENGTH], window_size="5min", id_column="id", sort_column="time", feature_column="value")
+    results = pd.DataFrame(extractor.extract_features_stream({"id": 1, "time": t, "value": v} for t, v in zip(times, values)))
+
+    rolling = pd.Series(values, index=times).rolling("5min")
+    covered = times - times[0] >= pd.Timedelta("5min")
+    np.testing.assert_allclose(results["mean_value"].to_numpy(dtype=float), rolling.mean()[covered].to_numpy())
+    np.testing.assert_array_equal(results["length_value"].to_numpy(dtype=int), rolling.count()[covered].to_numpy(dtype=int))
+
+# Test that a time-based stride emits at most one window per stride and series
+def test_extract_features_stream_time_stride():
+    times = pd.date_range("2024-01-01", periods=60, freq="1min")
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size="10min", stride="15min", id_column="id", sort_column="time", feature_column="value")
+    results = list(extractor.extract_features_stream({"id": 1, "time": str(t), "value": i} for i, t in enumerate(times)))
+    assert [result["mean_value"] for result in results] == [5.5, 20.5, 35.5, 50.5]
+
+# Test that the time-based stream consumes its input lazily
+def test_extract_features_stream_time_window_lazy():
+    points = ({"id": 1, "time": i * 10**9, "value": float(i)} for i in itertools.count())
+    extractor = FeatureExtractor(features=[Features.PEAK], window_size="3s", id_column="id", sort_column="time", feature_column="value")
+    results = list(itertools.islice(extractor.extract_features_stream(points), 3))
+    assert [result["peak_value"] for result in results] == [3.0, 4.0, 5.0]
+
+# Test that invalid timestamps are rejected in time-based streaming
+def test_extract_features_stream_time_window_invalid_timestamp():
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size="1min", id_column="id", sort_column="time", feature_column="value")
+    with pytest.raises(ValueError, match="does not contain valid datetime values"):
+        list(extractor.extract_features_stream([{"id": 1, "time": "not a time", "value": 1.0}]))
+
+# Test that pushing batches of interleaved series matches pushing their points one by one
+@pytest.mark.parametrize("batch_size", [7, 150, 400])
+def test_feature_stream_push_batch_matches_push(batch_size):
+    rng = np.random.default_rng(5)
+    ids = rng.choice(["a", "b", "c"], p=[0.8, 0.1, 0.1], size=400)
+    values = rng.normal(size=400)
+    values[[30, 31, 200]] = np.nan
+    data = pd.DataFrame({"id": ids, "value": values})
+    extractor = FeatureExtractor(
+        features=[Features.MEAN, Features.VARIANCE, Features.PEAK, Features.STABILITY, Features.ENTROPY],
+        window_size=12, id_column="id", feature_column="value"
+    )
+    stream = FeatureStream(extractor)
+    expected = pd.DataFrame([row for row in map(stream.push, data.to_dict("records")) if row is not None])
+
+    stream = FeatureStream(extractor)
+    batches = [stream.push_batch(data.iloc[i:i + batch_size]) for i in range(0, 400, batch_size)]
+    results = pd.concat([batch for batch in batches if not batch.empty], ignore_index=True)
+    assert stream.total_points == 400
+    assert results["id"].tolist() == expected["id"].tolist()
+    columns = expected.columns.drop("id")
+    np.testing.assert_allclose(
+        results[columns].mask(results[columns].isna()).to_numpy(dtype=float), expected[columns].mask(expected[columns].isna()).to_numpy(dtype=float),
+        rtol=1e-7, atol=1e-9
+    )
+
+# Test that pushing a batch matches pushing its points one by one on level shifts and flat runs
+def test_feature_stream_push_batch_level_shift():
+    rng = np.random.default_rng(7)
+    values = np.r_[rng.normal(size=600), 1e6 + rng.normal(size=600), np.full(300, 1e4), np.full(300, 1e3)]
+    data = pd.DataFrame({"id": 1, "value": values})
+    extractor = FeatureExtractor(
+        features=[
+            Features.MEAN, Features.VARIANCE, Features.HETEROGENEITY, Features.SPIKENESS,
+            Features.TREND_STRENGTH, Features.STABILITY, Features.SEASONALITY_STRENGTH
+        ],
+        window_size=40, id_column="id", feature_column="value"
+    )
+    stream = FeatureStream(extractor)
+    expected = pd.DataFrame([row for row in map(stream.push, data.to_dict("records")) if row is not None])
+
+    results = FeatureStream(extractor).push_batch(data)
+    columns = expected.columns.drop("id")
+    assert len(results) == len(expected)
+    np.testing.assert_allclose(results[columns].to_numpy(dtype=float), expected[columns].to_numpy(dtype=float), rtol=1e-7, atol=1e-9)
+
+# Test that pushing a batch with time-based windows matches pushing its points one by one
+def test_feature_stream_push_batch_time_window():
+    rng = np.random.default_rng(6)
+    data = pd.DataFrame({
+        "id": np.tile([1, 2], 60),
+        "time": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.cumsum(rng.integers(1, 60, size=120)), unit="s"),
+        "value": rng.normal(size=120)
+    })
+    extractor = FeatureExtractor(features=[Features.MEAN, Features.LENGTH], window_size="5min", stride="2min", id_column="id", sort_column="time", feature_column="value")
+    stream = FeatureStream(extractor)
+    expected = pd.DataFrame([row for row in map(stream.push, data.to_dict("records")) if row is not None])
+
+    stream = FeatureStream(extractor)
+    results = pd.concat([stream.push_batch(data.iloc[:50]), stream.push_batch(data.iloc[50:])], ignore_index=True)
+    pd.testing.assert_frame_equal(results, expected, check_dtype=False)
+
+# Test that a batch without complete windows returns an empty frame with the feature columns
+def test_feature_stream_push_batch_empty():
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size=5, id_column="id", feature_column="value")
+    results = FeatureStream(extractor).push_batch({"id": [1, 1, 2], "value": [1.0, 2.0, 3.0]})
+    assert results.empty
+    assert list(results.columns) == ["mean_value", "id"]
+
+# Test that a stream restored from a checkpoint emits the same features as an uninterrupted stream
+@pytest.mark.parametrize("window_size, series_ids", [(10, [1, 2, 3]), (10, [(1, "a"), "b", 2.5]), ("2min", ["a", "b"])])
+def test_feature_stream_checkpoint_restore(window_size, series_ids, tmp_path):
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=150)
+    values[[20, 90]] = np.nan
+    points = [
+        {"id": series_ids[i % len(series_ids)], "time": pd.Timestamp("2024-01-01") + pd.Timedelta(seconds=int(t)), "value": v}
+        for i, (t, v) in enumerate(zip(np.cumsum(rng.integers(1, 20, size=150)), values))
+    ]
+    extractor = FeatureExtractor(
+        features=[Features.MEAN, Features.VARIANCE, Features.PEAK, Features.STABILITY], window_size=window_size,
+        id_column="id", sort_column="time", feature_column="value"
+    )
+    expected = list(extractor.extract_features_stream(points))
+
+    stream = FeatureStream(extractor)
+    results = list(extractor.extract_features_stream(points[:70], stream=stream))
+    stream.checkpoint(tmp_path / "stream.npz")
+    restored = FeatureStream.restore(extractor, tmp_path / "stream.npz")
+    # A stream restored before any of its series are pushed to is checkpointed unchanged
+    restored = FeatureStream.restore(extractor, restored.checkpoint())
+    results += list(extractor.extract_features_stream(points[70:], stream=restored))
+
+    assert restored.total_points == 150
+    assert [result["id"] for result in results] == [result["id"] for result in expected]
+    results, expected = pd.DataFrame(results).drop(columns="id"), pd.DataFrame(expected).drop(columns="id")
+    np.testing.assert_allclose(results.mask(results.isna()).to_numpy(dtype=float), expected.mask(expected.isna()).to_numpy(dtype=float), rtol=1e-9)
+
+# Test that snapshots are only restored with the configuration they were taken with
+def test_feature_stream_restore_invalid():
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size=5, id_column="id", feature_column="value")
+    snapshot = FeatureStream(extractor).checkpoint()
+    other = FeatureExtractor(features=[Features.MEAN], window_size=6, id_column="id", feature_column="value")
+    with pytest.raises(ValueError, match="different window size, stride or features"):
+        FeatureStream.restore(other, snapshot)
+    with pytest.raises(ValueError, match="Invalid stream snapshot"):
+        FeatureStream.restore(extractor, b"not a snapshot")
+
+async def _produce(points, produced=None):
+    """
+    Yield data points from memory like an asynchronous consumer, counting the points read.
+    """
+    for point in points:
+        await asyncio.sleep(0)
+        if produced is not None:
+            produced.append(point)
+        yield point
+
+async def _collect(stream):
+    """
+    Collect the results of an async feature stream.
+    """
+    return [features async for features in stream]
+
+# Test that the async stream matches the synchronous stream, also with a process pool
+@pytest.mark.parametrize("executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_extract_features_astream_matches_stream(executor_class):
+    values = np.random.default_rng(4).normal(size=90)
+    points = [{"id": i % 3, "value": v} for i, v in enumerate(values)]
+    extractor = FeatureExtractor(features=[Features.MEAN, Features.ENTROPY, Features.STABILITY], window_size=10, id_column="id", feature_column="value")
+    expected = list(extractor.extract_features_stream(points))
+
+    if executor_class is None:
+        results = asyncio.run(_collect(extractor.extract_features_astream(_produce(points), max_batch_size=7)))
+    else:
+        with executor_class(max_workers=2) as executor:
+            results = asyncio.run(_collect(extractor.extract_features_astream(_produce(points), executor=executor)))
+    assert pd.DataFrame(results).equals(pd.DataFrame(expected))
+
+# Test that a slow consumer bounds the number of points read ahead of the computation
+def test_extract_features_astream_backpressure():
+    points = [{"id": 1, "value": float(i)} for i in range(200)]
+    produced = []
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size=2, id_column="id", feature_column="value")
+
+    async def consume():
+        lead = 0
+        async for features in extractor.extract_features_astream(_produce(points, produced), max_pending=4, max_batch_size=2):
+            lead = max(lead, len(produced) - int(features["mean_value"] + 0.5) - 1)
+            for _ in range(5):
+                await asyncio.sleep(0)
+        return lead
+
+    assert asyncio.run(consume()) <= 4 + 2 + 1
+
+# Test that errors raised by the async iterator are propagated
+def test_extract_features_astream_producer_error():
+    async def failing():
+        yield {"id": 1, "value": 1.0}
+        raise RuntimeError("connection lost")
+
+    extractor = FeatureExtractor(features=[Features.MEAN], window_size=2, id_column="id", feature_column="value")
+    with pytest.raises(RuntimeError, match="connection lost"):
+        asyncio.run(_collect(extractor.extract_features_astream(failing())))
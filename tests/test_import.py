@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+# Import-time budget (in seconds) of interpreTS on top of pandas and numpy
+IMPORT_TIME_BUDGET = 1.0
+
+HEAVY_MODULES = ["dask", "statsmodels", "sklearn", "scipy.stats", "scipy.signal", "streamlit", "langchain", "openai"]
+
+def _run_in_subprocess(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+# Test that importing interpreTS does not load heavy optional dependencies
+def test_import_does_not_load_heavy_modules():
+    loaded = _run_in_subprocess(
+        "import json, sys\n"
+        "import interpreTS\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    assert loaded == []
+
+# Test that importing interpreTS stays within the import-time budget
+def test_import_time_within_budget():
+    elapsed = _run_in_subprocess(
+        "import json, time\n"
+        "import numpy, pandas\n"
+        "start = time.perf_counter()\n"
+        "import interpreTS\n"
+        "print(json.dumps(time.perf_counter() - start))\n"
+    )
+    assert elapsed < IMPORT_TIME_BUDGET
@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+from interpreTS.utils.autocorrelation import batch_acf, SlidingAutocorrelation
+
+# Test that the batched ACF matches statsmodels for every window, for direct and FFT lags
+@pytest.mark.parametrize("max_lag", [12, 60])
+def test_batch_acf_matches_statsmodels(max_lag):
+    from statsmodels.tsa.stattools import acf
+    windows = np.random.default_rng(0).normal(size=(10, 80))
+    result = batch_acf(windows, max_lag=max_lag)
+    np.testing.assert_allclose(result, [acf(window, nlags=max_lag, fft=True) for window in windows], atol=1e-12)
+
+# Test that lags beyond the window length are not returned
+def test_batch_acf_truncates_lags():
+    result = batch_acf(np.array([[1.0, 3.0, 2.0, 5.0]]), max_lag=10)
+    assert result.shape == (1, 4)
+    assert result[0, 0] == pytest.approx(1.0)
+
+# Test that processing in blocks gives the same result
+def test_batch_acf_blocks():
+    windows = np.random.default_rng(1).normal(size=(50, 48))
+    np.testing.assert_allclose(batch_acf(windows, 8, max_block_elements=64), batch_acf(windows, 8))
+    np.testing.assert_allclose(batch_acf(windows, 40, max_block_elements=256), batch_acf(windows, 40))
+
+# Test that constant windows yield NaN
+def test_batch_acf_constant_window():
+    result = batch_acf(np.array([[2.0, 2.0, 2.0]]), max_lag=1)
+    assert np.isnan(result).all()
+
+# Test that the incremental accumulator matches the ACF of every sliding window
+def test_sliding_autocorrelation_matches_batch():
+    data = 1e3 + np.cumsum(np.random.default_rng(2).normal(size=120))
+    expected = batch_acf(np.lib.stride_tricks.sliding_window_view(data, 20), max_lag=6)
+    accumulator = SlidingAutocorrelation(window_size=20, max_lag=6, resync_every=7)
+    for i, value in enumerate(data):
+        accumulator.update(value)
+        if i >= 19:
+            np.testing.assert_allclose(accumulator.acf(), expected[i - 19], atol=1e-9)
+
+# Test that the accumulator yields NaN until full and while NaN values are in the window
+def test_sliding_autocorrelation_nan():
+    accumulator = SlidingAutocorrelation(window_size=4, max_lag=2)
+    for value in [1.0, 2.0, np.nan]:
+        accumulator.update(value)
+        assert np.isnan(accumulator.acf()).all()
+    for value in [4.0, 3.0, 5.0]:
+        accumulator.update(value)
+    assert np.isnan(accumulator.acf()).all()
+    accumulator.update(2.0)
+    np.testing.assert_allclose(accumulator.acf(), batch_acf(np.array([[4.0, 3.0, 5.0, 2.0]]), 2)[0])
+
+# Test that extending the accumulator matches updating it with the values one by one
+def test_sliding_autocorrelation_extend():
+    data = np.random.default_rng(4).normal(size=50)
+    extended = SlidingAutocorrelation(window_size=10, max_lag=3)
+    updated = SlidingAutocorrelation(window_size=10, max_lag=3)
+    for chunk in np.split(data, [4, 7, 30]):
+        extended.extend(chunk)
+        for value in chunk:
+            updated.update(value)
+        np.testing.assert_allclose(extended.acf(), updated.acf(), atol=1e-9, equal_nan=True)
@@ -0,0 +1,166 @@
+import pytest
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from interpreTS.core.feature_extractor import FeatureExtractor
+from interpreTS.utils.data_manager import (
+    load_feature_functions, load_batch_feature_functions, load_rolling_feature_functions, load_incremental_feature_states,
+    load_reference_statistics_functions, load_validation_requirements
+)
+from interpreTS.utils.feature_loader import Features
+from interpreTS.utils.rolling_moments import RollingMoments
+
+# Parameter sets of the features whose batch kernel is checked with more than the defaults
+BATCH_PARAMS = {
+    Features.VARIANCE: [{}, {"ddof": 1}],
+    Features.ABSOLUTE_ENERGY: [{}, {"start": 1, "end": 4}],
+    Features.MISSING_POINTS: [{}, {"percentage": False}],
+    Features.ABOVE_9TH_DECILE: [{"training_data": np.arange(1, 11)}],
+    Features.BELOW_1ST_DECILE: [{"training_data": np.arange(1, 11)}],
+    Features.OUTLIERS_STD: [{"training_data": np.arange(1, 11)}],
+    Features.OUTLIERS_IQR: [{"training_data": np.arange(1, 11)}],
+    Features.CROSSING_POINTS: [{}, {"output": "count"}, {"output": "indices"}],
+    Features.FLAT_SPOTS: [{}, {"window_size": 4}],
+    Features.LINEARITY: [{"use_derivative": True}, {"use_derivative": False}],
+    Features.STABILITY: [{}, {"max_lag": 5}],
+    Features.SEASONALITY_STRENGTH: [{}, {"period": 6}],
+}
+
+def _windows():
+    """
+    Windows of 12 values with noise, ties, constant runs, level shifts, seasonality and NaN values.
+    """
+    rng = np.random.default_rng(0)
+    windows = np.vstack([
+        rng.normal(size=(6, 12)),
+        rng.integers(-2, 3, size=(6, 12)),
+        np.sin(np.arange(12) * np.pi / 3) + rng.normal(0, 0.3, size=(3, 12)),
+        np.full((1, 12), 3.0),
+        np.r_[np.zeros(6), np.full(6, 1e6)],
+        np.r_[rng.normal(size=4), 1e6 + rng.normal(size=8)],
+        np.r_[np.full(4, 1e4), np.full(8, 1e3)],
+        [1, 1, 1, 1, 10, 1, 2, 2, 2, 2, -8, 3],
+    ]).astype(float)
+    with_nan = windows[[0, 6, 16]].copy()
+    with_nan[0, 3] = np.nan
+    with_nan[1, 5:8] = np.nan
+    with_nan[2, -1] = np.nan
+    return np.vstack([windows, with_nan])
+
+def _case_id(feature, params):
+    """
+    Name a test case after the feature and its non-array parameters.
+    """
+    names = [name if isinstance(value, np.ndarray) else f"{name}={value}" for name, value in params.items()]
+    return "-".join([feature] + names)
+
+BATCH_CASES = [
+    pytest.param(feature, params, id=_case_id(feature, params))
+    for feature in load_batch_feature_functions() for params in BATCH_PARAMS.get(feature, [{}])
+]
+
+# Test that every batch kernel matches the per-window calculation, on the windows it is used for
+@pytest.mark.parametrize("feature, params", BATCH_CASES)
+def test_batch_kernels_match_windows(feature, params, capsys):
+    windows = _windows()
+    # Windows with NaN values yield NaN without calculation for features that do not allow them
+    if not load_validation_requirements().get(feature, {}).get("allow_nan", False):
+        windows = windows[~np.isnan(windows).any(axis=1)]
+
+    result = load_batch_feature_functions()[feature](windows, **params)
+    calculate = load_feature_functions()[feature]
+    assert len(result) == len(windows)
+    for window, value in zip(windows, result):
+        expected = calculate(window, **params)
+        if isinstance(expected, (dict, list)):
+            assert value == expected, window
+        else:
+            assert value == pytest.approx(expected, rel=1e-7, abs=1e-9, nan_ok=True), window
+
+# Parameter sets of the features whose rolling kernel is checked with more than the defaults
+ROLLING_PARAMS = {
+    Features.VARIANCE: [{}, {"ddof": 1}],
+    Features.ABOVE_9TH_DECILE: [{"training_data": np.arange(-2, 3)}],
+    Features.BELOW_1ST_DECILE: [{"training_data": np.arange(-2, 3)}],
+    Features.OUTLIERS_STD: [{"training_data": np.arange(-2, 3)}],
+    Features.OUTLIERS_IQR: [{"training_data": np.arange(-2, 3)}],
+    Features.FLAT_SPOTS: [{}, {"window_size": 4}],
+    Features.LINEARITY: [{"use_derivative": True}, {"use_derivative": False}],
+    Features.STABILITY: [{}, {"max_lag": 5}],
+    Features.SEASONALITY_STRENGTH: [{}, {"period": 6}],
+}
+
+def _rolling_series():
+    """
+    Series of 240 values: a spike, level shifts with flat segments, values at the 1e-8 scale
+    and noise with NaN values.
+    """
+    rng = np.random.default_rng(1)
+    spike = rng.normal(size=240)
+    spike[60] = 1e9
+    nan = rng.normal(size=240)
+    nan[[30, 31, 150]] = np.nan
+    return {
+        "spike": spike,
+        "level_shift": np.r_[rng.normal(size=80), 1e6 + rng.normal(size=80), np.full(40, 1e4), np.full(40, 1e3)],
+        "small_scale": 1e-8 * rng.normal(size=240),
+        "nan": nan,
+    }
+
+ROLLING_SERIES = _rolling_series()
+
+ROLLING_CASES = [
+    pytest.param(feature, params, id=_case_id(feature, params))
+    for feature in load_rolling_feature_functions() for params in ROLLING_PARAMS.get(feature, [{}])
+]
+
+# Test that every rolling kernel matches the per-window calculation on ill-conditioned series
+@pytest.mark.parametrize("feature, params", ROLLING_CASES)
+@pytest.mark.parametrize("series", list(ROLLING_SERIES))
+@pytest.mark.parametrize("stride", [1, 7])
+def test_rolling_kernels_match_windows(feature, params, series, stride, capsys):
+    data = ROLLING_SERIES[series]
+    windows = sliding_window_view(data, 20)[::stride]
+    if np.isnan(data).any():
+        # Series with NaN values never reach the rolling kernels, the extractor falls back to other paths
+        with pytest.raises(ValueError, match="Data contains NaN values."):
+            RollingMoments(data, window_size=20, stride=stride)
+        extractor = FeatureExtractor(features=[feature], feature_params={feature: params}, window_size=20, stride=stride)
+        result = extractor.extract_features(pd.DataFrame({"value": data})).iloc[:, 0].to_numpy()
+    else:
+        result = load_rolling_feature_functions()[feature](RollingMoments(data, window_size=20, stride=stride), **params)
+
+    calculate = load_feature_functions()[feature]
+    allow_nan = load_validation_requirements().get(feature, {}).get("allow_nan", False)
+    assert len(result) == len(windows)
+    for window, value in zip(windows, result):
+        expected = calculate(window, **params) if allow_nan or not np.isnan(window).any() else np.nan
+        assert value == pytest.approx(expected, rel=1e-7, abs=1e-9, nan_ok=True), window
+
+# Test that the fitted training statistics give the same results as the training data on every path
+@pytest.mark.parametrize("feature", list(load_reference_statistics_functions()))
+def test_reference_statistics_match_training_data(feature):
+    rng = np.random.default_rng(2)
+    training_data = np.r_[rng.normal(size=50), np.zeros(10), 4.0]
+    statistics = load_reference_statistics_functions()[feature](training_data)
+    calculate = load_feature_functions()[feature]
+    windows = _windows()
+    windows = windows[~np.isnan(windows).any(axis=1)]
+    # Windows holding the training data itself hit the fitted bounds exactly
+    windows = np.vstack([windows, sliding_window_view(training_data, windows.shape[1])])
+    expected = [calculate(window, training_data=training_data) for window in windows]
+
+    assert [calculate(window, **statistics) for window in windows] == expected
+    np.testing.assert_array_equal(load_batch_feature_functions()[feature](windows, **statistics), expected)
+
+    data = ROLLING_SERIES["level_shift"]
+    expected = [calculate(window, training_data=training_data) for window in sliding_window_view(data, 20)]
+    result = load_rolling_feature_functions()[feature](RollingMoments(data, window_size=20), **statistics)
+    np.testing.assert_array_equal(result, expected)
+    state = load_incremental_feature_states()[feature](20, **statistics)
+    streamed = []
+    for position, value in enumerate(data):
+        state.update(value, data[position - 20] if position >= 20 else None)
+        if position >= 19:
+            streamed.append(state.value())
+    np.testing.assert_array_equal(streamed, expected)
@@ -0,0 +1,34 @@
+import pytest
+import pandas as pd
+import numpy as np
+from interpreTS.utils.file_chunks import read_chunks, ChunkWriter
+
+# Test that chunks of Parquet and CSV files are read in order across files
+@pytest.mark.parametrize("extension", [".parquet", ".csv"])
+def test_read_chunks(tmp_path, extension):
+    data = pd.DataFrame({"id": np.repeat([1, 2], 10), "value": np.arange(20.0)})
+    paths = [tmp_path / f"first{extension}", tmp_path / f"second{extension}"]
+    for path, part in zip(paths, [data.iloc[:12], data.iloc[12:]]):
+        part.to_parquet(path, row_group_size=5) if extension == ".parquet" else part.to_csv(path, index=False)
+
+    chunks = list(read_chunks(paths, columns=["value"], chunk_size=5))
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data[["value"]])
+
+# Test that the chunk writer appends chunks to Parquet and CSV files
+@pytest.mark.parametrize("extension", [".parquet", ".csv"])
+def test_chunk_writer(tmp_path, extension):
+    path = tmp_path / f"output{extension}"
+    with ChunkWriter(path) as writer:
+        writer.write(pd.DataFrame({"mean_value": [1.0, 2.0], "id": [1, 1]}))
+        writer.write(pd.DataFrame({"mean_value": [np.nan], "id": [2]}))
+    result = pd.read_parquet(path) if extension == ".parquet" else pd.read_csv(path)
+    assert result["id"].tolist() == [1, 1, 2]
+    assert result["mean_value"].tolist()[:2] == [1.0, 2.0] and np.isnan(result["mean_value"].iloc[2])
+
+# Test that unsupported file formats are rejected
+def test_chunk_files_unsupported_format(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        list(read_chunks(tmp_path / "data.json"))
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        ChunkWriter(tmp_path / "output.json")
@@ -0,0 +1,125 @@
+import pytest
+import numpy as np
+import pandas as pd
+from interpreTS.utils.incremental import StreamingMoments, SlidingExtremum, IncrementalFraction
+from interpreTS.utils.data_manager import load_feature_functions, load_incremental_feature_states
+from interpreTS.utils.feature_loader import Features
+
+# Parameters of the features whose incremental state needs more than the window size
+INCREMENTAL_PARAMS = {
+    Features.VARIANCE: {"ddof": 1},
+    Features.CROSSING_POINTS: {"output": "count"},
+    Features.ABOVE_9TH_DECILE: {"training_data": np.arange(1, 11)},
+    Features.BELOW_1ST_DECILE: {"training_data": np.arange(1, 11)},
+    Features.OUTLIERS_STD: {"training_data": np.arange(1, 10)},
+    Features.OUTLIERS_IQR: {"training_data": np.array([10, 12, 14, 15, 16, 18, 19])},
+}
+
+_rng = np.random.default_rng(0)
+ADVERSARIAL_SERIES = {
+    "noise": 5 + 3 * _rng.normal(size=40),
+    "flat": np.r_[np.full(12, 3.0), [3.0, 4.0], np.full(12, 4.0), 1 + _rng.integers(0, 3, 12)],
+    "level_shift": np.r_[_rng.normal(size=20), 1e6 + _rng.normal(size=20), 1e3 + _rng.normal(size=20)],
+    "constant_after_shift": np.r_[_rng.normal(size=15), np.full(20, 1e6), np.full(20, 1e4), _rng.normal(size=5)],
+    "nan_runs": np.r_[_rng.normal(size=8), np.full(3, np.nan), _rng.normal(size=6), np.full(8, np.nan), 1e6 + _rng.normal(size=10)],
+}
+
+def _stream(update, data, window_size):
+    """
+    Feed a series to an update function with the evicted values, yielding each full window.
+    """
+    for i, value in enumerate(data):
+        update(value, data[i - window_size] if i >= window_size else None)
+        if i >= window_size - 1:
+            yield data[i - window_size + 1:i + 1]
+
+# Test that streaming moments match the moments of each window
+def test_streaming_moments_match_windows():
+    data = np.array([1e6 + 1, 1e6 + 4, 1e6 + 2, 1e6 + 8, 1e6 + 5, 1e6 + 7, 1e6 + 3, 1e6 + 6])
+    moments = StreamingMoments()
+    for window in _stream(moments.update, data, 4):
+        centered = window - window.mean()
+        assert moments.mean == pytest.approx(window.mean())
+        assert moments.m2 == pytest.approx(np.sum(centered ** 2), rel=1e-6)
+        assert moments.m3 == pytest.approx(np.sum(centered ** 3), rel=1e-6, abs=1e-6)
+        assert moments.sum_squares == pytest.approx(np.sum(window ** 2))
+
+# Test that NaN values are left out of the streaming moments
+def test_streaming_moments_skip_nan():
+    data = np.array([1.0, np.nan, 3.0, 5.0, np.nan, 9.0])
+    moments = StreamingMoments()
+    for window in _stream(moments.update, data, 3):
+        assert moments.count == np.count_nonzero(~np.isnan(window))
+        assert moments.mean == pytest.approx(np.nanmean(window))
+
+# Test that constant windows have exactly zero central moments
+def test_streaming_moments_constant():
+    data = np.array([0.1, 0.7, 0.3, 0.3, 0.3, 0.3, 0.9])
+    moments = StreamingMoments()
+    constant = [moments.constant for _ in _stream(moments.update, data, 3)]
+    assert constant == [False, False, True, True, False]
+
+    moments.reset(np.array([0.3, 0.3, 0.3]))
+    assert moments.constant and moments.m2 == 0.0 and moments.m3 == 0.0
+
+# Test that the moments report lost accuracy once a level shift has left the window
+def test_streaming_moments_stale():
+    data = np.array([1e6, 1e6 + 1, 1e6 + 3, 1.0, 2.0, 4.0])
+    moments = StreamingMoments()
+    stale = [moments.stale for _ in _stream(moments.update, data, 3)]
+    assert stale == [False, False, False, True]
+
+    moments.reset(data[-3:])
+    assert not moments.stale and moments.m2 == pytest.approx(14 / 3)
+
+# Test that a reset rebuilds the same moments as the running updates
+def test_streaming_moments_reset():
+    data = np.array([2.0, 7.0, 1.0, 8.0, 2.0, 8.0])
+    moments = StreamingMoments()
+    for window in _stream(moments.update, data, 4):
+        pass
+    expected = (moments.mean, moments.m2, moments.sum_squares)
+    moments.reset(window)
+    assert (moments.mean, moments.m2, moments.sum_squares) == pytest.approx(expected)
+
+# Test that the sliding extremum tracks the maximum and minimum of each window
+@pytest.mark.parametrize("maximum", [True, False])
+def test_sliding_extremum_matches_windows(maximum):
+    data = np.array([3.0, 1.0, np.nan, 1.0, 5.0, 9.0, 2.0, np.nan, np.nan, np.nan, 5.0, 3.0])
+    extremum = SlidingExtremum(3, maximum=maximum)
+    for window in _stream(lambda new, evicted: extremum.update(new), data, 3):
+        valid = window[~np.isnan(window)]
+        expected = (valid.max() if maximum else valid.min()) if len(valid) > 0 else np.nan
+        assert extremum.value == pytest.approx(expected, nan_ok=True)
+
+# Test that a fraction counts the matching values entering and leaving the window
+def test_incremental_fraction():
+    class Positive(IncrementalFraction):
+        def _matches(self, value):
+            return value > 0
+
+    state = Positive(window_size=4)
+    data = np.array([1.0, -1.0, 2.0, 3.0, -4.0, -5.0])
+    for window in _stream(state.update, data, 4):
+        assert state.value() == np.mean(window > 0)
+
+    state.reset(np.array([1.0, 2.0, -3.0, 4.0]))
+    assert state.value() == 0.75
+
+# Test that every incremental state matches the per-window calculation over adversarial streams
+@pytest.mark.parametrize("feature", list(load_incremental_feature_states()))
+@pytest.mark.parametrize("series", list(ADVERSARIAL_SERIES))
+def test_incremental_states_match_windows(feature, series, capsys):
+    data = ADVERSARIAL_SERIES[series]
+    params = INCREMENTAL_PARAMS.get(feature, {})
+    state = load_incremental_feature_states()[feature](5, **params)
+    calculate = load_feature_functions()[feature]
+    for window in _stream(state.update, data, 5):
+        # Streaming engines rebuild states that have lost accuracy from the window
+        if state.stale:
+            state.reset(window)
+        # Windows with NaN values are calculated from the window unless the state handles them
+        if np.isnan(window).any() and not state.handles_nan:
+            continue
+        expected = calculate(pd.Series(window), **params)
+        assert state.value() == pytest.approx(expected, rel=1e-6, abs=1e-9, nan_ok=True), window
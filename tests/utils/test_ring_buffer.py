@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from interpreTS.utils.ring_buffer import RingBuffer
+
+# Test that the view holds the most recent values, oldest first
+def test_ring_buffer_view():
+    buffer = RingBuffer(3)
+    for value in [1.0, 2.0]:
+        buffer.append(value)
+    np.testing.assert_array_equal(buffer.view(), [1.0, 2.0])
+    assert not buffer.is_full
+    for value in [3.0, 4.0, 5.0]:
+        buffer.append(value)
+    np.testing.assert_array_equal(buffer.view(), [3.0, 4.0, 5.0])
+    assert len(buffer) == 3
+
+# Test that appending returns the evicted value once the buffer is full
+def test_ring_buffer_evicted():
+    buffer = RingBuffer(2)
+    assert buffer.append(1.0) is None
+    assert buffer.append(2.0) is None
+    assert buffer.append(3.0) == 1.0
+
+# Test that the view is a read-only view of the buffer without copying
+def test_ring_buffer_zero_copy():
+    buffer = RingBuffer(4)
+    for value in range(6):
+        buffer.append(value)
+    window = buffer.view()
+    assert np.shares_memory(window, buffer._data)
+    with pytest.raises(ValueError):
+        window[0] = 10.0
+
+# Test that an invalid capacity is rejected
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError, match="Capacity must be a positive integer."):
+        RingBuffer(0)
+
+# Test that extending the buffer matches appending the values one by one
+@pytest.mark.parametrize("sizes", [[2, 1, 3], [5], [1, 7, 2]])
+def test_ring_buffer_extend(sizes):
+    extended, appended = RingBuffer(4), RingBuffer(4)
+    values = np.arange(sum(sizes), dtype=float)
+    start = 0
+    for size in sizes:
+        extended.extend(values[start:start + size])
+        for value in values[start:start + size]:
+            appended.append(value)
+        start += size
+        np.testing.assert_array_equal(extended.view(), appended.view())
+        assert extended.is_full == appended.is_full
@@ -0,0 +1,127 @@
+import pytest
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from interpreTS.utils.rolling_moments import RollingMoments
+from interpreTS.utils.data_manager import load_batch_feature_functions, load_rolling_feature_functions
+from interpreTS.utils.feature_loader import Features
+
+def _adversarial_series():
+    """
+    Series with level shifts, flat segments and flat segments right after a level shift.
+    """
+    rng = np.random.default_rng(7)
+    return np.r_[
+        rng.normal(size=3000), 1e6 + rng.normal(size=3000),
+        np.full(3000, 1e4), np.full(3000, 1e3), 1e3 + rng.normal(size=2000), np.full(1000, 5.0)
+    ]
+
+# Test that rolling mean and central moments match direct computation
+def test_rolling_moments_match_direct():
+    data = np.random.default_rng(0).normal(10, 2, 500)
+    windows = sliding_window_view(data, 20)
+    moments = RollingMoments(data, window_size=20, anchor_every=64)
+    deviations = windows - windows.mean(axis=1, keepdims=True)
+    np.testing.assert_allclose(moments.mean, windows.mean(axis=1))
+    np.testing.assert_allclose(moments.m2, (deviations ** 2).sum(axis=1))
+    np.testing.assert_allclose(moments.m3, (deviations ** 3).sum(axis=1), atol=1e-9)
+    np.testing.assert_allclose(moments.sum_squares, (windows ** 2).sum(axis=1))
+
+# Test numerical stability for a large offset with a small variance
+def test_rolling_moments_large_offset():
+    data = 1e9 + np.random.default_rng(1).normal(0, 1e-3, 10000)
+    windows = sliding_window_view(data, 50)
+    moments = RollingMoments(data, window_size=50)
+    np.testing.assert_allclose(moments.m2 / 50, windows.var(axis=1), rtol=1e-6)
+
+# Test that the stride is applied to the rolling results
+def test_rolling_moments_stride():
+    data = np.arange(10, dtype=float)
+    moments = RollingMoments(data, window_size=3, stride=2)
+    np.testing.assert_allclose(moments.mean, [1, 3, 5, 7])
+    np.testing.assert_array_equal(moments.rolling_count(data > 4), [0, 0, 2, 3])
+
+# Test that series with NaN values are rejected
+def test_rolling_moments_nan():
+    with pytest.raises(ValueError, match="Data contains NaN values."):
+        RollingMoments(np.array([1.0, np.nan, 3.0]), window_size=2)
+
+# Test that the co-moment with the sample positions matches direct computation
+def test_rolling_moments_index_moment():
+    data = np.random.default_rng(2).normal(5, 1, 300)
+    windows = sliding_window_view(data, 12)[::2]
+    positions = np.arange(12) - 5.5
+    moments = RollingMoments(data, window_size=12, stride=2, anchor_every=32)
+    np.testing.assert_allclose(moments.index_moment, (windows - windows.mean(axis=1, keepdims=True)) @ positions, atol=1e-9)
+
+# Test that the rolling autocovariances match direct computation
+def test_rolling_moments_autocovariance():
+    data = 1e4 + np.cumsum(np.random.default_rng(3).normal(size=300))
+    windows = sliding_window_view(data, 25)[::3]
+    deviations = windows - windows.mean(axis=1, keepdims=True)
+    expected = np.stack([(deviations[:, :25 - lag] * deviations[:, lag:]).sum(axis=1) for lag in range(6)], axis=1)
+    moments = RollingMoments(data, window_size=25, stride=3, anchor_every=40)
+    np.testing.assert_allclose(moments.autocovariance(5), expected, rtol=1e-7, atol=1e-6)
+
+# Test that the rolling autocovariances stay accurate across level shifts and flat segments
+def test_rolling_moments_autocovariance_level_shift():
+    data = _adversarial_series()
+    windows = sliding_window_view(data, 40)
+    deviations = windows - windows.mean(axis=1, keepdims=True)
+    expected = np.stack([(deviations[:, :40 - lag] * deviations[:, lag:]).sum(axis=1) for lag in range(13)], axis=1)
+    result = RollingMoments(data, window_size=40).autocovariance(12)
+    scale = np.maximum(expected[:, :1], 1e-300)
+    np.testing.assert_allclose(result / scale, expected / scale, atol=1e-9)
+    np.testing.assert_array_equal(result[expected[:, 0] == 0], 0.0)
+
+# Test that constant windows are detected exactly
+def test_rolling_moments_constant():
+    moments = RollingMoments(np.array([1.0, 1.0, 1.0, 2.0, 2.0, 2.0]), window_size=3)
+    np.testing.assert_array_equal(moments.constant, [True, False, False, True])
+
+# Test that the moments stay accurate across level shifts at the default anchoring
+def test_rolling_moments_level_shift():
+    rng = np.random.default_rng(4)
+    data = np.r_[rng.normal(size=3000), 1e6 + rng.normal(size=3000), 1e3 + rng.normal(size=3000)]
+    windows = sliding_window_view(data, 40)
+    deviations = windows - windows.mean(axis=1, keepdims=True)
+    moments = RollingMoments(data, window_size=40)
+    np.testing.assert_allclose(moments.mean, windows.mean(axis=1), rtol=1e-14, atol=1e-12)
+    np.testing.assert_allclose(moments.m2, (deviations ** 2).sum(axis=1), rtol=1e-9)
+    # The third moment and the co-moment are compared relative to the spread of each window
+    np.testing.assert_allclose(moments.m3 / moments.m2 ** 1.5, (deviations ** 3).sum(axis=1) / moments.m2 ** 1.5, atol=1e-9)
+    np.testing.assert_allclose(moments.index_moment / moments.m2 ** 0.5, deviations @ (np.arange(40) - 19.5) / moments.m2 ** 0.5, atol=1e-9)
+
+# Test that flat segments yield exactly zero moments, also right after a level shift
+def test_rolling_moments_flat_segments():
+    data = np.r_[np.full(3000, 1e4), np.full(3000, 1e3), np.random.default_rng(5).normal(size=100), np.full(3000, 5.0)]
+    windows = sliding_window_view(data, 40)
+    moments = RollingMoments(data, window_size=40)
+    flat = np.all(windows == windows[:, :1], axis=1)
+    np.testing.assert_array_equal(moments.constant, flat)
+    np.testing.assert_array_equal(moments.m2[flat], 0.0)
+    np.testing.assert_array_equal(moments.m3[flat], 0.0)
+    np.testing.assert_array_equal(moments.mean[flat], windows[flat, 0])
+
+# Test that the moments of a window do not depend on the stride or on where the series starts
+def test_rolling_moments_alignment():
+    rng = np.random.default_rng(6)
+    data = np.r_[rng.normal(size=500), 1e6 + rng.normal(size=500)]
+    moments = RollingMoments(data, window_size=30)
+    for stride, offset in [(7, 0), (1, 13), (5, 101)]:
+        shifted = RollingMoments(data[offset:], window_size=30, stride=stride)
+        np.testing.assert_allclose(shifted.m2, moments.m2[offset::stride], rtol=1e-12)
+        np.testing.assert_allclose(shifted.m3 / shifted.m2 ** 1.5, moments.m3[offset::stride] / shifted.m2 ** 1.5, atol=1e-12)
+
+# Test that the rolling kernels match the batch kernels on level shifts and flat segments
+@pytest.mark.parametrize("feature", [
+    Features.VARIANCE, Features.HETEROGENEITY, Features.SPIKENESS, Features.STABILITY, Features.SEASONALITY_STRENGTH,
+    Features.TREND_STRENGTH, Features.LINEARITY
+])
+@pytest.mark.parametrize("stride", [1, 7])
+def test_rolling_kernels_adversarial(feature, stride):
+    data = _adversarial_series()
+    expected = load_batch_feature_functions()[feature](sliding_window_view(data, 40)[::stride])
+    result = load_rolling_feature_functions()[feature](RollingMoments(data, window_size=40, stride=stride))
+    flat = np.all(sliding_window_view(data, 40)[::stride] == data[:len(data) - 39:stride, None], axis=1)
+    np.testing.assert_allclose(result, expected, rtol=1e-7, atol=1e-9)
+    np.testing.assert_array_equal(result[flat], expected[flat])
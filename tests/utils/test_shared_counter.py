@@ -0,0 +1,24 @@
+import os
+import pickle
+from joblib import Parallel, delayed
+from interpreTS.utils.shared_counter import SharedCounter
+
+def _count(slot, steps):
+    for _ in range(steps):
+        slot.add(1)
+    return steps
+
+# Test that counter slots updated in worker processes add up in the parent
+def test_shared_counter_workers():
+    with SharedCounter(3) as counter:
+        Parallel(n_jobs=2)(delayed(_count)(counter.slot(index), steps) for index, steps in enumerate([5, 7, 11]))
+        assert counter.total() == 23
+    assert not os.path.exists(counter.path)
+
+# Test that a pickled slot reopens the shared counters
+def test_shared_counter_slot_pickle():
+    with SharedCounter(2) as counter:
+        slot = counter.slot(1)
+        slot.add(2)
+        pickle.loads(pickle.dumps(slot)).add(3)
+        assert counter.total() == 5
@@ -1,11 +1,16 @@
+import threading
+import time
 import pytest
+from types import SimpleNamespace
+from collections import deque
 import pandas as pd
 import numpy as np
 import dask.dataframe as dd
 from unittest.mock import MagicMock, patch
 from interpreTS.utils.data_validation import validate_time_series_data
 from interpreTS.utils.feature_loader import FeatureLoader
-from interpreTS.utils.task_manager import TaskManager
+from joblib import delayed
+from interpreTS.utils.task_manager import TaskManager, _take_windows
 
 # Fixture for initializing TaskManager with mock feature functions and validation requirements
 @pytest.fixture
@@ -70,22 +75,33 @@ def test_validate_parameters_invalid_feature(mock_feature_loader):
 
 # Test execution of feature extraction using Dask
 def test_execute_dask(task_manager):
-    pandas_data = pd.DataFrame({"value": [1, 2, 3, 4, 5]})
-    dask_data = dd.from_pandas(pandas_data, npartitions=1)
-    grouped_data = [(None, pandas_data)]
-    feature_columns = ["value"]
+    grouped_data = [(None, pd.DataFrame({"value": [1, 2, 3, 4, 5]}))]
+    result = task_manager._execute_dask(grouped_data, ["value"])
+    assert result["mock_feature_value"].tolist() == [6, 9, 12]
+
+# Test that Dask partitions keep the windows spanning their boundaries, across groups
+def test_execute_dask_partition_boundaries(task_manager, monkeypatch):
+    monkeypatch.setattr("interpreTS.utils.task_manager.DASK_PARTITION_ROWS", 4)
+    grouped_data = [(i, pd.DataFrame({"value": np.arange(i * 100, i * 100 + 5 + 3 * i)})) for i in range(4)]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+    expected = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
 
-    with patch("dask.dataframe.DataFrame.map_partitions", return_value=dask_data):
-        with patch("dask.dataframe.concat", return_value=dask_data):
-            result = task_manager._execute_dask(grouped_data, feature_columns)
+    result = task_manager._execute_dask(grouped_data, ["value"], lazy=True)
+    assert isinstance(result, dd.DataFrame)
+    assert result.npartitions > 1 and result.known_divisions
+    pd.testing.assert_frame_equal(result.compute(), expected, check_dtype=False)
 
-    assert result.equals(pandas_data)
+# Test Dask execution on a local distributed cluster
+def test_execute_dask_distributed(task_manager):
+    distributed = pytest.importorskip("distributed")
+    grouped_data = [(i, pd.DataFrame({"value": np.arange(i * 10, i * 10 + 6)})) for i in range(3)]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+    expected = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
 
-# Test processing a single partition for feature extraction
-def test_process_partition(task_manager):
-    data = pd.DataFrame({"value": [1, 2, 3, 4, 5]})
-    result = task_manager._process_partition(data, ["value"], 3, 1)
-    assert isinstance(result, pd.DataFrame)
+    with distributed.LocalCluster(n_workers=2, threads_per_worker=1, processes=True, dashboard_address=None) as cluster:
+        with distributed.Client(cluster):
+            result = task_manager._execute_dask(grouped_data, ["value"], lazy=True).compute()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
 
 # Test generation of tasks for feature extraction based on input data
 def test_generate_tasks(task_manager):
@@ -106,6 +122,68 @@ def test_execute_parallel(task_manager):
         assert isinstance(result, list)
         assert len(result) == len(tasks)
 
+# Test that chunked parallel execution matches sequential execution across groups
+@pytest.mark.parametrize("chunk_size", [None, 1, 4, 100])
+def test_execute_parallel_chunks(task_manager, chunk_size):
+    task_manager.batch_feature_functions = {"mock_feature": lambda windows: windows.sum(axis=1)}
+    grouped_data = [(i, pd.DataFrame({"value": np.arange(i * 10, i * 10 + 3 + i, dtype=float)})) for i in range(5)]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+    expected = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
+
+    progress = []
+    result = task_manager._execute_parallel(tasks, n_jobs=2, progress_callback=progress.append, total_steps=len(tasks), chunk_size=chunk_size)
+    pd.testing.assert_frame_equal(result, expected)
+    assert progress[-1] == 100 and progress == sorted(progress)
+
+# Test that progress is reported from the workers while a chunk is processed
+def test_execute_parallel_progress(task_manager):
+    task_manager.feature_functions = {"mock_feature": lambda x: time.sleep(0.05) or np.sum(x)}
+    tasks = [(pd.DataFrame({"value": [i, i + 1, i + 2]}), ["value"]) for i in range(12)]
+    progress = []
+    result = task_manager._execute_parallel(tasks, n_jobs=2, progress_callback=progress.append, total_steps=len(tasks), chunk_size=6)
+    assert [features["mock_feature_value"] for features in result] == [3 * i + 3 for i in range(12)]
+    assert any(0 < value < 100 for value in progress)
+    assert progress[-1] == 100 and progress == sorted(progress)
+
+class _FinishedThread(threading.Thread):
+    """
+    A thread that has already finished when `start` returns.
+    """
+
+    def start(self):
+        super().start()
+        self.join()
+
+# Test that the final progress is reported once, also when the tasks finish before the first poll
+def test_run_parallel_progress_finished(task_manager):
+    progress = []
+    with patch("interpreTS.utils.task_manager.threading", SimpleNamespace(Thread=_FinishedThread)):
+        task_manager._run_parallel(
+            lambda slot: (delayed(slot(index).add)(3) for index in range(2)),
+            2, n_jobs=1, progress_callback=progress.append, total_steps=10, completed_steps=4
+        )
+    assert progress == [100]
+
+# Test that window chunks take about the requested number of windows across groups
+def test_take_windows():
+    ranges = deque([("a", 0, 3), ("b", 0, 4)])
+    assert _take_windows(ranges, 5) == [("a", 0, 3), ("b", 0, 2)]
+    assert _take_windows(ranges, 5) == [("b", 2, 4)]
+    assert not ranges
+
+# Test that the shared-memory execution writes numeric features in place and returns the others
+def test_execute_shared_memory(task_manager):
+    task_manager.feature_functions = {"mock_feature": lambda x: np.sum(x) if np.asarray(x)[0] != 20 else list(x)}
+    grouped_data = [
+        (1, pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0]})),
+        (2, pd.DataFrame({"value": [20.0, 21.0, 22.0]})),
+        (3, pd.DataFrame({"value": list("abc")}))
+    ]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+    result = task_manager._execute_shared_memory(tasks, n_jobs=2, progress_callback=None, total_steps=len(tasks))
+    assert result["mock_feature_value"].tolist()[:3] == [6.0, 9.0, [20.0, 21.0, 22.0]]
+    assert pd.isna(result["mock_feature_value"].iloc[3])
+
 # Test sequential execution of feature extraction tasks
 def test_execute_sequential(task_manager):
     tasks = [
@@ -125,17 +203,6 @@ def test_process_window(task_manager):
     assert "mock_feature_value" in result
     assert result["mock_feature_value"] == 6
 
-# Test processing a single window with progress callback
-def test_process_window_with_progress(task_manager):
-    task = (pd.DataFrame({"value": [1, 2, 3]}), ["value"])
-
-    def mock_progress_callback():
-        pass
-
-    with patch.object(task_manager, "_process_window", return_value={"mock_feature_value": 6}):
-        result = task_manager._process_window_with_progress(task, mock_progress_callback)
-        assert result == {"mock_feature_value": 6}
-
 # Test validation of valid feature data
 def test_validate_feature_data(task_manager):
     data = pd.Series([1, 2, 3])
@@ -165,4 +232,73 @@ def test_convert_stride_to_observation(task_manager):
     task_manager.stride = '5min'
     observations = task_manager._convert_window_to_observations(task_manager.stride, data)
     
-    assert observations == 1
\ No newline at end of file
+    assert observations == 1
+
+# Test processing a window given as a strided array with one row per feature column
+def test_process_window_array(task_manager):
+    window = np.array([[1.0, 2.0, 3.0]])
+    result = task_manager._process_window(window, ["value"])
+    assert result["mock_feature_value"] == 6
+
+# Test that generated window tasks are dispatched to batch kernels when available
+def test_execute_sequential_batch_kernel(task_manager):
+    batch_kernel = MagicMock(side_effect=lambda windows: windows.sum(axis=1))
+    task_manager.batch_feature_functions = {"mock_feature": batch_kernel}
+    grouped_data = [(None, pd.DataFrame({"value": [1, 2, 3, 4, 5]}))]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+
+    result = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
+
+    batch_kernel.assert_called_once()
+    assert result["mock_feature_value"].tolist() == [6, 9, 12]
+
+# Test that windows with NaN values yield NaN in the batch path
+def test_execute_sequential_batch_kernel_nan(task_manager):
+    task_manager.batch_feature_functions = {"mock_feature": lambda windows: windows.sum(axis=1)}
+    grouped_data = [(None, pd.DataFrame({"value": [1, np.nan, 3, 4, 5]}))]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+
+    result = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
+
+    assert result["mock_feature_value"].isna().tolist() == [True, True, False]
+
+# Test that sequential mode reports progress within a group, with the same results as without chunks
+def test_execute_sequential_progress_chunks(task_manager):
+    task_manager.batch_feature_functions = {"mock_feature": lambda windows: windows.sum(axis=1)}
+    grouped_data = [(None, pd.DataFrame({"value": np.arange(12, dtype=float)}))]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+    expected = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
+
+    progress = []
+    with patch("interpreTS.utils.task_manager.SEQUENTIAL_CHUNK_WINDOWS", 2):
+        result = task_manager._execute_sequential(tasks, progress_callback=progress.append, total_steps=len(tasks))
+    pd.testing.assert_frame_equal(result, expected)
+    assert progress == [20, 40, 60, 80, 100]
+
+# Test that overlapping windows use rolling kernels when available
+def test_execute_sequential_rolling_kernel(task_manager):
+    rolling_kernel = MagicMock(side_effect=lambda moments: moments.mean * moments.window_size)
+    task_manager.rolling_feature_functions = {"mock_feature": rolling_kernel}
+    grouped_data = [(None, pd.DataFrame({"value": [1, 2, 3, 4, 5]}))]
+    tasks = task_manager._generate_tasks(grouped_data, ["value"])
+
+    result = task_manager._execute_sequential(tasks, progress_callback=None, total_steps=len(tasks))
+
+    rolling_kernel.assert_called_once()
+    np.testing.assert_allclose(result["mock_feature_value"], [6, 9, 12])
+
+# Test that features declaring dependencies share one window context per column
+def test_process_window_shared_context(task_manager):
+    contexts = []
+    def feature_with_context(data, context=None):
+        contexts.append(context)
+        return context.mean
+    task_manager.feature_functions = {"first": feature_with_context, "second": feature_with_context}
+    task_manager.features = ["first", "second"]
+    task_manager.feature_dependencies = {"first": ["mean"], "second": ["mean"]}
+
+    result = task_manager._process_window(pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]}), ["a", "b"])
+
+    assert result == {"first_a": 2.0, "first_b": 5.0, "second_a": 2.0, "second_b": 5.0}
+    assert contexts[0] is contexts[2] and contexts[1] is contexts[3]
+    assert contexts[0] is not contexts[1]
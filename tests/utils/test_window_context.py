@@ -0,0 +1,39 @@
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from interpreTS.utils.window_context import WindowContext
+
+# Test that moments and differences match their NumPy counterparts
+def test_window_context_moments():
+    data = pd.Series([1.0, 4.0, 2.0, 8.0, 5.0])
+    context = WindowContext(data)
+    assert context.mean == np.mean(data)
+    assert context.variance(ddof=1) == np.var(data, ddof=1)
+    assert context.std(ddof=1) == np.std(data, ddof=1)
+    np.testing.assert_array_equal(context.diff, np.diff(data))
+
+# Test that intermediates are computed only once
+def test_window_context_memoizes():
+    context = WindowContext(np.arange(10.0))
+    with patch("numpy.var", wraps=np.var) as var:
+        context.variance()
+        context.variance()
+        context.std()
+    assert var.call_count == 1
+
+# Test that shorter ACF requests reuse a cached longer ACF
+def test_window_context_acf_prefix():
+    from statsmodels.tsa.stattools import acf
+    data = np.random.default_rng(0).normal(size=30)
+    context = WindowContext(data)
+    long_acf = context.acf(12)
+    np.testing.assert_array_equal(context.acf(5), long_acf[:6])
+    np.testing.assert_allclose(long_acf, acf(data, nlags=12, fft=True))
+    assert list(context._cache["acf"]) == [12]
+
+# Test that a seeded ACF is served without recomputation
+def test_window_context_seed_acf():
+    context = WindowContext(pd.Series([1.0, 3.0, 2.0, 5.0, 4.0]))
+    context.seed_acf(np.array([1.0, 0.5, 0.25]), nlags=2)
+    np.testing.assert_array_equal(context.acf(1), [1.0, 0.5])
@@ -0,0 +1,84 @@
+import pickle
+import pytest
+import pandas as pd
+import numpy as np
+from interpreTS.utils.window_engine import to_window_buffer, sliding_windows, GroupWindows, WindowTasks
+
+# Test that numeric columns are copied into one contiguous float64 buffer
+def test_to_window_buffer_numeric():
+    group = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, np.nan, 1.5]})
+    buffer = to_window_buffer(group, ["a", "b"])
+    assert buffer.dtype == np.float64
+    assert buffer.flags["C_CONTIGUOUS"]
+    assert buffer.shape == (2, 3)
+    np.testing.assert_array_equal(buffer[1], [0.5, np.nan, 1.5])
+
+# Test that non-numeric columns are not converted
+def test_to_window_buffer_non_numeric():
+    group = pd.DataFrame({"a": ["x", "y", "z"]})
+    assert to_window_buffer(group, ["a"]) is None
+
+# Test that sliding windows are views over the buffer with the requested stride
+def test_sliding_windows_stride():
+    buffer = np.arange(10.0)
+    windows = sliding_windows(buffer, window_size=4, stride=3)
+    assert windows.shape == (3, 4)
+    np.testing.assert_array_equal(windows[:, 0], [0, 3, 6])
+    assert np.shares_memory(windows, buffer)
+
+# Test that group windows are zero-copy views with one row per feature column
+def test_group_windows_views():
+    group = pd.DataFrame({"a": np.arange(5), "b": np.arange(5) * 10})
+    group_windows = GroupWindows(group, ["a", "b"], window_size=3, stride=1)
+    assert len(group_windows) == 3
+    window = group_windows[1]
+    assert window.shape == (2, 3)
+    np.testing.assert_array_equal(window[1], [10, 20, 30])
+    assert np.shares_memory(window, group_windows.buffer)
+
+# Test that non-numeric groups fall back to DataFrame slices
+def test_group_windows_frame_fallback():
+    group = pd.DataFrame({"a": list("abcde")})
+    group_windows = GroupWindows(group, ["a"], window_size=2, stride=2)
+    assert not group_windows.is_numeric
+    assert len(group_windows) == 2
+    assert group_windows[1]["a"].tolist() == ["c", "d"]
+
+# Test that window tasks span all groups lazily
+def test_window_tasks_indexing():
+    first = GroupWindows(pd.DataFrame({"a": np.arange(4)}), ["a"], window_size=2, stride=1)
+    second = GroupWindows(pd.DataFrame({"a": np.arange(10, 13)}), ["a"], window_size=2, stride=1)
+    tasks = WindowTasks([first, second])
+    assert len(tasks) == 5
+    window, feature_columns = tasks[3]
+    assert feature_columns == ["a"]
+    np.testing.assert_array_equal(window[0], [10, 11])
+    assert len(list(tasks)) == 5
+    with pytest.raises(IndexError):
+        tasks[5]
+
+# Test that group windows can be built from stacked windows without a rolling path
+def test_group_windows_from_windows():
+    windows = np.arange(12, dtype=float).reshape(1, 4, 3)
+    group_windows = GroupWindows.from_windows(windows, ["a"])
+    assert group_windows.is_numeric
+    assert len(group_windows) == 4
+    np.testing.assert_array_equal(group_windows[2][0], [6.0, 7.0, 8.0])
+
+# Test that a subset of group windows spans only the samples of its windows
+@pytest.mark.parametrize("values", [np.arange(12), list("abcdefghijkl")])
+def test_group_windows_subset(values):
+    group_windows = GroupWindows(pd.DataFrame({"a": values}), ["a"], window_size=4, stride=2)
+    subset = group_windows.subset(1, 4)
+    assert len(subset) == 3
+    for index in range(3):
+        np.testing.assert_array_equal(np.asarray(subset[index]).ravel(), np.asarray(group_windows[index + 1]).ravel())
+    if group_windows.is_numeric:
+        assert subset.buffer.shape == (1, 8)
+
+# Test that pickled group windows hold the buffer rather than a copy of every window
+def test_group_windows_pickle():
+    group_windows = GroupWindows(pd.DataFrame({"a": np.arange(1000.0)}), ["a"], window_size=100, stride=1).subset(0, 10)
+    restored = pickle.loads(pickle.dumps(group_windows))
+    np.testing.assert_array_equal(restored.windows, group_windows.windows)
+    assert len(pickle.dumps(group_windows)) < 2 * group_windows.buffer.nbytes